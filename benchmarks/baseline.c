@@ -24,6 +24,21 @@
 static volatile int running = 1;
 static perf_stats_t stats = {0};
 
+// Tell the parent we are up: write READY to the pipe named by READY_FD
+// (set by scripts/two_machine/dst_machine.py), then close it
+static void signal_ready(void) {
+    const char *env = getenv("READY_FD");
+    if (!env)
+        return;
+
+    int fd = atoi(env);
+    if (fd <= STDERR_FILENO)
+        return;
+    if (write(fd, "READY\n", 6) < 0)
+        fprintf(stderr, "Warning: failed to signal readiness: %s\n", strerror(errno));
+    close(fd);
+}
+
 // Signal handler for graceful shutdown
 void signal_handler(int sig) {
     printf("\nReceived signal %d, shutting down...\n", sig);
@@ -211,6 +226,7 @@ int main(int argc, char *argv[]) {
     }
     
     printf("Packet processing started. Press Ctrl+C to stop.\n");
+    signal_ready();
     
     // Main packet processing loop
     while (running) {
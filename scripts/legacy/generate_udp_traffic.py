@@ -5,23 +5,92 @@ UDP Traffic Generator for eBPF-Test Baseline Testing
 Generates configurable UDP traffic to test packet processing performance
 """
 
+import os
 import socket
 import time
 import argparse
 import sys
 import threading
+from array import array
 from datetime import datetime
 
-def generate_udp_traffic(target_ip, target_port, source_port, packet_size, packets_per_second, duration, payload_pattern="A"):
-    """Generate UDP traffic with specified parameters"""
+# Pacing: gaps longer than SPIN_THRESHOLD_NS are slept through (waking
+# SLEEP_MARGIN_NS early), the remainder is busy-waited for precision
+SPIN_THRESHOLD_NS = 200_000
+SLEEP_MARGIN_NS = 100_000
+
+def _wait_until(deadline_ns):
+    """Wait until time.perf_counter_ns() reaches deadline_ns"""
+    delta_ns = deadline_ns - time.perf_counter_ns()
+    if delta_ns > SPIN_THRESHOLD_NS:
+        time.sleep((delta_ns - SLEEP_MARGIN_NS) / 1e9)
+    while time.perf_counter_ns() < deadline_ns:
+        pass
+
+# Encoded payloads keyed by (packet_size, payload_pattern)
+_payload_cache = {}
+
+def _build_payload(packet_size, payload_pattern):
+    """Return the encoded payload for a size and pattern, building it once"""
+    key = (packet_size, payload_pattern)
+    payload_bytes = _payload_cache.get(key)
+    if payload_bytes is None:
+        payload = (payload_pattern * (packet_size // len(payload_pattern) + 1))[:packet_size]
+        payload_bytes = _payload_cache[key] = payload.encode('ascii')
+    return payload_bytes
+
+def _reporter(counter, start_ns, stop):
+    """Print the sender's progress once per second until stop is set"""
+    while not stop.wait(1.0):
+        packets_sent = counter[0]
+        elapsed = (time.perf_counter_ns() - start_ns) / 1e9
+        actual_rate = packets_sent / elapsed if elapsed > 0 else 0
+        print(f"\rSent: {packets_sent}, Rate: {actual_rate:.1f} pps", end='', flush=True)
+
+# Unpaced sends check the clock once per UNPACED_CLOCK_MASK + 1 packets
+UNPACED_CLOCK_MASK = 0x3F
+
+def _send_paced(sendto, payload, target, delay_ns, start_ns, end_ns, counter):
+    """Send one packet every delay_ns until end_ns, counting into counter[0]"""
+    packets_sent = 0
+    next_send_ns = start_ns
+    while True:
+        now_ns = time.perf_counter_ns()
+        if now_ns >= end_ns:
+            break
+        if now_ns < next_send_ns:
+            _wait_until(next_send_ns)
+        sendto(payload, target)
+        packets_sent += 1
+        counter[0] = packets_sent
+        next_send_ns += delay_ns
+
+def _send_unpaced(sendto, payload, target, delay_ns, start_ns, end_ns, counter):
+    """Send back-to-back until end_ns, counting into counter[0]"""
+    packets_sent = 0
+    while time.perf_counter_ns() < end_ns:
+        sendto(payload, target)
+        packets_sent += 1
+        counter[0] = packets_sent
+        # Between clock checks there is nothing but the send
+        while packets_sent & UNPACED_CLOCK_MASK:
+            sendto(payload, target)
+            packets_sent += 1
+            counter[0] = packets_sent
+
+def generate_udp_traffic(target_ip, target_port, source_port, packet_size, packets_per_second, duration, payload_pattern="A", payload=None):
+    """Generate UDP traffic with specified parameters
+
+    payload, when given, is a prebuilt buffer (e.g. a memoryview shared
+    across flows) used instead of building one from payload_pattern.
+    """
     
     # Create UDP socket
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     sock.bind(('', source_port))
     
     # Create payload
-    payload = (payload_pattern * (packet_size // len(payload_pattern) + 1))[:packet_size]
-    payload_bytes = payload.encode('ascii')
+    payload_bytes = payload if payload is not None else _build_payload(packet_size, payload_pattern)
     
     print(f"Generating UDP traffic:")
     print(f"  Target: {target_ip}:{target_port}")
@@ -31,31 +100,34 @@ def generate_udp_traffic(target_ip, target_port, source_port, packet_size, packe
     print(f"  Duration: {duration} seconds")
     print(f"  Total packets: {packets_per_second * duration}")
     
-    start_time = time.time()
-    packets_sent = 0
+    # Departure-time pacing: packet N leaves at start + N * delay, so sleep
+    # overshoot is absorbed instead of accumulating as drift. All times are
+    # integer nanoseconds. Unlimited rate gets its own loop with no pacing.
+    delay_ns = round(1e9 / packets_per_second) if packets_per_second > 0 else 0
+    send_loop = _send_paced if delay_ns else _send_unpaced
+    start_ns = time.perf_counter_ns()
+    end_ns = start_ns + duration * 1_000_000_000
+    
+    # Progress is printed by a reporter thread so the send loop does no I/O
+    counter = array('Q', [0])
+    stop_reporting = threading.Event()
+    reporter = threading.Thread(target=_reporter, args=(counter, start_ns, stop_reporting), daemon=True)
+    reporter.start()
+    
+    # Hoist the destination tuple and bound send method out of the loop
+    target = (target_ip, target_port)
     
     try:
-        while time.time() - start_time < duration:
-            # Send packet
-            sock.sendto(payload_bytes, (target_ip, target_port))
-            packets_sent += 1
-            
-            # Rate limiting
-            if packets_per_second > 0:
-                time.sleep(1.0 / packets_per_second)
-            
-            # Progress update every 1000 packets
-            if packets_sent % 1000 == 0:
-                elapsed = time.time() - start_time
-                actual_rate = packets_sent / elapsed if elapsed > 0 else 0
-                print(f"\rSent: {packets_sent}, Rate: {actual_rate:.1f} pps", end='', flush=True)
-                
+        send_loop(sock.sendto, payload_bytes, target, delay_ns, start_ns, end_ns, counter)
     except KeyboardInterrupt:
         print("\nTraffic generation interrupted by user")
     finally:
+        stop_reporting.set()
+        reporter.join()
         sock.close()
-        
-    elapsed = time.time() - start_time
+    
+    packets_sent = counter[0]
+    elapsed = (time.perf_counter_ns() - start_ns) / 1e9
     actual_rate = packets_sent / elapsed if elapsed > 0 else 0
     
     print(f"\n\nTraffic generation complete:")
@@ -63,29 +135,72 @@ def generate_udp_traffic(target_ip, target_port, source_port, packet_size, packe
     print(f"  Duration: {elapsed:.2f} seconds") 
     print(f"  Actual rate: {actual_rate:.2f} packets/sec")
 
-def run_multiple_flows(flows, duration):
-    """Run multiple concurrent UDP flows"""
+def _run_flow_process(index, target_ip, ports, src_ports, packet_size, rate, duration, payload):
+    """Fork a child process sending one flow; returns the child's pid"""
+    # Flush so buffered output is not duplicated into the child
+    sys.stdout.flush()
+    pid = os.fork()
+    if pid:
+        return pid
     
-    print(f"Starting {len(flows)} concurrent UDP flows for {duration} seconds...")
+    status = 0
+    try:
+        generate_udp_traffic(target_ip, ports[index], src_ports[index],
+                             packet_size, rate, duration, payload=payload)
+    except BaseException as e:
+        print(f"Flow {index} failed: {e}")
+        status = 1
+    finally:
+        sys.stdout.flush()
+        os._exit(status)
+
+def run_multiple_flows(target_ip, ports, src_ports, packet_size, rate, duration):
+    """Run multiple concurrent UDP flows
+
+    Flow i sends to target_ip:ports[i] from src_ports[i]; every flow shares
+    the same packet size and per-flow rate.
+    """
+    num_flows = len(ports)
     
-    threads = []
+    print(f"Starting {num_flows} concurrent UDP flows for {duration} seconds...")
     
-    for i, flow in enumerate(flows):
-        thread = threading.Thread(
-            target=generate_udp_traffic,
-            args=(flow['ip'], flow['port'], flow['src_port'], 
-                  flow['size'], flow['rate'], duration, f"Flow{i}")
-        )
-        threads.append(thread)
+    # Build every flow's payload up front so senders share it (copy-on-write
+    # after fork) instead of encoding their own
+    payloads = [memoryview(_build_payload(packet_size, f"Flow{i}")) for i in range(num_flows)]
     
-    # Start all threads
     start_time = time.time()
-    for thread in threads:
-        thread.start()
     
-    # Wait for completion
-    for thread in threads:
-        thread.join()
+    if hasattr(os, 'fork'):
+        # One process per flow: each sender gets its own interpreter and
+        # GIL, so flows send in parallel across cores
+        children = [_run_flow_process(i, target_ip, ports, src_ports, packet_size, rate, duration, payloads[i])
+                    for i in range(num_flows)]
+        
+        # Wait for completion; Ctrl-C reaches the children directly
+        while children:
+            try:
+                pid, _ = os.waitpid(children[0], 0)
+                children.remove(pid)
+            except KeyboardInterrupt:
+                continue
+    else:
+        threads = []
+        
+        for i in range(num_flows):
+            thread = threading.Thread(
+                target=generate_udp_traffic,
+                args=(target_ip, ports[i], src_ports[i], 
+                      packet_size, rate, duration, f"Flow{i}", payloads[i])
+            )
+            threads.append(thread)
+        
+        # Start all threads
+        for thread in threads:
+            thread.start()
+        
+        # Wait for completion
+        for thread in threads:
+            thread.join()
         
     elapsed = time.time() - start_time
     print(f"\nAll flows completed in {elapsed:.2f} seconds")
@@ -123,17 +238,12 @@ def main():
     
     try:
         if args.multiple_flows > 1:
-            # Generate multiple flows
-            flows = []
-            for i in range(args.multiple_flows):
-                flows.append({
-                    'ip': args.target_ip,
-                    'port': args.target_port + (i % args.port_range), 
-                    'src_port': args.source_port + i,
-                    'size': args.packet_size,
-                    'rate': args.rate // args.multiple_flows  # Distribute rate across flows
-                })
-            run_multiple_flows(flows, args.duration)
+            # Generate multiple flows: per-flow ports as compact typed arrays,
+            # everything else is shared by all flows
+            ports = array('H', [args.target_port + (i % args.port_range) for i in range(args.multiple_flows)])
+            src_ports = array('H', [args.source_port + i for i in range(args.multiple_flows)])
+            rate = args.rate // args.multiple_flows  # Distribute rate across flows
+            run_multiple_flows(args.target_ip, ports, src_ports, args.packet_size, rate, args.duration)
         else:
             # Single flow
             generate_udp_traffic(
@@ -4,15 +4,410 @@ High-Rate UDP Traffic Generator for eBPF-Test Phase 3
 Designed for sustained high-throughput testing to fairly compare baseline vs XDP performance.
 """
 
+import os
+import math
 import socket
 import time
-import threading
 import argparse
 import sys
 import signal
 import struct
 import random
-from concurrent.futures import ThreadPoolExecutor
+import errno
+import ctypes
+import ctypes.util
+import mmap
+import select
+import itertools
+import threading
+import multiprocessing
+
+# Maximum number of datagrams handed to the kernel per sendmmsg() call
+MMSG_BATCH = 64
+
+# Native send loop built by `make sender-lib`; optional, the pure-Python
+# loops are used when it has not been built
+SENDER_LIB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               '..', '..', 'build', 'libudp_sender.so')
+
+# Packets per native call (at most ~100ms worth); statistics are flushed
+# after each call
+NATIVE_CHUNK = 1000
+NATIVE_CHUNK_SECONDS = 0.1
+
+# Pacing: gaps longer than SPIN_THRESHOLD_NS are slept through (waking
+# SLEEP_MARGIN_NS early), the remainder is busy-waited for precision
+SPIN_THRESHOLD_NS = 200_000
+SLEEP_MARGIN_NS = 100_000
+
+PR_SET_TIMERSLACK = 29
+
+# Worker sockets are non-blocking with a large send buffer (capped by
+# net.core.wmem_max). A full buffer is counted as an error and the worker
+# waits up to BACKPRESSURE_WAIT seconds for room instead of blocking.
+SEND_BUFFER_BYTES = 16 * 1024 * 1024
+BACKPRESSURE_WAIT = 0.001
+
+# Seconds to wait for every worker to finish setup before sending starts
+START_BARRIER_TIMEOUT = 10
+
+# UDP GSO (Linux 4.18+): one sendmsg() carries up to GSO_MAX_SEGMENTS
+# datagrams, segmented by the kernel/NIC. The whole buffer must fit in one
+# maximum-sized UDP payload.
+SOL_UDP = 17
+UDP_SEGMENT = 103
+GSO_MAX_SEGMENTS = 64
+GSO_MAX_BYTES = 65507
+
+# AF_PACKET TX ring (Linux, needs CAP_NET_RAW), used from TX_RING_MIN_PPS up
+TX_RING_MIN_PPS = 50000
+TX_RING_FRAME_SIZE = 2048
+TX_RING_FRAME_NR = 4096
+TX_RING_BLOCK_SIZE = 1 << 16
+TX_RING_FLUSH = 64
+
+SOL_PACKET = 263
+PACKET_VERSION = 10
+PACKET_TX_RING = 13
+TPACKET_V2 = 1
+TP_STATUS_AVAILABLE = 0
+TP_STATUS_SEND_REQUEST = 1
+TP_STATUS_WRONG_FORMAT = 4
+ETH_P_IP = 0x0800
+
+# Frame data starts after the aligned tpacket2_hdr:
+# TPACKET2_HDRLEN - sizeof(struct sockaddr_ll)
+TPACKET2_DATA_OFFSET = 32
+# Ethernet + IPv4 + UDP headers
+FRAME_HEADER_LEN = 14 + 20 + 8
+
+
+class _Iovec(ctypes.Structure):
+    """struct iovec from <sys/uio.h>."""
+    _fields_ = [('iov_base', ctypes.c_void_p),
+                ('iov_len', ctypes.c_size_t)]
+
+
+class _SockaddrIn(ctypes.Structure):
+    """struct sockaddr_in from <netinet/in.h> (port/address in network order)."""
+    _fields_ = [('sin_family', ctypes.c_ushort),
+                ('sin_port', ctypes.c_uint16),
+                ('sin_addr', ctypes.c_uint32),
+                ('sin_zero', ctypes.c_char * 8)]
+
+
+class _Msghdr(ctypes.Structure):
+    """struct msghdr from <sys/socket.h>."""
+    _fields_ = [('msg_name', ctypes.c_void_p),
+                ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_Iovec)),
+                ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p),
+                ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class _Mmsghdr(ctypes.Structure):
+    """struct mmsghdr from <sys/socket.h>."""
+    _fields_ = [('msg_hdr', _Msghdr),
+                ('msg_len', ctypes.c_uint)]
+
+
+def _load_sendmmsg():
+    """Resolve libc sendmmsg(), or None where it is unavailable (non-Linux)."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fn = libc.sendmmsg
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int]
+    fn.restype = ctypes.c_int
+    return fn
+
+
+_sendmmsg = _load_sendmmsg()
+
+
+def _load_sendto():
+    """Resolve libc sendto(), or None where ctypes cannot reach libc."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        fn = libc.sendto
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int,
+                   ctypes.c_void_p, ctypes.c_uint32]
+    fn.restype = ctypes.c_ssize_t
+    return fn
+
+
+_sendto = _load_sendto()
+
+
+def _load_native_sender():
+    """Resolve udp_sender_run() from the native sender library, if built."""
+    if not sys.platform.startswith('linux') or not os.path.exists(SENDER_LIB_PATH):
+        return None
+    try:
+        fn = ctypes.CDLL(SENDER_LIB_PATH).udp_sender_run
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t,
+                   ctypes.c_void_p, ctypes.c_uint32, ctypes.POINTER(ctypes.c_uint32),
+                   ctypes.c_uint64, ctypes.POINTER(ctypes.c_uint64), ctypes.c_uint64,
+                   ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint64)]
+    fn.restype = ctypes.c_uint64
+    return fn
+
+
+_native_send = _load_native_sender()
+
+
+def _reduce_timer_slack():
+    """Drop this process's kernel timer slack to 1ns so short sleeps wake on time."""
+    if not sys.platform.startswith('linux'):
+        return
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        libc.prctl(PR_SET_TIMERSLACK, ctypes.c_ulong(1), 0, 0, 0)
+    except (OSError, AttributeError):
+        pass
+
+
+def _gso_supported():
+    """Whether the running kernel accepts UDP_SEGMENT (Linux 4.18+)."""
+    if not sys.platform.startswith('linux') or not hasattr(socket.socket, 'sendmsg'):
+        return False
+    try:
+        major, minor = (int(part) for part in os.uname().release.split('.')[:2])
+    except ValueError:
+        return False
+    return (major, minor) >= (4, 18)
+
+
+def _open_udp_socket():
+    """Create a non-blocking UDP socket with an enlarged send buffer."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SEND_BUFFER_BYTES)
+    except OSError:
+        pass
+    return sock
+
+
+def _wait_writable(sock):
+    """Wait up to BACKPRESSURE_WAIT for room in sock's send buffer."""
+    select.select([], [sock], [], BACKPRESSURE_WAIT)
+
+
+def _wait_until(deadline_ns):
+    """Wait until time.perf_counter_ns() reaches deadline_ns."""
+    delta_ns = deadline_ns - time.perf_counter_ns()
+    if delta_ns > SPIN_THRESHOLD_NS:
+        time.sleep((delta_ns - SLEEP_MARGIN_NS) / 1e9)
+    while time.perf_counter_ns() < deadline_ns:
+        pass
+
+
+def _make_sockaddr(ip, port):
+    """Build a sockaddr_in for an IPv4 destination."""
+    sa = _SockaddrIn()
+    sa.sin_family = socket.AF_INET
+    sa.sin_port = socket.htons(port)
+    # inet_aton() already yields network order; keep the bytes as-is
+    sa.sin_addr = struct.unpack('=I', socket.inet_aton(ip))[0]
+    return sa
+
+
+class _MmsgBatch:
+    """Preallocated mmsghdr vector sending one payload round-robin over flows."""
+
+    def __init__(self, payload, addrs, batch=MMSG_BATCH):
+        self.batch = batch
+        self.num_flows = len(addrs)
+        # payload is a ctypes char array (the generator's shared buffer),
+        # addrs a _SockaddrIn array
+        self._buf = payload
+        self._iov = _Iovec(ctypes.addressof(payload), len(payload))
+        self._addrs = addrs
+        self._vecs = (_Mmsghdr * batch)()
+        for hdr in self._vecs:
+            hdr.msg_hdr.msg_iov = ctypes.pointer(self._iov)
+            hdr.msg_hdr.msg_iovlen = 1
+            hdr.msg_hdr.msg_namelen = ctypes.sizeof(_SockaddrIn)
+        # When the batch is a multiple of the flow count every call starts at
+        # flow 0, so destinations only need to be filled in once
+        self._aligned = batch % self.num_flows == 0
+        self._fill_names(0)
+
+    def _fill_names(self, flow_index):
+        base = ctypes.addressof(self._addrs)
+        size = ctypes.sizeof(_SockaddrIn)
+        for i, hdr in enumerate(self._vecs):
+            hdr.msg_hdr.msg_name = base + ((flow_index + i) % self.num_flows) * size
+
+    def send(self, fd, count, flow_index):
+        """Send count datagrams starting at flow_index; returns (sent, next_flow_index, errno)."""
+        if not self._aligned:
+            self._fill_names(flow_index)
+        vecs = ctypes.addressof(self._vecs)
+        size = ctypes.sizeof(_Mmsghdr)
+        sent = 0
+        while sent < count:
+            # Resubmit the unsent tail after a partial return
+            rc = _sendmmsg(fd, vecs + sent * size, count - sent, 0)
+            if rc < 0:
+                return sent, (flow_index + sent) % self.num_flows, ctypes.get_errno()
+            sent += rc
+        return sent, (flow_index + sent) % self.num_flows, 0
+
+
+def _ip_checksum(header):
+    """RFC 1071 checksum over an IPv4 header."""
+    total = sum(struct.unpack(f'!{len(header) // 2}H', header))
+    while total >> 16:
+        total = (total & 0xFFFF) + (total >> 16)
+    return ~total & 0xFFFF
+
+
+def _read_mac(interface):
+    """Return the hardware address of interface as bytes."""
+    with open(f'/sys/class/net/{interface}/address') as f:
+        return bytes.fromhex(f.read().strip().replace(':', ''))
+
+
+def _route_for(ip):
+    """Return (interface, next hop IP) from /proc/net/route for ip."""
+    target = struct.unpack('=I', socket.inet_aton(ip))[0]
+    best = None
+    with open('/proc/net/route') as f:
+        next(f)
+        for line in f:
+            fields = line.split()
+            dest, gateway, mask = (int(x, 16) for x in (fields[1], fields[2], fields[7]))
+            if target & mask == dest and (best is None or bin(mask).count('1') > best[0]):
+                best = (bin(mask).count('1'), fields[0], gateway)
+    if best is None:
+        return None
+    next_hop = socket.inet_ntoa(struct.pack('=I', best[2])) if best[2] else ip
+    return best[1], next_hop
+
+
+def _arp_lookup(ip):
+    """Return the MAC address for ip from the kernel ARP cache, or None."""
+    with open('/proc/net/arp') as f:
+        next(f)
+        for line in f:
+            fields = line.split()
+            if fields[0] == ip and fields[3] != '00:00:00:00:00:00':
+                return bytes.fromhex(fields[3].replace(':', ''))
+    return None
+
+
+def _resolve_l2_path(target_ip, base_port):
+    """Resolve (interface, src MAC, dst MAC, src IP) for raw frames to target_ip.
+
+    Returns None when the path cannot be resolved (no route, no ARP entry)
+    or the target is local: loopback drops raw frames addressed to itself.
+    """
+    try:
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            # Connecting picks the source address
+            probe.connect((target_ip, base_port))
+            src_ip = probe.getsockname()[0]
+            if target_ip.startswith('127.') or src_ip == target_ip:
+                return None
+            route = _route_for(target_ip)
+            if route is None:
+                return None
+            interface, next_hop = route
+            dst_mac = _arp_lookup(next_hop)
+            if dst_mac is None:
+                # An empty datagram primes the ARP cache
+                probe.send(b'')
+                time.sleep(0.2)
+                dst_mac = _arp_lookup(next_hop)
+        finally:
+            probe.close()
+        if dst_mac is None:
+            return None
+        return interface, _read_mac(interface), dst_mac, src_ip
+    except (OSError, ValueError, StopIteration):
+        return None
+
+
+def _build_frame(l2_path, target_ip, src_port, dst_port, payload):
+    """Build an Ethernet/IPv4/UDP frame (UDP checksum left as 0)."""
+    _, src_mac, dst_mac, src_ip = l2_path
+    udp = struct.pack('!HHHH', src_port, dst_port, 8 + len(payload), 0)
+    ip = bytearray(struct.pack('!BBHHHBBH4s4s', 0x45, 0, 20 + len(udp) + len(payload),
+                               0, 0x4000, 64, socket.IPPROTO_UDP, 0,
+                               socket.inet_aton(src_ip), socket.inet_aton(target_ip)))
+    struct.pack_into('!H', ip, 10, _ip_checksum(ip))
+    return dst_mac + src_mac + struct.pack('!H', ETH_P_IP) + bytes(ip) + udp + payload
+
+
+class _TxRing:
+    """AF_PACKET TPACKET_V2 transmit ring bound to one interface."""
+
+    def __init__(self, interface):
+        self.sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(ETH_P_IP))
+        try:
+            self.sock.setsockopt(SOL_PACKET, PACKET_VERSION, TPACKET_V2)
+            req = struct.pack('IIII', TX_RING_BLOCK_SIZE,
+                              TX_RING_FRAME_SIZE * TX_RING_FRAME_NR // TX_RING_BLOCK_SIZE,
+                              TX_RING_FRAME_SIZE, TX_RING_FRAME_NR)
+            self.sock.setsockopt(SOL_PACKET, PACKET_TX_RING, req)
+            self.sock.bind((interface, ETH_P_IP))
+            self.ring = mmap.mmap(self.sock.fileno(), TX_RING_FRAME_SIZE * TX_RING_FRAME_NR,
+                                  mmap.MAP_SHARED, mmap.PROT_READ | mmap.PROT_WRITE)
+        except OSError:
+            self.sock.close()
+            raise
+        self.slot = 0
+        self.queued = 0
+
+    def _wait_slot(self, offset):
+        """Block until the frame slot at offset is free for writing."""
+        while struct.unpack_from('I', self.ring, offset)[0] not in (TP_STATUS_AVAILABLE,
+                                                                   TP_STATUS_WRONG_FORMAT):
+            self.flush()
+            select.select([], [self.sock], [], 0.001)
+
+    def put(self, frame):
+        """Queue one frame; kicks the kernel every TX_RING_FLUSH frames."""
+        offset = self.slot * TX_RING_FRAME_SIZE
+        self._wait_slot(offset)
+        data = offset + TPACKET2_DATA_OFFSET
+        self.ring[data:data + len(frame)] = frame
+        # tp_len, then hand the slot to the kernel via tp_status
+        struct.pack_into('I', self.ring, offset + 4, len(frame))
+        struct.pack_into('I', self.ring, offset, TP_STATUS_SEND_REQUEST)
+        self.slot = (self.slot + 1) % TX_RING_FRAME_NR
+        self.queued += 1
+        if self.queued >= TX_RING_FLUSH:
+            self.flush()
+
+    def flush(self):
+        """Ask the kernel to transmit all queued frames."""
+        if self.queued:
+            try:
+                self.sock.send(b'', socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                pass
+            self.queued = 0
+
+    def close(self):
+        self.flush()
+        self.ring.close()
+        self.sock.close()
+
 
 class HighRateTrafficGenerator:
     def __init__(self, target_ip="127.0.0.1", base_port=12345, 
@@ -26,24 +421,68 @@ class HighRateTrafficGenerator:
         self.num_flows = num_flows
         self.num_threads = num_threads
         
-        # Statistics
-        self.packets_sent = 0
-        self.bytes_sent = 0
-        self.errors = 0
+        # Workers are processes; fork lets them inherit the payload and
+        # shared counters without pickling
+        if 'fork' in multiprocessing.get_all_start_methods():
+            self._mp = multiprocessing.get_context('fork')
+        else:
+            self._mp = multiprocessing.get_context()
+        
+        # Statistics, shared with the worker processes: one slot per worker,
+        # written only by its owner, so no lock is needed. Readers sum the
+        # slots. Every packet carries the same payload, so bytes are derived.
+        self._packets = self._mp.RawArray(ctypes.c_uint64, num_threads)
+        self._errors = self._mp.RawArray(ctypes.c_uint64, num_threads)
+        self._running = self._mp.RawValue(ctypes.c_bool, False)
         self.start_time = 0
         self.end_time = 0
-        self.running = False
-        
-        # Thread synchronization
-        self.stats_lock = threading.Lock()
         
-        # Pre-generated payload for performance
+        # Pre-generated payload for performance, placed in shared memory so
+        # workers never duplicate it
         self.payload = self._generate_payload()
+        self._payload_len = len(self.payload)
+        self._shared_payload = self._mp.RawArray(ctypes.c_char, self.payload)
+        
+        # Destinations of every worker's flows, resolved once: worker N owns
+        # entries [N * num_flows, (N + 1) * num_flows)
+        self._flow_addrs = (_SockaddrIn * (num_flows * num_threads))(
+            *[_make_sockaddr(target_ip, base_port + i) for i in range(num_flows * num_threads)])
+        
+        # At very high rates bypass the UDP stack with an AF_PACKET TX ring
+        self._l2_path = None
+        if (target_pps >= TX_RING_MIN_PPS and sys.platform.startswith('linux')
+                and FRAME_HEADER_LEN + self._payload_len <= TX_RING_FRAME_SIZE - TPACKET2_DATA_OFFSET):
+            self._l2_path = _resolve_l2_path(target_ip, base_port)
+        
+        # Datagrams per UDP GSO send; 0 when GSO is unavailable
+        self._gso_segments = 0
+        if _gso_supported() and self.payload:
+            self._gso_segments = min(GSO_MAX_SEGMENTS, GSO_MAX_BYTES // self._payload_len)
         
         # Signal handling
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
     
+    @property
+    def running(self):
+        return self._running.value
+    
+    @running.setter
+    def running(self, value):
+        self._running.value = value
+    
+    @property
+    def packets_sent(self):
+        return sum(self._packets)
+    
+    @property
+    def bytes_sent(self):
+        return sum(self._packets) * self._payload_len
+    
+    @property
+    def errors(self):
+        return sum(self._errors)
+    
     def _signal_handler(self, signum, frame):
         print(f"\nReceived signal {signum}, stopping traffic generation...")
         self.running = False
@@ -61,77 +500,280 @@ class HighRateTrafficGenerator:
         filler = (b"0123456789ABCDEF" * ((remaining // 16) + 1))[:remaining]
         return base_pattern + filler
     
-    def _update_stats(self, packets=0, bytes_sent=0, errors=0):
-        """Thread-safe statistics update."""
-        with self.stats_lock:
-            self.packets_sent += packets
-            self.bytes_sent += bytes_sent
-            self.errors += errors
-    
-    def _worker_thread(self, thread_id, packets_per_thread, delay_between_packets):
-        """Worker thread for packet generation."""
+    def _worker_proc(self, thread_id, packets_per_thread, delay_between_packets, start_barrier):
+        """Worker process for packet generation."""
+        # The parent owns signal handling and stops workers via the shared flag
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        _reduce_timer_slack()
+        
         try:
-            # Create socket for this thread
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            # Create socket for this worker
+            sock = _open_udp_socket()
             
             # Use different source ports for each flow
             flows = []
             for flow_id in range(self.num_flows):
                 port = self.base_port + (thread_id * self.num_flows) + flow_id
                 flows.append((self.target_ip, port))
+            addrs = (_SockaddrIn * self.num_flows).from_buffer(
+                self._flow_addrs, thread_id * self.num_flows * ctypes.sizeof(_SockaddrIn))
             
+            # Raw frames through the TX ring when available (needs CAP_NET_RAW)
+            ring = None
+            if self._l2_path is not None:
+                try:
+                    ring = _TxRing(self._l2_path[0])
+                except OSError as e:
+                    if thread_id == 0:
+                        print(f"TX ring unavailable ({e}), using UDP sockets")
+            
+            # Setup is done; start sending together with the other workers
+            try:
+                start_barrier.wait()
+            except threading.BrokenBarrierError:
+                # The parent gave up waiting for setup and aborted the run
+                if ring is not None:
+                    ring.close()
+                sock.close()
+                return
+            
+            if ring is not None:
+                try:
+                    self._tx_ring_send_loop(ring, thread_id, flows, packets_per_thread,
+                                            delay_between_packets)
+                finally:
+                    ring.close()
+                    sock.close()
+                return
+            
+            # UDP GSO when packets are due less than 1ms apart: the kernel
+            # segments each burst, so the stack is traversed once per burst
+            if self._gso_segments > 1 and delay_between_packets < 0.001:
+                try:
+                    sock.setsockopt(SOL_UDP, UDP_SEGMENT, self._payload_len)
+                except OSError:
+                    pass
+                else:
+                    if self._gso_send_loop(thread_id, sock, flows, packets_per_thread, delay_between_packets):
+                        sock.close()
+                        return
+                    # Rejected on the first send (e.g. segment larger than
+                    # the route MTU); continue without GSO
+                    sock.setsockopt(SOL_UDP, UDP_SEGMENT, 0)
+            
+            # Prefer the native loop: pacing and sending run without the GIL
+            if _native_send is not None:
+                self._native_send_loop(thread_id, sock, addrs, packets_per_thread, delay_between_packets)
+                sock.close()
+                return
+            
+            # Batch with sendmmsg() when packets are due less than 1ms apart;
+            # slower rates keep per-packet pacing for rate precision
+            if _sendmmsg is not None and delay_between_packets < 0.001:
+                self._batched_send_loop(thread_id, sock, addrs, packets_per_thread, delay_between_packets)
+                sock.close()
+                return
+
+            attempted = 0
             packets_sent_thread = 0
-            bytes_sent_thread = 0
             errors_thread = 0
-            flow_index = 0
-            
-            start_time = time.time()
-            next_send_time = start_time
+
+            payload = memoryview(self._shared_payload)
+            # With libc sendto() destinations are passed as prebuilt
+            # sockaddr_in pointers, skipping per-packet address parsing
+            fd = sock.fileno()
+            payload_addr = ctypes.addressof(self._shared_payload)
+            payload_len = self._payload_len
+            sendto = _sendto
+            sock_sendto = sock.sendto
+            addr_ptrs = [ctypes.addressof(sa) for sa in addrs]
+            # Round-robin through flows with a C-level cycle iterator
+            next_dest = itertools.cycle(addr_ptrs if sendto is not None else flows).__next__
+            addr_len = ctypes.sizeof(_SockaddrIn)
+            delay_ns = round(delay_between_packets * 1e9)
+            next_send_ns = time.perf_counter_ns()
             
-            while self.running and packets_sent_thread < packets_per_thread:
-                current_time = time.time()
-                
-                # Rate limiting - wait if we're ahead of schedule
-                if current_time < next_send_time:
-                    sleep_time = next_send_time - current_time
-                    if sleep_time > 0.001:  # Only sleep if > 1ms
-                        time.sleep(sleep_time)
+            while self.running and attempted < packets_per_thread:
+                # Rate limiting - wait for this packet's departure time
+                if time.perf_counter_ns() < next_send_ns:
+                    _wait_until(next_send_ns)
                 
                 try:
-                    # Send packet to current flow
-                    target = flows[flow_index]
-                    sock.sendto(self.payload, target)
+                    # Send packet to next flow
+                    if sendto is not None:
+                        if sendto(fd, payload_addr, payload_len, 0, next_dest(), addr_len) < 0:
+                            err = ctypes.get_errno()
+                            raise OSError(err, os.strerror(err))
+                    else:
+                        sock_sendto(payload, next_dest())
                     
                     packets_sent_thread += 1
-                    bytes_sent_thread += len(self.payload)
-                    
-                    # Round-robin through flows
-                    flow_index = (flow_index + 1) % len(flows)
+                    self._packets[thread_id] = packets_sent_thread
                     
+                except BlockingIOError:
+                    # Send buffer full: count it and let the kernel drain
+                    errors_thread += 1
+                    self._errors[thread_id] = errors_thread
+                    _wait_writable(sock)
                 except Exception as e:
                     errors_thread += 1
+                    self._errors[thread_id] = errors_thread
                     if errors_thread <= 10:  # Limit error printing
-                        print(f"Thread {thread_id} send error: {e}")
+                        print(f"Worker {thread_id} send error: {e}")
                 
-                # Update next send time
-                next_send_time += delay_between_packets
-                
-                # Periodic statistics update (every 1000 packets)
-                if packets_sent_thread % 1000 == 0:
-                    self._update_stats(1000, len(self.payload) * 1000, 0)
-                    packets_sent_thread = 0  # Reset local counter
-                    bytes_sent_thread = 0
-            
-            # Final statistics update
-            if packets_sent_thread > 0:
-                self._update_stats(packets_sent_thread, bytes_sent_thread, errors_thread)
+                # Dropped packets count as attempted, as in the batched paths
+                attempted += 1
+                # Update next departure time
+                next_send_ns += delay_ns
             
             sock.close()
             
         except Exception as e:
-            print(f"Worker thread {thread_id} failed: {e}")
-            self._update_stats(0, 0, 1)
-    
+            print(f"Worker {thread_id} failed: {e}")
+            self._errors[thread_id] += 1
+
+    def _tx_ring_send_loop(self, ring, thread_id, flows, packets_per_thread, delay_between_packets):
+        """Send loop writing prebuilt frames into an AF_PACKET TX ring."""
+        # One frame per flow; only the UDP destination port differs. The
+        # source port is wrapped into the unprivileged range for high --port
+        src_port = 1024 + (self.base_port + 20000 + thread_id - 1024) % (65536 - 1024)
+        frames = [_build_frame(self._l2_path, ip, src_port, port, self.payload)
+                  for ip, port in flows]
+        next_frame = itertools.cycle(frames).__next__
+        put = ring.put
+        delay_ns = round(delay_between_packets * 1e9)
+
+        packets_sent_thread = 0
+        next_send_ns = time.perf_counter_ns()
+
+        while self.running and packets_sent_thread < packets_per_thread:
+            # Rate limiting - wait for this burst's departure time
+            if time.perf_counter_ns() < next_send_ns:
+                _wait_until(next_send_ns)
+
+            count = min(TX_RING_FLUSH, packets_per_thread - packets_sent_thread)
+            for _ in range(count):
+                put(next_frame())
+            ring.flush()
+
+            packets_sent_thread += count
+            self._packets[thread_id] = packets_sent_thread
+            next_send_ns += delay_ns * count
+
+    def _gso_send_loop(self, thread_id, sock, flows, packets_per_thread, delay_between_packets):
+        """Send loop issuing one UDP GSO sendmsg() per burst of datagrams.
+
+        Each burst goes to a single flow; flows rotate between bursts.
+        Returns False, having sent nothing, if the kernel rejects the first
+        burst, so the caller can fall back to another path.
+        """
+        payload_len = self._payload_len
+        next_flow = itertools.cycle(flows).__next__
+        segments = self._gso_segments
+        burst = memoryview(self.payload * segments)
+        delay_ns = round(delay_between_packets * 1e9)
+
+        attempted = 0
+        packets_sent_thread = 0
+        errors_thread = 0
+        error_calls = 0
+        next_send_ns = time.perf_counter_ns()
+
+        while self.running and attempted < packets_per_thread:
+            # Rate limiting - wait for this burst's departure time
+            if time.perf_counter_ns() < next_send_ns:
+                _wait_until(next_send_ns)
+
+            count = min(segments, packets_per_thread - attempted)
+            try:
+                sock.sendmsg([burst[:count * payload_len]], [], 0, next_flow())
+                packets_sent_thread += count
+                self._packets[thread_id] = packets_sent_thread
+            except BlockingIOError:
+                # Send buffer full: the burst is dropped
+                errors_thread += count
+                self._errors[thread_id] = errors_thread
+                _wait_writable(sock)
+            except OSError as e:
+                if attempted == 0:
+                    return False
+                errors_thread += count
+                self._errors[thread_id] = errors_thread
+                error_calls += 1
+                if error_calls <= 10:  # Limit error printing
+                    print(f"GSO send error: {e}")
+
+            attempted += count
+            next_send_ns += delay_ns * count
+
+        return True
+
+    def _native_send_loop(self, thread_id, sock, addrs, packets_per_thread, delay_between_packets):
+        """Send loop running NATIVE_CHUNK packets per call into libudp_sender."""
+        fd = sock.fileno()
+        payload_addr = ctypes.addressof(self._shared_payload)
+        payload_len = self._payload_len
+        running_addr = ctypes.addressof(self._running)
+        delay_ns = round(delay_between_packets * 1e9)
+        chunk = max(1, min(NATIVE_CHUNK, int(NATIVE_CHUNK_SECONDS / delay_between_packets)))
+
+        flow_index = ctypes.c_uint32(0)
+        next_send_ns = ctypes.c_uint64(0)
+        errors = ctypes.c_uint64(0)
+        attempted = 0
+
+        while self.running and attempted < packets_per_thread:
+            count = min(chunk, packets_per_thread - attempted)
+            sent = _native_send(fd, payload_addr, payload_len, addrs, len(addrs),
+                                ctypes.byref(flow_index), delay_ns,
+                                ctypes.byref(next_send_ns), count, running_addr,
+                                ctypes.byref(errors))
+            attempted += sent + errors.value
+            self._packets[thread_id] += sent
+            self._errors[thread_id] += errors.value
+            errors.value = 0
+
+    def _batched_send_loop(self, thread_id, sock, addrs, packets_per_thread, delay_between_packets):
+        """Send loop issuing one sendmmsg() syscall per MMSG_BATCH packets."""
+        batcher = _MmsgBatch(self._shared_payload, addrs)
+        fd = sock.fileno()
+
+        attempted = 0
+        packets_sent_thread = 0
+        errors_thread = 0
+        error_calls = 0
+        flow_index = 0
+
+        delay_ns = round(delay_between_packets * 1e9)
+        next_send_ns = time.perf_counter_ns()
+
+        while self.running and attempted < packets_per_thread:
+            # Rate limiting - wait for this batch's departure time
+            if time.perf_counter_ns() < next_send_ns:
+                _wait_until(next_send_ns)
+
+            count = min(batcher.batch, packets_per_thread - attempted)
+            sent, flow_index, err = batcher.send(fd, count, flow_index)
+
+            attempted += count
+            packets_sent_thread += sent
+            self._packets[thread_id] = packets_sent_thread
+
+            if err:
+                # The unsent tail of the batch is dropped
+                errors_thread += count - sent
+                self._errors[thread_id] = errors_thread
+                if err in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    _wait_writable(sock)
+                else:
+                    error_calls += 1
+                    if error_calls <= 10:  # Limit error printing
+                        print(f"sendmmsg error: {os.strerror(err)}")
+
+            # Update next departure time for the whole batch
+            next_send_ns += delay_ns * count
+
     def generate_traffic(self):
         """Main traffic generation method."""
         print(f"Starting high-rate traffic generation...")
@@ -141,61 +783,81 @@ class HighRateTrafficGenerator:
         print(f"Packet size: {self.packet_size} bytes")
         
         # Calculate per-thread parameters
-        pps_per_thread = self.target_pps // self.num_threads
-        packets_per_thread = (pps_per_thread * self.duration) // self.num_threads
+        pps_per_thread = self.target_pps / self.num_threads
+        packets_per_thread = math.ceil(self.target_pps * self.duration / self.num_threads)
         delay_between_packets = 1.0 / pps_per_thread if pps_per_thread > 0 else 0.001
         
-        print(f"Per thread: {pps_per_thread} pps, {packets_per_thread} packets, {delay_between_packets:.6f}s delay")
-        print("\nTraffic generation starting in 3 seconds...")
-        time.sleep(3)
+        print(f"Per thread: {pps_per_thread:g} pps, {packets_per_thread} packets, {delay_between_packets:.6f}s delay")
         
         self.running = True
+        
+        # Start worker processes; they set up their sockets, then all begin
+        # sending when this process joins the barrier
+        start_barrier = self._mp.Barrier(self.num_threads + 1)
+        workers = []
+        for thread_id in range(self.num_threads):
+            worker = self._mp.Process(
+                target=self._worker_proc,
+                args=(thread_id, packets_per_thread, delay_between_packets, start_barrier),
+                name=f"sender-{thread_id}",
+                daemon=True
+            )
+            worker.start()
+            workers.append(worker)
+        
+        try:
+            start_barrier.wait(timeout=START_BARRIER_TIMEOUT)
+        except threading.BrokenBarrierError:
+            # A broken barrier releases every worker with an error, so none
+            # would send: abort instead of running on with nothing
+            print(f"\nNot all workers finished setup within {START_BARRIER_TIMEOUT}s, aborting")
+            self.running = False
+            self._join_workers(workers)
+            return
         self.start_time = time.time()
         
-        # Start worker threads
-        with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
-            futures = []
-            for thread_id in range(self.num_threads):
-                future = executor.submit(self._worker_thread, thread_id, 
-                                       packets_per_thread, delay_between_packets)
-                futures.append(future)
-            
-            # Monitor progress
-            last_stats_time = time.time()
-            last_packets = 0
+        # Monitor progress
+        last_stats_time = time.time()
+        last_packets = 0
+        
+        while self.running and (time.time() - self.start_time) < self.duration:
+            time.sleep(1)
             
-            while self.running and (time.time() - self.start_time) < self.duration:
-                time.sleep(1)
+            current_time = time.time()
+            if current_time - last_stats_time >= 1.0:
+                packets_sent = self.packets_sent
+                elapsed = current_time - self.start_time
+                current_pps = (packets_sent - last_packets)
+                avg_pps = packets_sent / elapsed if elapsed > 0 else 0
                 
-                current_time = time.time()
-                if current_time - last_stats_time >= 1.0:
-                    with self.stats_lock:
-                        elapsed = current_time - self.start_time
-                        current_pps = (self.packets_sent - last_packets)
-                        avg_pps = self.packets_sent / elapsed if elapsed > 0 else 0
-                        
-                        print(f"\rElapsed: {elapsed:.1f}s | "
-                              f"Packets: {self.packets_sent:,} | "
-                              f"Current: {current_pps:,} pps | "
-                              f"Average: {avg_pps:.0f} pps | "
-                              f"Errors: {self.errors}", end="", flush=True)
-                        
-                        last_packets = self.packets_sent
-                        last_stats_time = current_time
-            
-            # Stop all threads
-            self.running = False
-            
-            # Wait for threads to complete
-            for future in futures:
-                try:
-                    future.result(timeout=5)
-                except Exception as e:
-                    print(f"\nThread completion error: {e}")
+                print(f"\rElapsed: {elapsed:.1f}s | "
+                      f"Packets: {packets_sent:,} | "
+                      f"Current: {current_pps:,} pps | "
+                      f"Average: {avg_pps:.0f} pps | "
+                      f"Errors: {self.errors}", end="", flush=True)
+                
+                last_packets = packets_sent
+                last_stats_time = current_time
+        
+        # Stop all workers
+        self.running = False
+        
+        # Wait for workers to complete
+        self._join_workers(workers)
         
         self.end_time = time.time()
         self._print_final_stats()
     
+    @staticmethod
+    def _join_workers(workers):
+        """Wait for stopped workers to exit, terminating any that hang."""
+        for worker in workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                print(f"\nWorker {worker.name} did not exit, terminating")
+                worker.terminate()
+                worker.join()
+    
     def _print_final_stats(self):
         """Print final traffic generation statistics."""
         elapsed = self.end_time - self.start_time
@@ -249,6 +911,42 @@ def create_preset_configs():
         }
     }
 
+def _preset_init(config):
+    """Return an __init__ taking HighRateTrafficGenerator's arguments, in the
+    same order, with the preset's rate, duration, flows and threads as defaults."""
+    def __init__(self, target_ip="127.0.0.1", base_port=12345,
+                 packet_size=100, target_pps=config['target_pps'],
+                 duration=config['duration'], num_flows=config['num_flows'],
+                 num_threads=config['num_threads']):
+        HighRateTrafficGenerator.__init__(self, target_ip, base_port, packet_size,
+                                          target_pps, duration, num_flows, num_threads)
+    return __init__
+
+def _create_preset_generators():
+    """Build one HighRateTrafficGenerator subclass per preset.
+
+    Each subclass has the preset's rate, duration, flows and threads as
+    __init__ defaults; explicit arguments, positional or keyword, still
+    override them.
+    """
+    generators = {}
+    for name, config in create_preset_configs().items():
+        generators[name] = type(f'{name.capitalize()}TrafficGenerator', (HighRateTrafficGenerator,), {
+            '__doc__': config['description'],
+            '__init__': _preset_init(config),
+        })
+    return generators
+
+PRESET_GENERATORS = _create_preset_generators()
+
+# Command line destination for each preset-controlled constructor argument
+ARG_FOR_PARAM = {
+    'target_pps': 'rate',
+    'duration': 'duration',
+    'num_flows': 'flows',
+    'num_threads': 'threads',
+}
+
 def main():
     parser = argparse.ArgumentParser(
         description='High-Rate UDP Traffic Generator for eBPF-Test Phase 3',
@@ -304,43 +1002,40 @@ Examples:
                   f"Threads: {config['num_threads']}")
         return
     
-    # Apply preset if specified
-    if args.preset:
-        preset = presets[args.preset]
-        if args.verbose:
-            print(f"Using preset '{args.preset}': {preset['description']}")
-        
-        # Override with preset values (command line args take precedence)
-        rate = preset['target_pps'] if args.rate == 1000 else args.rate  # 1000 is default
-        duration = preset['duration'] if args.duration == 30 else args.duration  # 30 is default
-        flows = preset['num_flows'] if args.flows == 1 else args.flows  # 1 is default
-        threads = preset['num_threads'] if args.threads == 1 else args.threads  # 1 is default
-    else:
-        rate = args.rate
-        duration = args.duration
-        flows = args.flows
-        threads = args.threads
-    
-    # Validation
-    if rate <= 0:
+    # Validation (preset values are always valid)
+    if args.rate <= 0:
         print("Error: Rate must be positive")
         sys.exit(1)
-    if duration <= 0:
+    if args.duration <= 0:
         print("Error: Duration must be positive")
         sys.exit(1)
     if args.size < 20:
         print("Error: Packet size must be at least 20 bytes")
         sys.exit(1)
     
+    # Explicit command line values; with a preset only those changed from
+    # their defaults are passed, so the preset's values apply otherwise
+    overrides = {
+        'target_pps': args.rate,
+        'duration': args.duration,
+        'num_flows': args.flows,
+        'num_threads': args.threads,
+    }
+    if args.preset:
+        if args.verbose:
+            print(f"Using preset '{args.preset}': {presets[args.preset]['description']}")
+        generator_class = PRESET_GENERATORS[args.preset]
+        overrides = {key: value for key, value in overrides.items()
+                     if value != parser.get_default(ARG_FOR_PARAM[key])}
+    else:
+        generator_class = HighRateTrafficGenerator
+    
     # Create and run traffic generator
-    generator = HighRateTrafficGenerator(
+    generator = generator_class(
         target_ip=args.target,
         base_port=args.port,
         packet_size=args.size,
-        target_pps=rate,
-        duration=duration,
-        num_flows=flows,
-        num_threads=threads
+        **overrides
     )
     
     try:
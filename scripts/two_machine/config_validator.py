@@ -11,10 +11,248 @@ License: MIT
 
 import ipaddress
 import logging
+import socket
+import struct
 import sys
-from typing import Dict, Any, List, Optional, Union, Set
-from dataclasses import dataclass
-from pathlib import Path
+from array import array
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Dict, Any, FrozenSet, Iterator, List, Mapping, Optional, Tuple, Union, Set
+from dataclasses import dataclass, field
+
+
+# YAML scalars are exactly int, float or bool (never subclasses), so types
+# are matched exactly; this also keeps booleans out of numeric fields
+_NUMERIC = (int, float)
+_NUMERIC_SET = frozenset(_NUMERIC)
+_MISSING = object()
+# Read-only default for .get() chains; avoids building a new {} per lookup
+_EMPTY: Mapping = MappingProxyType({})
+
+
+def _names(*names: str) -> FrozenSet[str]:
+    """Return names as a frozenset of interned strings."""
+    return frozenset(map(sys.intern, names))
+
+
+# Top-level sections
+_REQUIRED_SECTIONS = _names(
+    'test_config',
+    'traffic_config',
+    'network_config',
+    'monitoring_config',
+    'results_config'
+)
+_OPTIONAL_SECTIONS = _names(
+    'version',
+    'xdp_config',
+    'performance_targets',
+    'qa_config',
+    'logging_config',
+    'debug_config',
+    'machine_roles',
+    'security_config',
+    'presets'
+)
+
+# Sections belonging to each configuration schema version
+_SCHEMA_SECTIONS: Dict[str, FrozenSet[str]] = {
+    '1': _REQUIRED_SECTIONS | _OPTIONAL_SECTIONS,
+}
+
+# Required, optional and known (required | optional) fields per section
+_TEST_REQUIRED = _names('duration')
+_TEST_OPTIONAL = _names('name', 'description', 'warmup_time', 'cooldown_time')
+_TEST_KNOWN = _TEST_REQUIRED | _TEST_OPTIONAL
+
+_TRAFFIC_REQUIRED = _names('packet_rate', 'packet_size', 'flows', 'threads')
+_TRAFFIC_OPTIONAL = _names('patterns')
+_TRAFFIC_KNOWN = _TRAFFIC_REQUIRED | _TRAFFIC_OPTIONAL
+
+_NETWORK_REQUIRED = _names('src_machine', 'dst_machine', 'traffic_ports')
+_NETWORK_OPTIONAL = _names('discovery')
+_NETWORK_KNOWN = _NETWORK_REQUIRED | _NETWORK_OPTIONAL
+
+_MACHINE_REQUIRED = _names('ip', 'control_port')
+_MACHINE_OPTIONAL = _names('hostname', 'interface')
+_MACHINE_KNOWN = _MACHINE_REQUIRED | _MACHINE_OPTIONAL
+
+_RESULTS_REQUIRED = _names('output_dir')
+_RESULTS_OPTIONAL = _names('filename_pattern', 'formats', 'include_raw_data', 'baseline_comparison')
+_RESULTS_KNOWN = _RESULTS_REQUIRED | _RESULTS_OPTIONAL
+
+_MONITORING_KNOWN = _names('sample_rate', 'metrics', 'real_time', 'housekeeping_cpu')
+_XDP_KNOWN = _names('program_path', 'mode', 'ring_buffer', 'stats')
+_LOGGING_KNOWN = _names('level', 'file_logging', 'console_logging', 'format')
+_TARGETS_KNOWN = _names(
+    'min_throughput_pps',
+    'max_cpu_usage_percent',
+    'max_memory_usage_mb',
+    'expected_cpu_efficiency_improvement',
+    'expected_latency_reduction_percent'
+)
+
+_VALID_METRICS = _names('cpu_usage', 'memory_usage', 'network_stats', 'xdp_stats')
+_VALID_XDP_MODES = _names('native', 'skb', 'hw')
+
+# Scalar field rules: (section path, field, type, invalid test, invalid
+# message, further checks). Tests are Python expressions over the value `v`;
+# the first failing test wins. Further checks are (test, 'error' | 'warning',
+# message), tried in order once the value is valid.
+_FIELD_RULES = (
+    (('test_config',), 'duration', _NUMERIC, 'v <= 0',
+     "test_config.duration must be a positive number",
+     (('v > 3600', 'warning', "test_config.duration is very long (>1 hour)"),)),
+    (('test_config',), 'warmup_time', _NUMERIC, 'v < 0',
+     "test_config.warmup_time must be a non-negative number", ()),
+    (('test_config',), 'cooldown_time', _NUMERIC, 'v < 0',
+     "test_config.cooldown_time must be a non-negative number", ()),
+    (('traffic_config',), 'packet_rate', int, 'v <= 0',
+     "traffic_config.packet_rate must be a positive integer",
+     (('v > 1_000_000', 'warning', "traffic_config.packet_rate is very high (>1M pps)"),)),
+    (('traffic_config',), 'packet_size', int, 'v <= 0',
+     "traffic_config.packet_size must be a positive integer",
+     (('v < 64', 'warning', "traffic_config.packet_size is very small (<64 bytes)"),
+      ('v > 9000', 'error', "traffic_config.packet_size exceeds jumbo frame size (9000 bytes)"))),
+    (('traffic_config',), 'flows', int, 'v <= 0',
+     "traffic_config.flows must be a positive integer",
+     (('v > 1000', 'warning', "traffic_config.flows is very high (>1000)"),)),
+    (('traffic_config',), 'threads', int, 'v <= 0',
+     "traffic_config.threads must be a positive integer",
+     (('v > 64', 'warning', "traffic_config.threads is very high (>64)"),)),
+    (('network_config', 'src_machine'), 'control_port', int, '((v - 1) | (0xFFFF - v)) < 0',
+     "network_config.src_machine.control_port must be a valid port number (1-65535)",
+     (('v < 1024', 'warning', "network_config.src_machine.control_port is a privileged port (<1024)"),)),
+    (('network_config', 'dst_machine'), 'control_port', int, '((v - 1) | (0xFFFF - v)) < 0',
+     "network_config.dst_machine.control_port must be a valid port number (1-65535)",
+     (('v < 1024', 'warning', "network_config.dst_machine.control_port is a privileged port (<1024)"),)),
+    (('monitoring_config',), 'sample_rate', _NUMERIC, 'v <= 0',
+     "monitoring_config.sample_rate must be a positive number",
+     (('v < 0.1', 'warning', "monitoring_config.sample_rate is very fast (<0.1s)"),)),
+    (('monitoring_config',), 'housekeeping_cpu', int, 'v < 0',
+     "monitoring_config.housekeeping_cpu must be a non-negative integer", ()),
+) + tuple(
+    (('performance_targets',), field, _NUMERIC, 'v < 0',
+     f"performance_targets.{field} must be a non-negative number", ())
+    for field in ('min_throughput_pps', 'max_cpu_usage_percent', 'max_memory_usage_mb',
+                  'expected_cpu_efficiency_improvement', 'expected_latency_reduction_percent')
+)
+
+
+def _valid_port(port: Any) -> bool:
+    """Return True if port is an int in 1-65535.
+
+    Both differences are non-negative exactly when the port is in range,
+    so OR-ing them tests the two bounds without a short-circuit branch.
+    """
+    return type(port) is int and ((port - 1) | (0xFFFF - port)) >= 0
+
+
+def _is_member(value: Any, names: FrozenSet[str]) -> bool:
+    """Return True if value is one of names; unhashable values never are."""
+    return isinstance(value, str) and value in names
+
+
+def _ipv4_to_int(ip: Any) -> Optional[int]:
+    """Return a dotted-quad IPv4 address as an integer, or None if it is not one."""
+    try:
+        return struct.unpack('!I', socket.inet_pton(socket.AF_INET, ip))[0]
+    except (OSError, TypeError, ValueError):
+        # ValueError: embedded NUL characters and unencodable surrogates
+        return None
+
+
+@lru_cache(maxsize=256)
+def _valid_ip(ip: Union[str, int]) -> bool:
+    """Return True if ip is a valid IPv4 or IPv6 address (memoized)."""
+    try:
+        ipaddress.ip_address(ip)
+        return True
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=256)
+def _in_different_subnets(src_ip: str, dst_ip: str) -> bool:
+    """Return True if dst_ip lies outside src_ip's /24 (memoized).
+
+    Used for addresses _ipv4_to_int() cannot parse; invalid addresses are
+    reported elsewhere and count as not different.
+    """
+    try:
+        src_net = ipaddress.ip_network(f"{src_ip}/24", strict=False)
+        return ipaddress.ip_address(dst_ip) not in src_net
+    except ValueError:
+        return False
+
+
+def _prefixed(message: str) -> str:
+    """Return message as a %-template taking the section prefix as its argument."""
+    return '%s' + message.replace('%', '%%')
+
+
+# Shared table of message templates; results store indices into it
+_MESSAGES: List[str] = []
+_MESSAGE_IDS: Dict[str, int] = {}
+
+
+def _message_id(template: str) -> int:
+    """Return the index of template in _MESSAGES, registering it if new."""
+    code = _MESSAGE_IDS.get(template)
+    if code is None:
+        code = _MESSAGE_IDS[template] = len(_MESSAGES)
+        _MESSAGES.append(template)
+    return code
+
+
+@lru_cache(maxsize=None)
+def _compile_field_validator(rules: Tuple) -> Callable[[Dict[str, Any], 'ValidationResult', str], None]:
+    """Generate one straight-line function applying every rule in rules.
+
+    The generated code inlines each type and range test, so validating
+    scalar fields costs no method dispatch or table walking at run time.
+    Messages are prefixed with the function's prefix argument, which lets
+    the same code check preset overrides.
+    """
+    namespace: Dict[str, Any] = {'_MISSING': _MISSING}
+    type_names: Dict[Any, str] = {}
+    lines = ["def _validate_fields(config, result, prefix=''):",
+             "    error_code = result._error_codes.append",
+             "    error_args = result._error_args.append",
+             "    warning_code = result._warning_codes.append",
+             "    warning_args = result._warning_args.append",
+             "    prefix_args = (prefix,)"]
+    
+    # Group rules by section so each section is looked up once
+    by_path: Dict[Tuple[str, ...], List[Tuple]] = {}
+    for path, *rule in rules:
+        by_path.setdefault(path, []).append(rule)
+    
+    for path, path_rules in by_path.items():
+        lines.append("    sec = config")
+        for key in path:
+            lines.append(f"    sec = sec.get({key!r}) if isinstance(sec, dict) else None")
+        lines.append("    if isinstance(sec, dict):")
+        for field, field_type, invalid, message, checks in path_rules:
+            type_name = type_names.setdefault(field_type, f"_T{len(type_names)}")
+            if isinstance(field_type, tuple):
+                namespace[type_name] = frozenset(field_type)
+                type_test = f"type(v) not in {type_name}"
+            else:
+                namespace[type_name] = field_type
+                type_test = f"type(v) is not {type_name}"
+            lines += [f"        v = sec.get({field!r}, _MISSING)",
+                      "        if v is not _MISSING:",
+                      f"            if {type_test} or {invalid}:",
+                      f"                error_code({_message_id(_prefixed(message))})",
+                      "                error_args(prefix_args)"]
+            for test, level, check_message in checks:
+                lines += [f"            elif {test}:",
+                          f"                {level}_code({_message_id(_prefixed(check_message))})",
+                          f"                {level}_args(prefix_args)"]
+    
+    exec(compile("\n".join(lines), '<config-validator>', 'exec'), namespace)
+    return namespace['_validate_fields']
 
 
 class ValidationError(Exception):
@@ -22,21 +260,69 @@ class ValidationError(Exception):
     pass
 
 
+def _format_messages(codes: 'array[int]', args_list: List[tuple]) -> Iterator[str]:
+    """Yield the text of (message code, args) entries, formatting as they are read."""
+    for code, args in zip(codes, args_list):
+        template = _MESSAGES[code]
+        yield template % args if args else template
+
+
+def _new_codes() -> 'array[int]':
+    """Return an empty column of message codes."""
+    return array('I')
+
+
 @dataclass
 class ValidationResult:
-    """Result of configuration validation."""
-    is_valid: bool
-    errors: List[str]
-    warnings: List[str]
+    """Result of configuration validation; valid while it holds no errors.
+
+    Each message is stored as an index into the shared template table plus
+    its format arguments, held in parallel columns, and only formatted when
+    errors/warnings are read. Repeated messages share one template string,
+    and discarded or merely counted messages never build a string.
+    """
+    _error_codes: 'array[int]' = field(default_factory=_new_codes)
+    _error_args: List[tuple] = field(default_factory=list)
+    _warning_codes: 'array[int]' = field(default_factory=_new_codes)
+    _warning_args: List[tuple] = field(default_factory=list)
+    
+    @property
+    def errors(self) -> List[str]:
+        """Formatted error messages."""
+        return list(self.iter_errors())
+    
+    @property
+    def warnings(self) -> List[str]:
+        """Formatted warning messages."""
+        return list(self.iter_warnings())
+    
+    @property
+    def is_valid(self) -> bool:
+        """Return True if no errors were recorded."""
+        return not self._error_codes
+    
+    @property
+    def has_warnings(self) -> bool:
+        """Return True if any warnings were recorded."""
+        return bool(self._warning_codes)
+    
+    def iter_errors(self) -> Iterator[str]:
+        """Yield error messages, formatting each one as it is consumed."""
+        return _format_messages(self._error_codes, self._error_args)
+    
+    def iter_warnings(self) -> Iterator[str]:
+        """Yield warning messages, formatting each one as it is consumed."""
+        return _format_messages(self._warning_codes, self._warning_args)
     
-    def add_error(self, error: str) -> None:
-        """Add an error message."""
-        self.errors.append(error)
-        self.is_valid = False
+    def add_error(self, template: str, *args: Any) -> None:
+        """Add an error message; args are %-formatted into template on read."""
+        self._error_codes.append(_message_id(template))
+        self._error_args.append(args)
     
-    def add_warning(self, warning: str) -> None:
-        """Add a warning message."""
-        self.warnings.append(warning)
+    def add_warning(self, template: str, *args: Any) -> None:
+        """Add a warning message; args are %-formatted into template on read."""
+        self._warning_codes.append(_message_id(template))
+        self._warning_args.append(args)
     
     def __bool__(self) -> bool:
         """Return True if validation passed."""
@@ -50,75 +336,70 @@ class ConfigValidator:
         self.logger = logging.getLogger(f"{__name__}.ConfigValidator")
         
         # Define valid configuration sections
-        self.required_sections = {
-            'test_config', 
-            'traffic_config', 
-            'network_config',
-            'monitoring_config',
-            'results_config'
-        }
-        
-        self.optional_sections = {
-            'xdp_config',
-            'performance_targets',
-            'qa_config',
-            'logging_config',
-            'debug_config',
-            'machine_roles',
-            'security_config',
-            'presets'
-        }
+        self.required_sections = _REQUIRED_SECTIONS
+        self.optional_sections = _OPTIONAL_SECTIONS
+        self.known_sections = self.required_sections | self.optional_sections
         
         # Define valid traffic patterns
-        self.valid_traffic_patterns = {'constant', 'burst', 'ramp', 'random'}
+        self.valid_traffic_patterns = _names('constant', 'burst', 'ramp', 'random')
         
         # Define valid log levels
-        self.valid_log_levels = {'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'}
+        self.valid_log_levels = _names('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
         
         # Define valid output formats
-        self.valid_output_formats = {'json', 'csv', 'markdown', 'yaml'}
+        self.valid_output_formats = _names('json', 'csv', 'markdown', 'yaml')
+        
+        # Scalar type/range checks, generated once per rule set
+        self._validate_fields = _compile_field_validator(_FIELD_RULES)
+        
+        # Section validators in the order they run, bound once
+        self._dispatch = (
+            ('test_config', self._validate_test_config),
+            ('traffic_config', self._validate_traffic_config),
+            ('network_config', self._validate_network_config),
+            ('monitoring_config', self._validate_monitoring_config),
+            ('results_config', self._validate_results_config),
+            ('xdp_config', self._validate_xdp_config),
+            ('performance_targets', self._validate_performance_targets),
+            ('logging_config', self._validate_logging_config),
+            ('presets', self._validate_presets),
+        )
+    
+    @classmethod
+    def for_schema(cls, version: Union[str, int]) -> 'ConfigValidator':
+        """Return a validator specialized to one schema version.
+
+        Sections outside that version's schema are dropped from the section
+        sets, the dispatch table and the generated field checks. Validators
+        are cached per version. Numeric spellings of a version are
+        equivalent: 1, 1.0, '1' and '1.0' all select schema '1'.
+        """
+        return _schema_validator(cls, _schema_version_key(version))
     
     def validate_config(self, config: Dict[str, Any]) -> ValidationResult:
         """Validate complete configuration."""
-        result = ValidationResult(is_valid=True, errors=[], warnings=[])
+        result = ValidationResult()
         
-        try:
-            # Check top-level structure
-            self._validate_top_level_structure(config, result)
-            
-            # Validate individual sections
-            if 'test_config' in config:
-                self._validate_test_config(config['test_config'], result)
-            
-            if 'traffic_config' in config:
-                self._validate_traffic_config(config['traffic_config'], result)
-            
-            if 'network_config' in config:
-                self._validate_network_config(config['network_config'], result)
-            
-            if 'monitoring_config' in config:
-                self._validate_monitoring_config(config['monitoring_config'], result)
-            
-            if 'results_config' in config:
-                self._validate_results_config(config['results_config'], result)
-            
-            if 'xdp_config' in config:
-                self._validate_xdp_config(config['xdp_config'], result)
-            
-            if 'performance_targets' in config:
-                self._validate_performance_targets(config['performance_targets'], result)
-            
-            if 'logging_config' in config:
-                self._validate_logging_config(config['logging_config'], result)
-            
-            if 'presets' in config:
-                self._validate_presets(config['presets'], result)
-            
-            # Cross-section validation
-            self._validate_cross_section_consistency(config, result)
-            
-        except Exception as e:
-            result.add_error(f"Validation failed with exception: {e}")
+        # Check top-level structure
+        self._validate_top_level_structure(config, result)
+        if not isinstance(config, dict):
+            return result
+        
+        # Type and range checks for all scalar fields
+        self._validate_fields(config, result)
+        
+        # Validate individual sections; section validators may assume a dict
+        for section, validate in self._dispatch:
+            section_config = config.get(section)
+            if section_config is None:
+                continue
+            if not isinstance(section_config, dict):
+                result.add_error("%s must be a dictionary", section)
+                continue
+            validate(section_config, result)
+        
+        # Cross-section validation
+        self._validate_cross_section_consistency(config, result)
         
         return result
     
@@ -131,78 +412,23 @@ class ConfigValidator:
         # Check for required sections
         for section in self.required_sections:
             if section not in config:
-                result.add_error(f"Missing required section: {section}")
+                result.add_error("Missing required section: %s", section)
         
         # Check for unknown sections
-        known_sections = self.required_sections | self.optional_sections
+        known_sections = self.known_sections
         for section in config.keys():
             if section not in known_sections:
-                result.add_warning(f"Unknown configuration section: {section}")
+                result.add_warning("Unknown configuration section: %s", section)
     
     def _validate_test_config(self, test_config: Dict[str, Any], result: ValidationResult) -> None:
         """Validate test configuration section."""
-        required_fields = {'duration'}
-        optional_fields = {'name', 'description', 'warmup_time', 'cooldown_time'}
-        
-        self._check_required_fields(test_config, required_fields, 'test_config', result)
-        self._check_unknown_fields(test_config, required_fields | optional_fields, 'test_config', result)
-        
-        # Validate field types and ranges
-        if 'duration' in test_config:
-            if not isinstance(test_config['duration'], (int, float)) or test_config['duration'] <= 0:
-                result.add_error("test_config.duration must be a positive number")
-            elif test_config['duration'] > 3600:
-                result.add_warning("test_config.duration is very long (>1 hour)")
-        
-        if 'warmup_time' in test_config:
-            if not isinstance(test_config['warmup_time'], (int, float)) or test_config['warmup_time'] < 0:
-                result.add_error("test_config.warmup_time must be a non-negative number")
-        
-        if 'cooldown_time' in test_config:
-            if not isinstance(test_config['cooldown_time'], (int, float)) or test_config['cooldown_time'] < 0:
-                result.add_error("test_config.cooldown_time must be a non-negative number")
+        self._check_required_fields(test_config, _TEST_REQUIRED, 'test_config', result)
+        self._check_unknown_fields(test_config, _TEST_KNOWN, 'test_config', result)
     
     def _validate_traffic_config(self, traffic_config: Dict[str, Any], result: ValidationResult) -> None:
         """Validate traffic configuration section."""
-        required_fields = {'packet_rate', 'packet_size', 'flows', 'threads'}
-        optional_fields = {'patterns'}
-        
-        self._check_required_fields(traffic_config, required_fields, 'traffic_config', result)
-        self._check_unknown_fields(traffic_config, required_fields | optional_fields, 'traffic_config', result)
-        
-        # Validate packet rate
-        if 'packet_rate' in traffic_config:
-            rate = traffic_config['packet_rate']
-            if not isinstance(rate, int) or rate <= 0:
-                result.add_error("traffic_config.packet_rate must be a positive integer")
-            elif rate > 1_000_000:
-                result.add_warning("traffic_config.packet_rate is very high (>1M pps)")
-        
-        # Validate packet size
-        if 'packet_size' in traffic_config:
-            size = traffic_config['packet_size']
-            if not isinstance(size, int) or size <= 0:
-                result.add_error("traffic_config.packet_size must be a positive integer")
-            elif size < 64:
-                result.add_warning("traffic_config.packet_size is very small (<64 bytes)")
-            elif size > 9000:
-                result.add_error("traffic_config.packet_size exceeds jumbo frame size (9000 bytes)")
-        
-        # Validate flows
-        if 'flows' in traffic_config:
-            flows = traffic_config['flows']
-            if not isinstance(flows, int) or flows <= 0:
-                result.add_error("traffic_config.flows must be a positive integer")
-            elif flows > 1000:
-                result.add_warning("traffic_config.flows is very high (>1000)")
-        
-        # Validate threads
-        if 'threads' in traffic_config:
-            threads = traffic_config['threads']
-            if not isinstance(threads, int) or threads <= 0:
-                result.add_error("traffic_config.threads must be a positive integer")
-            elif threads > 64:
-                result.add_warning("traffic_config.threads is very high (>64)")
+        self._check_required_fields(traffic_config, _TRAFFIC_REQUIRED, 'traffic_config', result)
+        self._check_unknown_fields(traffic_config, _TRAFFIC_KNOWN, 'traffic_config', result)
         
         # Validate traffic patterns
         if 'patterns' in traffic_config:
@@ -216,34 +442,34 @@ class ConfigValidator:
         
         for i, pattern in enumerate(patterns):
             if not isinstance(pattern, dict):
-                result.add_error(f"traffic_config.patterns[{i}] must be a dictionary")
+                result.add_error("traffic_config.patterns[%d] must be a dictionary", i)
                 continue
             
             # Check required fields
             if 'name' not in pattern:
-                result.add_error(f"traffic_config.patterns[{i}] missing required field 'name'")
+                result.add_error("traffic_config.patterns[%d] missing required field 'name'", i)
             if 'type' not in pattern:
-                result.add_error(f"traffic_config.patterns[{i}] missing required field 'type'")
+                result.add_error("traffic_config.patterns[%d] missing required field 'type'", i)
             
             # Validate pattern type
-            if 'type' in pattern and pattern['type'] not in self.valid_traffic_patterns:
-                result.add_error(f"traffic_config.patterns[{i}].type '{pattern['type']}' is not valid. "
-                               f"Valid types: {', '.join(self.valid_traffic_patterns)}")
+            if 'type' in pattern and not _is_member(pattern['type'], self.valid_traffic_patterns):
+                result.add_error("traffic_config.patterns[%d].type '%s' is not valid. Valid types: %s",
+                                 i, pattern['type'], ', '.join(self.valid_traffic_patterns))
     
     def _validate_network_config(self, network_config: Dict[str, Any], result: ValidationResult) -> None:
         """Validate network configuration section."""
-        required_fields = {'src_machine', 'dst_machine', 'traffic_ports'}
-        optional_fields = {'discovery'}
-        
-        self._check_required_fields(network_config, required_fields, 'network_config', result)
-        self._check_unknown_fields(network_config, required_fields | optional_fields, 'network_config', result)
+        self._check_required_fields(network_config, _NETWORK_REQUIRED, 'network_config', result)
+        self._check_unknown_fields(network_config, _NETWORK_KNOWN, 'network_config', result)
         
         # Validate machine configurations
-        if 'src_machine' in network_config:
-            self._validate_machine_config(network_config['src_machine'], 'network_config.src_machine', result)
-        
-        if 'dst_machine' in network_config:
-            self._validate_machine_config(network_config['dst_machine'], 'network_config.dst_machine', result)
+        for machine in ('src_machine', 'dst_machine'):
+            if machine in network_config:
+                machine_config = network_config[machine]
+                prefix = f"network_config.{machine}"
+                if isinstance(machine_config, dict):
+                    self._validate_machine_config(machine_config, prefix, result)
+                else:
+                    result.add_error("%s must be a dictionary", prefix)
         
         # Validate traffic ports
         if 'traffic_ports' in network_config:
@@ -254,45 +480,23 @@ class ConfigValidator:
                 result.add_error("network_config.traffic_ports cannot be empty")
             else:
                 for i, port in enumerate(ports):
-                    if not isinstance(port, int) or port < 1 or port > 65535:
-                        result.add_error(f"network_config.traffic_ports[{i}] must be a valid port number (1-65535)")
+                    if not _valid_port(port):
+                        result.add_error("network_config.traffic_ports[%d] must be a valid port number (1-65535)", i)
     
     def _validate_machine_config(self, machine_config: Dict[str, Any], prefix: str, result: ValidationResult) -> None:
         """Validate machine configuration."""
-        required_fields = {'ip', 'control_port'}
-        optional_fields = {'hostname', 'interface'}
-        
-        self._check_required_fields(machine_config, required_fields, prefix, result)
-        self._check_unknown_fields(machine_config, required_fields | optional_fields, prefix, result)
+        self._check_required_fields(machine_config, _MACHINE_REQUIRED, prefix, result)
+        self._check_unknown_fields(machine_config, _MACHINE_KNOWN, prefix, result)
         
         # Validate IP address
         if 'ip' in machine_config:
-            try:
-                ipaddress.ip_address(machine_config['ip'])
-            except ValueError:
-                result.add_error(f"{prefix}.ip is not a valid IP address")
-        
-        # Validate control port
-        if 'control_port' in machine_config:
-            port = machine_config['control_port']
-            if not isinstance(port, int) or port < 1 or port > 65535:
-                result.add_error(f"{prefix}.control_port must be a valid port number (1-65535)")
-            elif port < 1024:
-                result.add_warning(f"{prefix}.control_port is a privileged port (<1024)")
+            ip = machine_config['ip']
+            if not isinstance(ip, (str, int)) or not _valid_ip(ip):
+                result.add_error("%s.ip is not a valid IP address", prefix)
     
     def _validate_monitoring_config(self, monitoring_config: Dict[str, Any], result: ValidationResult) -> None:
         """Validate monitoring configuration section."""
-        optional_fields = {'sample_rate', 'metrics', 'real_time'}
-        
-        self._check_unknown_fields(monitoring_config, optional_fields, 'monitoring_config', result)
-        
-        # Validate sample rate
-        if 'sample_rate' in monitoring_config:
-            rate = monitoring_config['sample_rate']
-            if not isinstance(rate, (int, float)) or rate <= 0:
-                result.add_error("monitoring_config.sample_rate must be a positive number")
-            elif rate < 0.1:
-                result.add_warning("monitoring_config.sample_rate is very fast (<0.1s)")
+        self._check_unknown_fields(monitoring_config, _MONITORING_KNOWN, 'monitoring_config', result)
         
         # Validate metrics list
         if 'metrics' in monitoring_config:
@@ -300,30 +504,26 @@ class ConfigValidator:
             if not isinstance(metrics, list):
                 result.add_error("monitoring_config.metrics must be a list")
             else:
-                valid_metrics = {'cpu_usage', 'memory_usage', 'network_stats', 'xdp_stats'}
                 for metric in metrics:
-                    if metric not in valid_metrics:
-                        result.add_warning(f"monitoring_config.metrics contains unknown metric: {metric}")
+                    if not _is_member(metric, _VALID_METRICS):
+                        result.add_warning("monitoring_config.metrics contains unknown metric: %s", metric)
     
     def _validate_results_config(self, results_config: Dict[str, Any], result: ValidationResult) -> None:
         """Validate results configuration section."""
-        required_fields = {'output_dir'}
-        optional_fields = {'filename_pattern', 'formats', 'include_raw_data', 'baseline_comparison'}
-        
-        self._check_required_fields(results_config, required_fields, 'results_config', result)
-        self._check_unknown_fields(results_config, required_fields | optional_fields, 'results_config', result)
+        self._check_required_fields(results_config, _RESULTS_REQUIRED, 'results_config', result)
+        self._check_unknown_fields(results_config, _RESULTS_KNOWN, 'results_config', result)
         
         # Validate output directory
         if 'output_dir' in results_config:
             output_dir = results_config['output_dir']
             if not isinstance(output_dir, str):
                 result.add_error("results_config.output_dir must be a string")
-            else:
-                # Try to create directory path to check if it's valid
-                try:
-                    Path(output_dir).resolve()
-                except (OSError, ValueError) as e:
-                    result.add_error(f"results_config.output_dir is not a valid path: {e}")
+            elif not output_dir:
+                result.add_error("results_config.output_dir cannot be empty")
+            elif '\x00' in output_dir:
+                # The only string no filesystem call accepts; whether the
+                # directory can be created is checked when results are written
+                result.add_error("results_config.output_dir is not a valid path: embedded null byte")
         
         # Validate output formats
         if 'formats' in results_config:
@@ -332,23 +532,20 @@ class ConfigValidator:
                 result.add_error("results_config.formats must be a list")
             else:
                 for fmt in formats:
-                    if fmt not in self.valid_output_formats:
-                        result.add_error(f"results_config.formats contains invalid format: {fmt}. "
-                                       f"Valid formats: {', '.join(self.valid_output_formats)}")
+                    if not _is_member(fmt, self.valid_output_formats):
+                        result.add_error("results_config.formats contains invalid format: %s. Valid formats: %s",
+                                         fmt, ', '.join(self.valid_output_formats))
     
     def _validate_xdp_config(self, xdp_config: Dict[str, Any], result: ValidationResult) -> None:
         """Validate XDP configuration section."""
-        optional_fields = {'program_path', 'mode', 'ring_buffer', 'stats'}
-        
-        self._check_unknown_fields(xdp_config, optional_fields, 'xdp_config', result)
+        self._check_unknown_fields(xdp_config, _XDP_KNOWN, 'xdp_config', result)
         
         # Validate XDP mode
         if 'mode' in xdp_config:
             mode = xdp_config['mode']
-            valid_modes = {'native', 'skb', 'hw'}
-            if mode not in valid_modes:
-                result.add_error(f"xdp_config.mode '{mode}' is not valid. "
-                               f"Valid modes: {', '.join(valid_modes)}")
+            if not _is_member(mode, _VALID_XDP_MODES):
+                result.add_error("xdp_config.mode '%s' is not valid. Valid modes: %s",
+                                 mode, ', '.join(_VALID_XDP_MODES))
         
         # Validate program path
         if 'program_path' in xdp_config:
@@ -358,149 +555,306 @@ class ConfigValidator:
     
     def _validate_performance_targets(self, targets: Dict[str, Any], result: ValidationResult) -> None:
         """Validate performance targets section."""
-        optional_fields = {
-            'min_throughput_pps', 
-            'max_cpu_usage_percent', 
-            'max_memory_usage_mb',
-            'expected_cpu_efficiency_improvement',
-            'expected_latency_reduction_percent'
-        }
-        
-        self._check_unknown_fields(targets, optional_fields, 'performance_targets', result)
-        
-        # Validate numeric targets
-        for field, value in targets.items():
-            if field in optional_fields:
-                if not isinstance(value, (int, float)) or value < 0:
-                    result.add_error(f"performance_targets.{field} must be a non-negative number")
+        self._check_unknown_fields(targets, _TARGETS_KNOWN, 'performance_targets', result)
     
     def _validate_logging_config(self, logging_config: Dict[str, Any], result: ValidationResult) -> None:
         """Validate logging configuration section."""
-        optional_fields = {'level', 'file_logging', 'console_logging', 'format'}
-        
-        self._check_unknown_fields(logging_config, optional_fields, 'logging_config', result)
+        self._check_unknown_fields(logging_config, _LOGGING_KNOWN, 'logging_config', result)
         
         # Validate log level
         if 'level' in logging_config:
             level = logging_config['level']
-            if level not in self.valid_log_levels:
-                result.add_error(f"logging_config.level '{level}' is not valid. "
-                               f"Valid levels: {', '.join(self.valid_log_levels)}")
+            if not _is_member(level, self.valid_log_levels):
+                result.add_error("logging_config.level '%s' is not valid. Valid levels: %s",
+                                 level, ', '.join(self.valid_log_levels))
     
     def _validate_presets(self, presets: Dict[str, Any], result: ValidationResult) -> None:
         """Validate presets configuration section."""
-        if not isinstance(presets, dict):
-            result.add_error("presets must be a dictionary")
-            return
-        
+        known_sections = self.known_sections
         for preset_name, preset_config in presets.items():
             if not isinstance(preset_config, dict):
-                result.add_error(f"presets.{preset_name} must be a dictionary")
+                result.add_error("presets.%s must be a dictionary", preset_name)
                 continue
             
             # Validate that preset contains valid configuration sections
             for section in preset_config.keys():
-                if section not in (self.required_sections | self.optional_sections):
-                    result.add_warning(f"presets.{preset_name}.{section} is not a known configuration section")
+                if section not in known_sections:
+                    result.add_warning("presets.%s.%s is not a known configuration section", preset_name, section)
+            
+            # Preset overrides obey the same type and range rules
+            self._validate_fields(preset_config, result, f"presets.{preset_name}.")
     
     def _validate_cross_section_consistency(self, config: Dict[str, Any], result: ValidationResult) -> None:
         """Validate consistency across configuration sections."""
         
+        # Ill-typed values were already reported; only compare usable ones
+        traffic_config = config.get('traffic_config', _EMPTY)
+        network_config = config.get('network_config', _EMPTY)
+        if not isinstance(traffic_config, dict):
+            traffic_config = _EMPTY
+        if not isinstance(network_config, dict):
+            network_config = _EMPTY
+        
         # Check thread count vs flow count consistency
-        if ('traffic_config' in config and 
-            'threads' in config['traffic_config'] and 
-            'flows' in config['traffic_config']):
-            
-            threads = config['traffic_config']['threads']
-            flows = config['traffic_config']['flows']
-            
-            if threads > flows:
-                result.add_warning(f"More threads ({threads}) than flows ({flows}) may reduce efficiency")
+        threads = traffic_config.get('threads')
+        flows = traffic_config.get('flows')
+        if type(threads) is int and type(flows) is int and threads > flows:
+            result.add_warning("More threads (%s) than flows (%s) may reduce efficiency", threads, flows)
         
         # Check if traffic ports match flow count
-        if ('traffic_config' in config and 
-            'network_config' in config and
-            'flows' in config['traffic_config'] and
-            'traffic_ports' in config['network_config']):
-            
-            flows = config['traffic_config']['flows']
-            ports = len(config['network_config']['traffic_ports'])
-            
+        traffic_ports = network_config.get('traffic_ports')
+        if type(flows) is int and isinstance(traffic_ports, list):
+            ports = len(traffic_ports)
             if flows > ports:
-                result.add_warning(f"More flows ({flows}) than traffic ports ({ports}) will cause port reuse")
+                result.add_warning("More flows (%s) than traffic ports (%d) will cause port reuse", flows, ports)
         
         # Check IP address consistency
-        if 'network_config' in config:
-            src_ip = config['network_config'].get('src_machine', {}).get('ip')
-            dst_ip = config['network_config'].get('dst_machine', {}).get('ip')
+        src_machine = network_config.get('src_machine', _EMPTY)
+        dst_machine = network_config.get('dst_machine', _EMPTY)
+        if isinstance(src_machine, Mapping) and isinstance(dst_machine, Mapping):
+            src_ip = src_machine.get('ip')
+            dst_ip = dst_machine.get('ip')
             
             if src_ip and dst_ip:
+                src_int = _ipv4_to_int(src_ip)
+                dst_int = _ipv4_to_int(dst_ip)
+                
                 if src_ip == dst_ip:
                     result.add_error("Source and destination IP addresses cannot be the same")
                 
                 # Check if they're in same subnet (basic check)
-                try:
-                    src_net = ipaddress.ip_network(f"{src_ip}/24", strict=False)
-                    dst_addr = ipaddress.ip_address(dst_ip)
-                    
-                    if dst_addr not in src_net:
+                if src_int is not None and dst_int is not None:
+                    # Same /24: the addresses agree on their top 24 bits
+                    if (src_int ^ dst_int) & 0xFFFFFF00:
                         result.add_warning("Source and destination appear to be in different subnets")
-                        
-                except ValueError:
-                    pass  # IP validation already done elsewhere
+                elif (isinstance(src_ip, str) and isinstance(dst_ip, str)
+                      and _in_different_subnets(src_ip, dst_ip)):
+                    result.add_warning("Source and destination appear to be in different subnets")
     
     def _check_required_fields(self, config: Dict[str, Any], required: Set[str], 
                              section: str, result: ValidationResult) -> None:
         """Check for required fields in a configuration section."""
-        for field in required:
-            if field not in config:
-                result.add_error(f"{section} missing required field: {field}")
+        for field in required - config.keys():
+            result.add_error("%s missing required field: %s", section, field)
     
     def _check_unknown_fields(self, config: Dict[str, Any], known: Set[str], 
                             section: str, result: ValidationResult) -> None:
         """Check for unknown fields in a configuration section."""
-        for field in config.keys():
-            if field not in known:
-                result.add_warning(f"{section} contains unknown field: {field}")
+        for field in config.keys() - known:
+            result.add_warning("%s contains unknown field: %s", section, field)
+
+
+def _schema_version_key(version: Union[str, int, float]) -> str:
+    """Normalise a schema version to its _SCHEMA_SECTIONS key.
+
+    YAML reads ``version: 1.0`` as a float; integral numbers, however
+    written, map to the integer's string. Anything else is used as given.
+    """
+    if isinstance(version, bool):
+        return str(version)
+    try:
+        number = float(version)
+    except (TypeError, ValueError):
+        return str(version).strip()
+    if number.is_integer():
+        return str(int(number))
+    return str(version).strip()
+
+
+@lru_cache(maxsize=None)
+def _schema_validator(cls: type, version: str) -> ConfigValidator:
+    """Build the validator for one schema version; see ConfigValidator.for_schema."""
+    sections = _SCHEMA_SECTIONS.get(version)
+    if sections is None:
+        raise ValueError(f"Unknown configuration schema version: {version}")
+    
+    validator = cls()
+    validator.required_sections = validator.required_sections & sections
+    validator.optional_sections = validator.optional_sections & sections
+    validator.known_sections = validator.known_sections & sections
+    validator._dispatch = tuple(entry for entry in validator._dispatch if entry[0] in sections)
+    # The compiled code is cached on the rule tuple, so versions sharing a
+    # rule set share one function
+    validator._validate_fields = _compile_field_validator(
+        tuple(rule for rule in _FIELD_RULES if rule[0][0] in sections))
+    return validator
+
+
+@lru_cache(maxsize=None)
+def _default_validator() -> ConfigValidator:
+    """Build the validator for configs that name no schema version, once."""
+    return ConfigValidator()
+
+
+_yaml_loader: Optional[type] = None
+
+
+def _get_yaml_loader() -> type:
+    """Return libyaml's CSafeLoader, falling back to the pure-Python SafeLoader."""
+    global _yaml_loader
+    if _yaml_loader is None:
+        try:
+            from yaml import CSafeLoader as loader
+        except ImportError:
+            from yaml import SafeLoader as loader
+            logging.getLogger(__name__).warning(
+                "libyaml not available, using the slower pure-Python YAML loader")
+        _yaml_loader = loader
+    return _yaml_loader
+
+
+def validate_config_data(config: Any) -> ValidationResult:
+    """Validate an already loaded configuration, by its schema version."""
+    version = config.get('version') if isinstance(config, dict) else None
+    if version is None:
+        validator = _default_validator()
+    else:
+        try:
+            validator = ConfigValidator.for_schema(version)
+        except ValueError as e:
+            # Unknown schema version
+            result = ValidationResult()
+            result.add_error("%s", e)
+            return result
+    return validator.validate_config(config)
 
 
 def validate_config_file(config_path: str) -> ValidationResult:
-    """Validate a configuration file."""
+    """Validate a configuration file.
+
+    Callers that have already loaded the file should use
+    validate_config_data() instead of having it read again.
+    """
     import yaml
     
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        # Bytes go straight to libyaml without a Python-level decode
+        with open(config_path, 'rb') as f:
+            config = yaml.load(f, Loader=_get_yaml_loader())
         
-        validator = ConfigValidator()
-        return validator.validate_config(config)
+        return validate_config_data(config)
         
     except FileNotFoundError:
-        result = ValidationResult(is_valid=False, errors=[], warnings=[])
-        result.add_error(f"Configuration file not found: {config_path}")
+        result = ValidationResult()
+        result.add_error("Configuration file not found: %s", config_path)
         return result
     except yaml.YAMLError as e:
-        result = ValidationResult(is_valid=False, errors=[], warnings=[])
-        result.add_error(f"YAML parsing error: {e}")
+        result = ValidationResult()
+        result.add_error("YAML parsing error: %s", e)
         return result
     except Exception as e:
-        result = ValidationResult(is_valid=False, errors=[], warnings=[])
-        result.add_error(f"Validation error: {e}")
+        result = ValidationResult()
+        result.add_error("Validation error: %s", e)
         return result
 
 
+def _scan_for_preset(events: Any, preset_name: str) -> Optional[bool]:
+    """Look for preset_name among the keys of the top-level ``presets`` mapping.
+
+    Consumes YAML parse events only until the answer is known. Returns None
+    when the document uses constructs that need a full load to resolve
+    (aliases or merge keys where presets are defined, non-mapping presets).
+    """
+    import yaml
+
+    # One entry per open collection: True/False for a mapping expecting a
+    # key/value next, None for a sequence
+    stack: List[Optional[bool]] = []
+    presets_key = False
+    in_presets = False
+
+    for event in events:
+        if isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            stack.pop()
+            if in_presets and len(stack) == 1:
+                return False
+            continue
+        if not isinstance(event, yaml.NodeEvent):
+            continue
+        if not stack:
+            if not isinstance(event, yaml.MappingStartEvent):
+                return None
+            stack.append(True)
+            continue
+
+        is_key = stack[-1] is True
+        if stack[-1] is not None:
+            stack[-1] = not is_key
+        depth = len(stack)
+
+        if depth == 1:
+            if is_key:
+                if isinstance(event, yaml.AliasEvent):
+                    return None
+                presets_key = isinstance(event, yaml.ScalarEvent) and event.value == 'presets'
+            elif presets_key:
+                if not isinstance(event, yaml.MappingStartEvent):
+                    return None
+                in_presets = True
+        elif depth == 2 and in_presets and is_key:
+            if not isinstance(event, yaml.ScalarEvent) or event.value == '<<':
+                return None
+            if event.value == preset_name:
+                return True
+
+        if isinstance(event, yaml.MappingStartEvent):
+            stack.append(True)
+        elif isinstance(event, yaml.SequenceStartEvent):
+            stack.append(None)
+
+    return False
+
+
+def quick_preset_check(config_path: str, preset_name: str) -> bool:
+    """Check whether a configuration file defines the given preset.
+
+    Streams the file and stops as soon as the preset is found or the
+    ``presets`` section ends, so large preset blocks are never built into
+    Python objects. Falls back to a full load when streaming cannot decide.
+    """
+    import yaml
+
+    loader = _get_yaml_loader()
+    with open(config_path, 'rb') as f:
+        # Leaving the loop early closes the generator, which stops libyaml
+        found = _scan_for_preset(yaml.parse(f, Loader=loader), preset_name)
+    if found is not None:
+        return found
+
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f, Loader=loader)
+    presets = config.get('presets') if isinstance(config, dict) else None
+    return isinstance(presets, dict) and preset_name in presets
+
+
 def main() -> int:
     """Command-line interface for configuration validation."""
     import argparse
     import sys
+    import yaml
     
     parser = argparse.ArgumentParser(description='Validate eBPF-Test configuration files')
     parser.add_argument('config_file', help='Path to configuration file')
     parser.add_argument('--strict', action='store_true', help='Treat warnings as errors')
     parser.add_argument('--quiet', action='store_true', help='Only show errors')
+    parser.add_argument('--preset', metavar='NAME',
+                        help='Only check that the file defines preset NAME (skips full validation)')
     
     args = parser.parse_args()
     
+    if args.preset:
+        try:
+            found = quick_preset_check(args.config_file, args.preset)
+        except (OSError, yaml.YAMLError) as e:
+            print(f"❌ Could not read {args.config_file}: {e}")
+            return 1
+        if found:
+            if not args.quiet:
+                print(f"✅ Preset '{args.preset}' is defined in {args.config_file}")
+            return 0
+        print(f"❌ Preset '{args.preset}' not found in {args.config_file}")
+        return 1
+    
     result = validate_config_file(args.config_file)
     
     if not args.quiet:
@@ -508,26 +862,26 @@ def main() -> int:
         print()
     
     # Print errors
-    if result.errors:
+    if not result.is_valid:
         print("❌ ERRORS:")
-        for error in result.errors:
+        for error in result.iter_errors():
             print(f"  • {error}")
         print()
     
     # Print warnings
-    if result.warnings and not args.quiet:
+    if result.has_warnings and not args.quiet:
         print("⚠️  WARNINGS:")
-        for warning in result.warnings:
+        for warning in result.iter_warnings():
             print(f"  • {warning}")
         print()
     
     # Print result
-    if result.is_valid and (not result.warnings or not args.strict):
+    if result.is_valid and (not result.has_warnings or not args.strict):
         if not args.quiet:
             print("✅ Configuration is valid!")
         return 0
     else:
-        if result.warnings and args.strict:
+        if result.has_warnings and args.strict:
             print("❌ Configuration has warnings (treating as errors due to --strict)")
         else:
             print("❌ Configuration is invalid!")
@@ -9,19 +9,74 @@ Author: eBPF-Test Project
 License: MIT
 """
 
+import itertools
 import json
+import queue
+import selectors
 import time
 import logging
 import threading
 import requests
-from typing import Dict, Any, Optional, Callable, Union, List, Protocol
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+from requests.adapters import HTTPAdapter
+from typing import Dict, Any, Optional, Callable, Union, List, Mapping, Protocol, Sequence, Tuple
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs, quote
 import socket
 import platform
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, is_dataclass
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import traceback
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(value: Any) -> Any:
+    """Encode read-only mappings (handler snapshots) and sample records.
+
+    Records with a to_dict() are encoded through it, so handlers can hand
+    them over as-is and leave the conversion to serialization.
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    to_dict = getattr(value, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Encode data as compact UTF-8 JSON, using orjson when it is installed.
+
+    Output is never indented: the stdlib only uses its C encoder for
+    compact output and falls back to pure-Python float formatting otherwise.
+    """
+    if orjson is not None:
+        # Dataclasses go through _json_default too, so their to_dict() applies
+        return orjson.dumps(data, default=_json_default,
+                            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(data, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+
+def _json_loads(data: Union[bytes, bytearray, memoryview]) -> Any:
+    """Decode UTF-8 JSON bytes; invalid input raises a ValueError subclass."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+# Per-thread scratch buffer that POST bodies are read into, grown on demand
+_body_buffers = threading.local()
+_BODY_BUFFER_MIN = 16384
+
 
 # Custom Exception Classes
 class CoordinationError(Exception):
@@ -41,7 +96,10 @@ class ValidationError(CoordinationError):
 
 class APIError(CoordinationError):
     """API-related errors."""
-    pass
+    
+    def __init__(self, message: str, status_code: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
 
 
 # Protocol for coordination handlers
@@ -49,12 +107,12 @@ class CoordinationHandlerProtocol(Protocol):
     """Protocol defining the interface for coordination handlers."""
     
     def get_status(self) -> Dict[str, Any]: ...
-    def get_config(self) -> Dict[str, Any]: ...
+    def get_config(self) -> Mapping[str, Any]: ...
     def update_config(self, config: Dict[str, Any]) -> bool: ...
     def start_test(self, test_params: Dict[str, Any]) -> bool: ...
     def stop_test(self, stop_params: Dict[str, Any]) -> Dict[str, Any]: ...
-    def get_results(self) -> Dict[str, Any]: ...
-    def get_metrics(self) -> Dict[str, Any]: ...
+    def get_results(self) -> Mapping[str, Any]: ...
+    def get_metrics(self) -> Mapping[str, Any]: ...
 
 
 @dataclass(frozen=True)
@@ -68,6 +126,8 @@ class APIEndpoints:
     stop_test: str = '/stop_test'
     results: str = '/results'
     metrics: str = '/metrics'
+    ready: str = '/ready'
+    bulk: str = '/bulk'
 
 
 @dataclass
@@ -92,6 +152,16 @@ class HealthInfo:
         }
 
 
+_MISSING = object()
+_NUMBER_TYPES = (int, float)
+
+# Machine facts that cannot change while the process runs, probed once per
+# process however many servers are created
+_hostname = lru_cache(maxsize=None)(socket.gethostname)
+_platform = lru_cache(maxsize=None)(platform.platform)
+_python_version = lru_cache(maxsize=None)(platform.python_version)
+
+
 class InputValidator:
     """Input validation utilities."""
     
@@ -101,17 +171,21 @@ class InputValidator:
         if not isinstance(params, dict):
             raise ValidationError("Test parameters must be a dictionary")
         
+        # One lookup per field; checks run in the order errors are reported
+        duration = params.get('duration', _MISSING)
+        packet_rate = params.get('packet_rate', _MISSING)
+        
         # Check for required fields
-        required_fields = ['duration', 'packet_rate']
-        for field in required_fields:
-            if field not in params:
-                raise ValidationError(f"Missing required field: {field}")
+        if duration is _MISSING:
+            raise ValidationError("Missing required field: duration")
+        if packet_rate is _MISSING:
+            raise ValidationError("Missing required field: packet_rate")
         
         # Validate data types and ranges
-        if not isinstance(params['duration'], (int, float)) or params['duration'] <= 0:
+        if not isinstance(duration, _NUMBER_TYPES) or duration <= 0:
             raise ValidationError("Duration must be a positive number")
         
-        if not isinstance(params['packet_rate'], (int, float)) or params['packet_rate'] <= 0:
+        if not isinstance(packet_rate, _NUMBER_TYPES) or packet_rate <= 0:
             raise ValidationError("Packet rate must be a positive number")
     
     @staticmethod
@@ -124,23 +198,179 @@ class InputValidator:
         # This can be expanded based on your configuration schema
 
 
+# Gathered writes (writev-style) are not available on Windows
+_HAVE_SENDMSG = hasattr(socket.socket, 'sendmsg')
+
+
+class _PooledHTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server that runs requests on a fixed-size thread pool.
+
+    ThreadingHTTPServer starts a new thread per request; the pool reuses a
+    bounded set of workers instead. The serving thread runs one selector
+    (epoll on Linux) over the listening socket and every idle persistent
+    connection, so a connection only occupies a worker while a request on
+    it is being handled; between requests it waits in the selector.
+    """
+    
+    # Idle persistent connections are closed after this many seconds
+    IDLE_TIMEOUT = 60.0
+    
+    # Listen backlog; the default of 5 drops SYNs under a burst of polls
+    request_queue_size = 128
+    
+    def __init__(self, server_address: Tuple[str, int], handler_class: type,
+                 max_workers: Optional[int] = None) -> None:
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='coord')
+        self._selector = selectors.DefaultSelector()
+        # Workers hand idle connections back through this queue; writing to
+        # the wake socket interrupts select() so the serving thread, which
+        # owns the selector, registers them
+        self._idle_queue: 'queue.SimpleQueue[Tuple[socket.socket, Tuple[str, int]]]' = queue.SimpleQueue()
+        self._idle_deadlines: Dict[socket.socket, float] = {}
+        self._wake_recv, self._wake_send = socket.socketpair()
+        self._wake_recv.setblocking(False)
+        self._wake_send.setblocking(False)
+        self._stopping = threading.Event()
+        self._stopped = threading.Event()
+        self._stopped.set()
+        try:
+            super().__init__(server_address, handler_class)
+        except BaseException:
+            self._selector.close()
+            self._wake_recv.close()
+            self._wake_send.close()
+            raise
+    
+    def serve_forever(self, poll_interval: float = 0.5) -> None:
+        """Accept connections and dispatch readable ones until shutdown()."""
+        self._stopped.clear()
+        selector = self._selector
+        selector.register(self.socket, selectors.EVENT_READ, self.socket)
+        selector.register(self._wake_recv, selectors.EVENT_READ, self._wake_recv)
+        try:
+            while not self._stopping.is_set():
+                for key, _ in selector.select(poll_interval):
+                    if key.data is self.socket:
+                        self._handle_request_noblock()
+                    elif key.data is self._wake_recv:
+                        self._register_idle()
+                    else:
+                        # Next request on an idle connection has arrived
+                        selector.unregister(key.fileobj)
+                        del self._idle_deadlines[key.fileobj]
+                        self.pool.submit(self._serve_connection, key.fileobj, key.data)
+                self._close_expired()
+        finally:
+            selector.unregister(self.socket)
+            selector.unregister(self._wake_recv)
+            self._stopped.set()
+    
+    def shutdown(self) -> None:
+        """Stop serve_forever() and wait for it to return."""
+        self._stopping.set()
+        self._wake()
+        self._stopped.wait()
+    
+    def server_close(self) -> None:
+        """Close the listening socket and every idle connection."""
+        super().server_close()
+        self._register_idle()
+        for sock in list(self._idle_deadlines):
+            self._selector.unregister(sock)
+            self.shutdown_request(sock)
+        self._idle_deadlines.clear()
+        self._selector.close()
+        self._wake_recv.close()
+        self._wake_send.close()
+    
+    def process_request(self, request: socket.socket, client_address: Tuple[str, int]) -> None:
+        """Queue the request for a pool worker."""
+        self.pool.submit(self._serve_connection, request, client_address)
+    
+    def _serve_connection(self, request: socket.socket, client_address: Tuple[str, int]) -> None:
+        """Handle the requests that are ready on a connection, then park or close it."""
+        keep_open = False
+        try:
+            keep_open = self.RequestHandlerClass(request, client_address, self).keep_open
+        except Exception:
+            self.handle_error(request, client_address)
+        
+        if keep_open and not self._stopping.is_set():
+            self._idle_queue.put((request, client_address))
+            self._wake()
+        else:
+            self.shutdown_request(request)
+    
+    def _wake(self) -> None:
+        """Interrupt the serving thread's select()."""
+        try:
+            self._wake_send.send(b'\0')
+        except OSError:
+            # Buffer full (a wake-up is already pending) or already closed
+            pass
+    
+    def _register_idle(self) -> None:
+        """Drain wake-ups and start watching connections handed back by workers."""
+        try:
+            while self._wake_recv.recv(4096):
+                pass
+        except OSError:
+            pass
+        
+        deadline = time.monotonic() + self.IDLE_TIMEOUT
+        while True:
+            try:
+                sock, client_address = self._idle_queue.get_nowait()
+            except queue.Empty:
+                break
+            self._selector.register(sock, selectors.EVENT_READ, client_address)
+            self._idle_deadlines[sock] = deadline
+    
+    def _close_expired(self) -> None:
+        """Close idle connections that have outlived IDLE_TIMEOUT."""
+        if not self._idle_deadlines:
+            return
+        now = time.monotonic()
+        for sock, deadline in list(self._idle_deadlines.items()):
+            if deadline <= now:
+                self._selector.unregister(sock)
+                del self._idle_deadlines[sock]
+                self.shutdown_request(sock)
+
+
 class CoordinationServer:
-    """HTTP server for handling coordination requests."""
+    """HTTP server for handling coordination requests.
+
+    Requests are served concurrently, so a slow handler (e.g. stop_test
+    collecting results) does not hold up health probes or metrics polls.
+    """
     
     def __init__(
         self, 
         host: str = '0.0.0.0', 
         port: int = 8080, 
-        coordination_handler: Optional[CoordinationHandlerProtocol] = None
+        coordination_handler: Optional[CoordinationHandlerProtocol] = None,
+        max_workers: Optional[int] = None
     ) -> None:
         self.host = host
         self.port = port
         self.coordination_handler = coordination_handler
-        self.server: Optional[HTTPServer] = None
+        # None uses the executor default, min(32, cpu_count + 4): handlers
+        # mostly wait on sockets, so the pool should outnumber the CPUs
+        self.max_workers = max_workers
+        self.server: Optional[_PooledHTTPServer] = None
         self.server_thread: Optional[threading.Thread] = None
         self.running = False
         self.endpoints = APIEndpoints()
         
+        # Fixed for the life of the process; platform.platform() in
+        # particular is slow enough to keep out of the request path
+        self.machine_info = {
+            'hostname': _hostname(),
+            'platform': _platform(),
+            'python_version': _python_version()
+        }
+        
         # Setup logging
         self.logger = logging.getLogger(f"{__name__}.CoordinationServer")
         
@@ -158,11 +388,16 @@ class CoordinationServer:
                 {
                     'coordination_handler': self.coordination_handler,
                     'endpoints': self.endpoints,
-                    'logger': self.logger
+                    '_get_dispatch': _route_table(self.endpoints, CoordinationRequestHandler._GET_ROUTES),
+                    '_post_dispatch': _route_table(self.endpoints, CoordinationRequestHandler._POST_ROUTES),
+                    'logger': self.logger,
+                    'machine_info': self.machine_info,
+                    '_response_cache': {},
+                    '_cache_lock': threading.Lock()
                 }
             )
             
-            self.server = HTTPServer((self.host, self.port), handler_class)
+            self.server = _PooledHTTPServer((self.host, self.port), handler_class, self.max_workers)
             self.server_thread = threading.Thread(
                 target=self.server.serve_forever,
                 name=f"CoordinationServer-{self.host}:{self.port}"
@@ -191,6 +426,8 @@ class CoordinationServer:
         try:
             if self.server:
                 self.server.shutdown()
+                # Let in-flight requests finish before closing the socket
+                self.server.pool.shutdown(wait=True)
                 self.server.server_close()
                 
             if self.server_thread and self.server_thread.is_alive():
@@ -208,6 +445,11 @@ class CoordinationServer:
         return self.running
 
 
+def _route_table(endpoints: APIEndpoints, routes: Dict[str, Any]) -> Dict[str, Any]:
+    """Key routes by the request paths that endpoints assigns to them."""
+    return {getattr(endpoints, name): route for name, route in routes.items()}
+
+
 class CoordinationRequestHandler(BaseHTTPRequestHandler):
     """HTTP request handler for coordination API."""
     
@@ -215,6 +457,97 @@ class CoordinationRequestHandler(BaseHTTPRequestHandler):
     coordination_handler: Optional[CoordinationHandlerProtocol] = None
     endpoints: APIEndpoints = APIEndpoints()
     logger: Optional[logging.Logger] = None
+    machine_info: Dict[str, str] = {}
+    
+    # Endpoint field -> GET handler method and whether it takes the parsed
+    # query string; only handlers that need it pay for parse_qs
+    _GET_ROUTES: Dict[str, Tuple[str, bool]] = {
+        'health': ('_handle_health_check', False),
+        'status': ('_handle_status_request', False),
+        'config': ('_handle_config_request', False),
+        'results': ('_handle_results_request', False),
+        'metrics': ('_handle_metrics_request', False),
+        'ready': ('_handle_ready_request', True),
+        'bulk': ('_handle_bulk_request', True),
+    }
+    # Endpoint field -> POST handler method, called with the decoded body
+    _POST_ROUTES: Dict[str, str] = {
+        'config': '_handle_config_update',
+        'start_test': '_handle_start_test',
+        'stop_test': '_handle_stop_test',
+    }
+    
+    # Keys /bulk can combine -> coordination handler getter; 'health' is
+    # answered by the server itself
+    _BULK_GETTERS: Dict[str, str] = {
+        'status': 'get_status',
+        'config': 'get_config',
+        'results': 'get_results',
+        'metrics': 'get_metrics',
+    }
+    
+    # Request path -> route, resolved once from endpoints
+    _get_dispatch = _route_table(endpoints, _GET_ROUTES)
+    _post_dispatch = _route_table(endpoints, _POST_ROUTES)
+    
+    # Encoded GET responses by endpoint: key -> (expiry, body). Each server
+    # gets its own cache; handlers run on several threads, hence the lock.
+    _response_cache: Dict[str, Tuple[float, bytes]] = {}
+    _cache_lock = threading.Lock()
+    
+    # Seconds a cached GET response stays valid
+    HEALTH_TTL = 1.0
+    STATUS_TTL = 0.25
+    CONFIG_TTL = 1.0
+    METRICS_TTL = 0.25
+    
+    # Longest a /ready request may block waiting for the handler, in seconds.
+    # Clients simply ask again; keeping it short bounds how long stop() waits
+    # for parked long-polls to drain.
+    READY_MAX_WAIT = 5.0
+    
+    # Seconds a worker waits on a stalled client before giving up on it
+    timeout = 30.0
+    
+    # Keep connections open between requests so polling clients reuse one
+    # TCP connection; the base class still honours "Connection: close" and
+    # HTTP/1.0 clients
+    protocol_version = "HTTP/1.1"
+    
+    # Set by handle() when the connection stays open for further requests
+    keep_open = False
+    
+    # Buffer writes so status line, headers and body leave in one send;
+    # the base class flushes wfile once the request has been handled.
+    # Only the base class's own error pages still use wfile; JSON responses
+    # are written by _send_json_body.
+    wbufsize = -1
+    
+    def handle(self) -> None:
+        """Handle the requests already sent on this connection.
+
+        Unlike the base class, this does not block waiting for the next
+        request on a persistent connection: it sets keep_open and returns,
+        and the server hands the connection to a worker again once more
+        data arrives.
+        """
+        self.handle_one_request()
+        while not self.close_connection:
+            if not self._request_pending():
+                self.keep_open = True
+                return
+            self.handle_one_request()
+    
+    def _request_pending(self) -> bool:
+        """Return True if bytes of another request are already available."""
+        self.connection.setblocking(False)
+        try:
+            # Returns buffered bytes, or reads what the kernel holds, never blocks
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.connection.settimeout(self.timeout)
     
     def log_message(self, format: str, *args) -> None:
         """Override to use proper logging."""
@@ -224,21 +557,20 @@ class CoordinationRequestHandler(BaseHTTPRequestHandler):
     def do_GET(self) -> None:
         """Handle GET requests."""
         try:
-            path = urlparse(self.path).path
-            query_params = parse_qs(urlparse(self.path).query)
+            raw = self.path
+            q = raw.find('?')
+            path = raw if q < 0 else raw[:q]
+            route = self._get_dispatch.get(path)
             
-            if path == self.endpoints.health:
-                self._handle_health_check()
-            elif path == self.endpoints.status:
-                self._handle_status_request()
-            elif path == self.endpoints.config:
-                self._handle_config_request()
-            elif path == self.endpoints.results:
-                self._handle_results_request()
-            elif path == self.endpoints.metrics:
-                self._handle_metrics_request()
-            else:
+            if route is None:
                 self._send_error(404, f"Endpoint not found: {path}")
+                return
+            
+            method_name, needs_query = route
+            if needs_query:
+                getattr(self, method_name)(parse_qs(raw[q + 1:]) if q >= 0 else {})
+            else:
+                getattr(self, method_name)()
                 
         except Exception as e:
             self._log_error("GET request failed", e)
@@ -247,32 +579,43 @@ class CoordinationRequestHandler(BaseHTTPRequestHandler):
     def do_POST(self) -> None:
         """Handle POST requests."""
         try:
-            path = urlparse(self.path).path
+            raw = self.path
+            q = raw.find('?')
+            path = raw if q < 0 else raw[:q]
             content_length = int(self.headers.get('Content-Length', 0))
             
             if content_length > 1_000_000:  # 1MB limit
+                # The body stays unread, so the connection cannot be reused
+                self.close_connection = True
                 self._send_error(413, "Request entity too large")
                 return
+            if content_length < 0:
+                self.close_connection = True
+                self._send_error(400, "Invalid Content-Length")
+                return
             
-            post_data = self.rfile.read(content_length)
+            # Read into this worker's reusable buffer instead of a new bytes
+            # object; the JSON decoder only borrows the view
+            buffer = getattr(_body_buffers, 'buffer', None)
+            if buffer is None or len(buffer) < content_length:
+                buffer = _body_buffers.buffer = bytearray(max(content_length, _BODY_BUFFER_MIN))
+            view = memoryview(buffer)[:content_length]
+            post_data = view[:self.rfile.readinto(view)]
             
             try:
-                data = json.loads(post_data.decode('utf-8')) if post_data else {}
-            except json.JSONDecodeError as e:
-                self._send_error(400, f"Invalid JSON data: {e}")
-                return
+                data = _json_loads(post_data) if post_data else {}
             except UnicodeDecodeError as e:
                 self._send_error(400, f"Invalid UTF-8 encoding: {e}")
                 return
+            except ValueError as e:
+                self._send_error(400, f"Invalid JSON data: {e}")
+                return
             
-            if path == self.endpoints.config:
-                self._handle_config_update(data)
-            elif path == self.endpoints.start_test:
-                self._handle_start_test(data)
-            elif path == self.endpoints.stop_test:
-                self._handle_stop_test(data)
-            else:
+            method_name = self._post_dispatch.get(path)
+            if method_name is None:
                 self._send_error(404, f"Endpoint not found: {path}")
+            else:
+                getattr(self, method_name)(data)
                 
         except Exception as e:
             self._log_error("POST request failed", e)
@@ -281,18 +624,72 @@ class CoordinationRequestHandler(BaseHTTPRequestHandler):
     def _handle_health_check(self) -> None:
         """Handle health check requests."""
         try:
-            health_info = HealthInfo(
-                status='healthy',
-                timestamp=time.time(),
-                hostname=socket.gethostname(),
-                platform=platform.platform(),
-                python_version=platform.python_version()
-            )
-            self._send_json_response(health_info.to_dict())
+            body = self._cached_json('health', self.HEALTH_TTL, self._health_info)
+            self._send_json_body(body)
         except Exception as e:
             self._log_error("Health check failed", e)
             self._send_error(500, f"Health check failed: {e}")
     
+    def _health_info(self) -> Dict[str, Any]:
+        """Build the health check response."""
+        return HealthInfo(
+            status='healthy',
+            timestamp=time.time(),
+            **self.machine_info
+        ).to_dict()
+    
+    def _handle_bulk_request(self, query_params: Dict[str, List[str]]) -> None:
+        """Handle compound polls such as /bulk?keys=health,status,metrics.
+
+        Answers one object mapping each requested key to what its own
+        endpoint would return, so a control loop polls in one round trip.
+        """
+        keys = [key for value in query_params.get('keys', []) for key in value.split(',') if key]
+        if not keys:
+            self._send_error(400, "keys parameter is required")
+            return
+        
+        unknown = [key for key in keys if key != 'health' and key not in self._BULK_GETTERS]
+        if unknown:
+            self._send_error(400, f"Unknown bulk keys: {', '.join(unknown)}")
+            return
+        
+        if not self.coordination_handler and any(key != 'health' for key in keys):
+            self._send_error(503, "Coordination handler not available")
+            return
+        
+        try:
+            response: Dict[str, Any] = {}
+            for key in keys:
+                if key == 'health':
+                    response[key] = self._health_info()
+                else:
+                    response[key] = getattr(self.coordination_handler, self._BULK_GETTERS[key])()
+            self._send_json_response(response)
+        except Exception as e:
+            self._log_error("Bulk request failed", e)
+            self._send_error(500, f"Bulk request failed: {e}")
+    
+    def _handle_ready_request(self, query_params: Dict[str, List[str]]) -> None:
+        """Handle readiness long-polls.
+
+        Blocks for up to ?timeout= seconds until the coordination handler
+        can accept a test, then answers {'ready': bool}. Handlers without a
+        ready_event are ready as soon as the server answers.
+        """
+        try:
+            timeout = float(query_params.get('timeout', ['0'])[0])
+        except ValueError:
+            self._send_error(400, "timeout must be a number")
+            return
+        
+        ready_event = getattr(self.coordination_handler, 'ready_event', None)
+        if ready_event is None:
+            ready = True
+        else:
+            ready = ready_event.wait(min(max(timeout, 0.0), self.READY_MAX_WAIT))
+        self._send_json_response({'ready': ready})
+    
     def _handle_status_request(self) -> None:
         """Handle status requests."""
         if not self.coordination_handler:
@@ -300,8 +697,8 @@ class CoordinationRequestHandler(BaseHTTPRequestHandler):
             return
         
         try:
-            status = self.coordination_handler.get_status()
-            self._send_json_response(status)
+            body = self._cached_json('status', self.STATUS_TTL, self.coordination_handler.get_status)
+            self._send_json_body(body)
         except Exception as e:
             self._log_error("Status request failed", e)
             self._send_error(500, f"Status request failed: {e}")
@@ -313,8 +710,8 @@ class CoordinationRequestHandler(BaseHTTPRequestHandler):
             return
         
         try:
-            config = self.coordination_handler.get_config()
-            self._send_json_response(config)
+            body = self._cached_json('config', self.CONFIG_TTL, self.coordination_handler.get_config)
+            self._send_json_body(body)
         except Exception as e:
             self._log_error("Config request failed", e)
             self._send_error(500, f"Config request failed: {e}")
@@ -328,6 +725,7 @@ class CoordinationRequestHandler(BaseHTTPRequestHandler):
         try:
             InputValidator.validate_config(data)
             success = self.coordination_handler.update_config(data)
+            self._invalidate_cached('config', 'status')
             
             if success:
                 self._send_json_response({'status': 'config updated'})
@@ -349,6 +747,7 @@ class CoordinationRequestHandler(BaseHTTPRequestHandler):
         try:
             InputValidator.validate_test_params(data)
             success = self.coordination_handler.start_test(data)
+            self._invalidate_cached('status', 'metrics')
             
             if success:
                 self._send_json_response({'status': 'test started'})
@@ -369,6 +768,7 @@ class CoordinationRequestHandler(BaseHTTPRequestHandler):
         
         try:
             results = self.coordination_handler.stop_test(data)
+            self._invalidate_cached('status', 'metrics')
             self._send_json_response({'status': 'test stopped', 'results': results})
         except Exception as e:
             self._log_error("Stop test failed", e)
@@ -394,46 +794,85 @@ class CoordinationRequestHandler(BaseHTTPRequestHandler):
             return
         
         try:
-            metrics = self.coordination_handler.get_metrics()
-            self._send_json_response(metrics)
+            body = self._cached_json('metrics', self.METRICS_TTL, self.coordination_handler.get_metrics)
+            self._send_json_body(body)
         except Exception as e:
             self._log_error("Metrics request failed", e)
             self._send_error(500, f"Metrics request failed: {e}")
     
-    def _send_json_response(self, data: Dict[str, Any], status_code: int = 200) -> None:
+    def _cached_json(self, key: str, ttl: float, producer: Callable[[], Mapping[str, Any]]) -> bytes:
+        """Return the encoded response for key, rebuilding it once ttl has passed."""
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        
+        body = _json_dumps(producer())
+        with self._cache_lock:
+            self._response_cache[key] = (now + ttl, body)
+        return body
+    
+    def _invalidate_cached(self, *keys: str) -> None:
+        """Drop cached responses that a state change has made stale."""
+        with self._cache_lock:
+            for key in keys:
+                self._response_cache.pop(key, None)
+    
+    def _send_json_response(self, data: Mapping[str, Any], status_code: int = 200) -> None:
         """Send JSON response."""
         try:
-            response_data = json.dumps(data, indent=2)
-            
-            self.send_response(status_code)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Content-Length', str(len(response_data)))
-            self.end_headers()
-            self.wfile.write(response_data.encode('utf-8'))
-            
+            response_data = _json_dumps(data)
         except Exception as e:
             self._log_error("Failed to send JSON response", e)
             self._send_error(500, "Failed to serialize response")
+            return
+        
+        self._send_json_body(response_data, status_code)
+    
+    def _send_json_body(self, body: bytes, status_code: int = 200) -> None:
+        """Send an already encoded JSON response.
+
+        The head is formatted in one step and sent together with the body
+        straight on the socket, without copying the body into wfile.
+        """
+        self.log_request(status_code)
+        phrase = self.responses.get(status_code, ('',))[0]
+        head = (
+            f"{self.protocol_version} {status_code} {phrase}\r\n"
+            f"Server: {self.version_string()}\r\n"
+            f"Date: {self.date_time_string()}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'close' if self.close_connection else 'keep-alive'}\r\n\r\n"
+        ).encode('latin-1', 'strict')
+        self._send_parts(head, body)
+    
+    def _send_parts(self, *parts: bytes) -> None:
+        """Write parts to the connection with gathered sends."""
+        if not _HAVE_SENDMSG:
+            self.connection.sendall(b''.join(parts))
+            return
+        
+        views = [memoryview(part) for part in parts if part]
+        while views:
+            sent = self.connection.sendmsg(views)
+            # Drop what went out; a partial send resumes mid-part
+            while views and sent >= len(views[0]):
+                sent -= len(views[0])
+                views.pop(0)
+            if sent:
+                views[0] = views[0][sent:]
     
     def _send_error(self, status_code: int, message: str) -> None:
         """Send error response."""
-        try:
-            error_data = {
-                'error': message,
-                'status_code': status_code,
-                'timestamp': time.time()
-            }
-            response_data = json.dumps(error_data, indent=2)
-            
-            self.send_response(status_code)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Content-Length', str(len(response_data)))
-            self.end_headers()
-            self.wfile.write(response_data.encode('utf-8'))
-            
-        except Exception as e:
-            # Fallback to basic HTTP error
-            self.send_error(status_code, message)
+        # A str, an int and a float always encode, so no fallback is needed
+        error_data = {
+            'error': message,
+            'status_code': status_code,
+            'timestamp': time.time()
+        }
+        self._send_json_body(_json_dumps(error_data), status_code)
     
     def _log_error(self, message: str, exception: Exception) -> None:
         """Log error with traceback."""
@@ -445,6 +884,13 @@ class CoordinationRequestHandler(BaseHTTPRequestHandler):
 class CoordinationClient:
     """HTTP client for coordination requests."""
     
+    # Connections kept open to the remote machine
+    POOL_MAXSIZE = 32
+    
+    # wait_for_ready backoff: first delay and cap, in seconds
+    READY_POLL_INITIAL = 0.1
+    READY_POLL_MAX = 2.0
+    
     def __init__(
         self, 
         remote_host: str, 
@@ -466,30 +912,38 @@ class CoordinationClient:
             'Content-Type': 'application/json',
             'User-Agent': 'eBPF-Test-Coordination-Client/1.0'
         })
+        
+        # All requests go to one host: keep enough idle connections for
+        # concurrent callers so polls reuse them instead of reconnecting
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_MAXSIZE)
+        self.session.mount('http://', adapter)
     
     def _make_request(
         self, 
         method: str, 
         endpoint: str, 
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        timeout: Optional[float] = None
     ) -> Dict[str, Any]:
         """Make HTTP request with error handling."""
         url = f"{self.base_url}{endpoint}"
+        if timeout is None:
+            timeout = self.timeout
         
         try:
             if method.upper() == 'GET':
-                response = self.session.get(url, timeout=self.timeout)
+                response = self.session.get(url, timeout=timeout)
             elif method.upper() == 'POST':
-                json_data = json.dumps(data) if data else None
-                response = self.session.post(url, data=json_data, timeout=self.timeout)
+                json_data = _json_dumps(data) if data else None
+                response = self.session.post(url, data=json_data, timeout=timeout)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
             response.raise_for_status()
             
             try:
-                return response.json()
-            except json.JSONDecodeError as e:
+                return _json_loads(response.content)
+            except ValueError as e:
                 raise APIError(f"Invalid JSON response: {e}")
             
         except requests.exceptions.ConnectionError as e:
@@ -497,7 +951,9 @@ class CoordinationClient:
         except requests.exceptions.Timeout as e:
             raise NetworkError(f"Request timeout to {url}: {e}")
         except requests.exceptions.HTTPError as e:
-            raise APIError(f"HTTP error {response.status_code}: {e}")
+            raise APIError(f"HTTP error {response.status_code}: {e}", response.status_code)
+        except APIError:
+            raise
         except Exception as e:
             raise CoordinationError(f"Request failed: {e}")
     
@@ -545,20 +1001,55 @@ class CoordinationClient:
         """Get metrics from remote machine."""
         return self._make_request('GET', self.endpoints.metrics)
     
+    def get_bulk(self, keys: Sequence[str]) -> Dict[str, Any]:
+        """Fetch several of health/status/config/results/metrics in one request.
+
+        Returns a dict keyed by the requested names.
+        """
+        return self._make_request('GET', f"{self.endpoints.bulk}?keys={quote(','.join(keys), safe=',')}")
+    
     def wait_for_ready(self, max_wait_time: int = 60) -> bool:
-        """Wait for remote machine to be ready."""
-        start_time = time.time()
+        """Wait for remote machine to be ready.
+
+        Long-polls the server's ready endpoint, which answers as soon as the
+        remote handler can accept a test. Servers without that endpoint are
+        polled on the health endpoint instead. Connection failures (server
+        not up yet) are retried with backoff either way.
+        """
+        deadline = time.monotonic() + max_wait_time
+        delay = self.READY_POLL_INITIAL
+        long_poll = True
         
-        while time.time() - start_time < max_wait_time:
+        while True:
             try:
-                health = self.check_health()
-                if health.get('status') == 'healthy':
+                if long_poll:
+                    remaining = max(deadline - time.monotonic(), 0.0)
+                    response = self._make_request(
+                        'GET', f"{self.endpoints.ready}?timeout={remaining:.3f}",
+                        timeout=remaining + self.timeout)
+                    ready = response.get('ready') is True
+                else:
+                    ready = self.check_health().get('status') == 'healthy'
+                
+                if ready:
                     self.logger.info(f"Remote machine {self.remote_host} is ready")
                     return True
-            except (NetworkError, APIError) as e:
+            except APIError as e:
+                if long_poll and e.status_code == 404:
+                    # Older server: fall back to polling its health endpoint
+                    long_poll = False
+                    continue
+                self.logger.debug(f"Waiting for remote machine: {e}")
+            except NetworkError as e:
                 self.logger.debug(f"Waiting for remote machine: {e}")
             
-            time.sleep(2)
+            # Poll quickly at first so a machine that is nearly up is seen
+            # at once, backing off towards READY_POLL_MAX
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.READY_POLL_MAX)
         
         self.logger.error(f"Remote machine {self.remote_host} not ready after {max_wait_time}s")
         return False
@@ -572,12 +1063,74 @@ class CoordinationClient:
 class CoordinationHandler:
     """Base class for coordination handlers."""
     
+    # Statuses in which the handler cannot accept a new test
+    BUSY_STATUSES = frozenset({'running'})
+    
     def __init__(self) -> None:
         self.logger = logging.getLogger(f"{__name__}.CoordinationHandler")
+        # Set while the handler can accept a test; /ready requests wait on it
+        self.ready_event = threading.Event()
         self.status = "idle"
-        self.config: Dict[str, Any] = {}
-        self.results: Dict[str, Any] = {}
-        self.metrics: Dict[str, Any] = {}
+        # config, results and metrics are published as (version, read-only
+        # snapshot) pairs that writers replace wholesale, so readers on
+        # server threads never lock or see a half-applied update. The write
+        # lock only keeps concurrent merges from losing each other's keys.
+        self._versions = itertools.count(1)
+        self._write_lock = threading.Lock()
+        self._config_ref: Tuple[int, Mapping[str, Any]] = (0, MappingProxyType({}))
+        self._results_ref: Tuple[int, Mapping[str, Any]] = (0, MappingProxyType({}))
+        self._metrics_ref: Tuple[int, Mapping[str, Any]] = (0, MappingProxyType({}))
+    
+    def _publish(self, name: str, values: Dict[str, Any]) -> None:
+        """Swap in a new snapshot for name; values must not be mutated afterwards."""
+        setattr(self, name, (next(self._versions), MappingProxyType(values)))
+    
+    def _merge(self, name: str, values: Mapping[str, Any]) -> None:
+        """Publish the current snapshot for name updated with values."""
+        with self._write_lock:
+            merged = dict(getattr(self, name)[1])
+            merged.update(values)
+            self._publish(name, merged)
+    
+    @property
+    def config(self) -> Mapping[str, Any]:
+        """Read-only snapshot of the current configuration."""
+        return self._config_ref[1]
+    
+    @config.setter
+    def config(self, value: Mapping[str, Any]) -> None:
+        self._publish('_config_ref', dict(value))
+    
+    @property
+    def results(self) -> Mapping[str, Any]:
+        """Read-only snapshot of the latest test results."""
+        return self._results_ref[1]
+    
+    @results.setter
+    def results(self, value: Mapping[str, Any]) -> None:
+        self._publish('_results_ref', dict(value))
+    
+    @property
+    def metrics(self) -> Mapping[str, Any]:
+        """Read-only snapshot of the base metrics."""
+        return self._metrics_ref[1]
+    
+    @metrics.setter
+    def metrics(self, value: Mapping[str, Any]) -> None:
+        self._publish('_metrics_ref', dict(value))
+    
+    @property
+    def status(self) -> str:
+        """Current status; assigning it also updates ready_event."""
+        return self._status
+    
+    @status.setter
+    def status(self, value: str) -> None:
+        self._status = value
+        if value in self.BUSY_STATUSES:
+            self.ready_event.clear()
+        else:
+            self.ready_event.set()
     
     def get_status(self) -> Dict[str, Any]:
         """Get current status."""
@@ -587,14 +1140,14 @@ class CoordinationHandler:
             'machine_type': self.__class__.__name__
         }
     
-    def get_config(self) -> Dict[str, Any]:
-        """Get current configuration."""
-        return self.config.copy()
+    def get_config(self) -> Mapping[str, Any]:
+        """Get current configuration as a read-only snapshot."""
+        return self._config_ref[1]
     
     def update_config(self, config: Dict[str, Any]) -> bool:
         """Update configuration."""
         try:
-            self.config.update(config)
+            self._merge('_config_ref', config)
             self.logger.info("Configuration updated")
             return True
         except Exception as e:
@@ -611,13 +1164,17 @@ class CoordinationHandler:
         self.logger.warning("stop_test not implemented")
         return {}
     
-    def get_results(self) -> Dict[str, Any]:
-        """Get test results."""
-        return self.results.copy()
+    def update_results(self, results: Mapping[str, Any]) -> None:
+        """Merge results into the published test results."""
+        self._merge('_results_ref', results)
     
-    def get_metrics(self) -> Dict[str, Any]:
-        """Get performance metrics."""
-        return self.metrics.copy()
+    def get_results(self) -> Mapping[str, Any]:
+        """Get test results as a read-only snapshot."""
+        return self._results_ref[1]
+    
+    def get_metrics(self) -> Mapping[str, Any]:
+        """Get performance metrics as a read-only snapshot."""
+        return self._metrics_ref[1]
 
 
 def setup_coordination_logging(log_level: str = "INFO") -> None:
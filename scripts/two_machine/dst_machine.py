@@ -18,8 +18,15 @@ License: MIT
 
 import os
 import sys
+import copy
+import ctypes
+import importlib.util
+import errno
 import time
 import json
+import re
+import selectors
+import shutil
 import yaml
 import signal
 import logging
@@ -28,13 +35,20 @@ import threading
 import argparse
 import subprocess
 import psutil
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple, Union
-from dataclasses import dataclass, asdict
+from functools import lru_cache
+from typing import Deque, Dict, Any, Iterable, List, Optional, Tuple, Union
+from dataclasses import dataclass
 from pathlib import Path
-import statistics
 import traceback
 
+# libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Import coordination module
 try:
     from coordination import (
@@ -54,11 +68,11 @@ except ImportError:
 
 # Import configuration validation
 try:
-    from config_validator import ConfigValidator, validate_config_file
+    from config_validator import ConfigValidator, validate_config_data
 except ImportError:
     print("Warning: config_validator.py not found, using basic validation")
     ConfigValidator = None
-    validate_config_file = None
+    validate_config_data = None
 
 
 # Custom Exception Classes
@@ -82,7 +96,138 @@ class ConfigurationError(Exception):
     pass
 
 
-@dataclass
+# Sample records are kept by the thousand in history: drop the per-instance
+# __dict__ where dataclasses support it (Python 3.10+)
+_SAMPLE_DATACLASS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Samples are stamped with time.monotonic_ns(), which is cheap and immune to
+# clock steps; exported timestamps are converted back to Unix time using the
+# offset between the two clocks, taken once
+_UNIX_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+# Machine facts that cannot change while the process runs, probed once
+_platform = lru_cache(maxsize=None)(platform.platform)
+_python_version = lru_cache(maxsize=None)(platform.python_version)
+
+
+# Working directory for the loader and baseline processes, whose paths are
+# relative to this script
+_SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# "name: value" result lines printed by the baseline app, and the result
+# field and type each one fills
+_BASELINE_LINE_RE = re.compile(rb'(packets_received|packets_processed|processing_time):[ \t]*([^\s:]+)')
+_BASELINE_FIELDS = {
+    b'packets_received': ('packets_received', int),
+    b'packets_processed': ('packets_processed', int),
+    b'processing_time': ('processing_time_ms', float),
+}
+
+
+class _ProcessLog:
+    """Append-only log file that a child process writes stdout and stderr to.
+
+    Output goes straight to the file, so a chatty child never blocks on a
+    full pipe and nothing is decoded unless it is read back.
+    """
+    
+    # Most of a run's output read() returns, from the end
+    TAIL_BYTES = 65536
+    
+    def __init__(self, name: str) -> None:
+        self.path = os.path.join(_SCRIPT_DIR, name)
+        self.start = 0
+    
+    def open_for_child(self) -> int:
+        """Open the log for the next child; the caller closes the fd after spawning."""
+        fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND | os.O_CLOEXEC, 0o644)
+        self.start = os.lseek(fd, 0, os.SEEK_END)
+        return fd
+    
+    def read_bytes(self) -> bytes:
+        """Return the tail of what the latest child wrote."""
+        fd = os.open(self.path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            end = os.fstat(fd).st_size
+            offset = max(self.start, end - self.TAIL_BYTES)
+            return os.pread(fd, end - offset, offset)
+        finally:
+            os.close(fd)
+    
+    def read(self) -> str:
+        """Return the tail of what the latest child wrote, decoded."""
+        return self.read_bytes().decode('utf-8', 'replace')
+
+
+# Environment variable naming the pipe a child writes _READY_LINE to once it
+# is up, and how long to wait for that before falling back to a liveness check
+_READY_FD_ENV = 'READY_FD'
+_READY_LINE = b'READY\n'
+_READY_TIMEOUT = 5.0
+
+
+def _spawn_logged(cmd: Tuple[str, ...], log: _ProcessLog) -> Tuple[subprocess.Popen, int]:
+    """Start cmd with its output in log; returns it and its readiness pipe."""
+    ready_fd, child_fd = os.pipe()
+    log_fd = log.open_for_child()
+    try:
+        process = subprocess.Popen(
+            cmd,
+            stdout=log_fd,
+            stderr=subprocess.STDOUT,
+            cwd=_SCRIPT_DIR,
+            pass_fds=(child_fd,),
+            env={**os.environ, _READY_FD_ENV: str(child_fd)}
+        )
+    except BaseException:
+        os.close(ready_fd)
+        raise
+    finally:
+        os.close(log_fd)
+        os.close(child_fd)
+    return process, ready_fd
+
+
+def _wait_ready(process: subprocess.Popen, ready_fd: int, timeout: float = _READY_TIMEOUT) -> bool:
+    """Wait for process to report ready on ready_fd, which is closed after.
+
+    Returns False on timeout, or once the pipe closes without the ready
+    line; a child that exited is then reaped, so poll() sees it.
+    """
+    deadline = time.monotonic() + timeout
+    received = b''
+    try:
+        with selectors.DefaultSelector() as selector:
+            selector.register(ready_fd, selectors.EVENT_READ)
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    return False
+                chunk = os.read(ready_fd, 64)
+                if not chunk:
+                    break
+                received += chunk
+                if _READY_LINE in received:
+                    return True
+    finally:
+        os.close(ready_fd)
+    
+    # The child holds the only write end, so EOF means it is exiting
+    try:
+        process.wait(timeout=max(0.0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        pass
+    return False
+
+
+def _unix_time(monotonic_ns: int) -> float:
+    """Convert a monotonic_ns sample stamp to Unix seconds (0 stays 0)."""
+    return (monotonic_ns + _UNIX_OFFSET_NS) / 1e9 if monotonic_ns else 0.0
+
+
+@dataclass(**_SAMPLE_DATACLASS)
 class XDPStats:
     """Statistics from XDP program."""
     packets_seen: int = 0
@@ -92,11 +237,20 @@ class XDPStats:
     avg_latency_ns: float = 0.0
     min_latency_ns: float = 0.0
     max_latency_ns: float = 0.0
-    timestamp: float = 0.0
+    timestamp: int = 0  # time.monotonic_ns()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return {
+            'packets_seen': self.packets_seen,
+            'packets_processed': self.packets_processed,
+            'packets_dropped': self.packets_dropped,
+            'features_extracted': self.features_extracted,
+            'avg_latency_ns': self.avg_latency_ns,
+            'min_latency_ns': self.min_latency_ns,
+            'max_latency_ns': self.max_latency_ns,
+            'timestamp': _unix_time(self.timestamp)
+        }
     
     @property
     def drop_rate_percent(self) -> float:
@@ -113,10 +267,11 @@ class XDPStats:
         return (self.packets_processed / self.packets_seen) * 100
 
 
-@dataclass
+@dataclass(**_SAMPLE_DATACLASS)
 class SystemMetrics:
     """System performance metrics."""
     cpu_usage_percent: float = 0.0
+    # Left unset on history samples, which only keep the aggregate
     cpu_usage_per_core: Optional[List[float]] = None
     memory_usage_percent: float = 0.0
     memory_usage_mb: float = 0.0
@@ -126,63 +281,101 @@ class SystemMetrics:
     network_tx_bytes: int = 0
     network_rx_errors: int = 0
     network_tx_errors: int = 0
-    timestamp: float = 0.0
-    
-    def __post_init__(self):
-        if self.cpu_usage_per_core is None:
-            self.cpu_usage_per_core = []
+    timestamp: int = 0  # time.monotonic_ns()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return asdict(self)
+        return {
+            'cpu_usage_percent': self.cpu_usage_percent,
+            'cpu_usage_per_core': list(self.cpu_usage_per_core or ()),
+            'memory_usage_percent': self.memory_usage_percent,
+            'memory_usage_mb': self.memory_usage_mb,
+            'network_rx_packets': self.network_rx_packets,
+            'network_tx_packets': self.network_tx_packets,
+            'network_rx_bytes': self.network_rx_bytes,
+            'network_tx_bytes': self.network_tx_bytes,
+            'network_rx_errors': self.network_rx_errors,
+            'network_tx_errors': self.network_tx_errors,
+            'timestamp': _unix_time(self.timestamp)
+        }
+
+
+def _reduce(values: Iterable[float]) -> Tuple[int, float, float, float, float]:
+    """Return (count, mean, min, max, sample stddev) of values in one pass.
+
+    Uses Welford's online update, so no intermediate list is built. All
+    figures are 0 for no values; stddev is 0 for fewer than two.
+    """
+    n = 0
+    mean = m2 = 0.0
+    low = high = 0.0
+    for value in values:
+        n += 1
+        if n == 1:
+            low = high = value
+        elif value < low:
+            low = value
+        elif value > high:
+            high = value
+        delta = value - mean
+        mean += delta / n
+        m2 += delta * (value - mean)
+    stddev = (m2 / (n - 1)) ** 0.5 if n > 1 else 0.0
+    return n, mean, low, high, stddev
+
+
+def _valid_interface_name(interface: str) -> bool:
+    """Reject names that would step outside /sys/class/net."""
+    return bool(interface) and '/' not in interface and interface not in ('.', '..')
 
 
 class SystemResourceChecker:
-    """Utility class for checking system resources and capabilities."""
+    """Utility class for checking system resources and capabilities.
+
+    XDP support and interface presence do not change during a run, so those
+    probes are answered once per process. A long-lived process that sees
+    NICs added or removed must call invalidate() to probe them again.
+    """
+    
+    @staticmethod
+    def invalidate() -> None:
+        """Forget cached probe results; the next checks probe afresh."""
+        SystemResourceChecker.check_xdp_support.cache_clear()
+        SystemResourceChecker.check_interface_exists.cache_clear()
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def check_xdp_support() -> bool:
         """Check if system supports XDP."""
         try:
-            # Check if ip command supports XDP
+            # Check if ip command supports XDP; the usage text goes to
+            # stderr and is searched as bytes, without decoding
             result = subprocess.run(
                 ['ip', 'link', 'help'], 
-                capture_output=True, 
-                text=True, 
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 timeout=5
             )
-            return 'xdp' in result.stderr.lower()
+            return b'xdp' in result.stderr.lower()
         except (subprocess.SubprocessError, FileNotFoundError):
             return False
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def check_interface_exists(interface: str) -> bool:
         """Check if network interface exists."""
-        try:
-            result = subprocess.run(
-                ['ip', 'link', 'show', interface], 
-                capture_output=True, 
-                text=True, 
-                check=True,
-                timeout=5
-            )
-            return True
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-            return False
+        return _valid_interface_name(interface) and os.path.isdir(f'/sys/class/net/{interface}')
     
     @staticmethod
     def check_interface_up(interface: str) -> bool:
         """Check if network interface is up."""
+        if not _valid_interface_name(interface):
+            return False
         try:
-            result = subprocess.run(
-                ['ip', 'link', 'show', interface], 
-                capture_output=True, 
-                text=True, 
-                check=True,
-                timeout=5
-            )
-            return 'UP' in result.stdout
-        except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+            # Administrative IFF_UP flag, as reported by `ip link`
+            with open(f'/sys/class/net/{interface}/flags') as f:
+                return bool(int(f.read(), 16) & 0x1)
+        except (OSError, ValueError):
             return False
     
     @staticmethod
@@ -205,18 +398,39 @@ class SystemResourceChecker:
 
 
 class SystemMonitor:
-    """Enhanced system performance monitoring."""
+    """Enhanced system performance monitoring.
+
+    Sampling is driven by a MonitorSupervisor. Monitors of several
+    interfaces can share one to be sampled from a single thread; without
+    one, each monitor gets a private supervisor.
+    """
     
-    def __init__(self, interface: str, sample_rate: float = 1.0) -> None:
+    def __init__(
+        self,
+        interface: str,
+        sample_rate: float = 1.0,
+        housekeeping_cpu: Optional[int] = None,
+        supervisor: Optional['MonitorSupervisor'] = None
+    ) -> None:
         self.interface = interface
         self.sample_rate = sample_rate
         self.logger = logging.getLogger(f"{__name__}.SystemMonitor")
+        # housekeeping_cpu only applies to a private supervisor
+        self.supervisor = supervisor or MonitorSupervisor(housekeeping_cpu)
         
         self.running = False
-        self.stop_event = threading.Event()
-        self.metrics_lock = threading.Lock()
-        self.metrics_history: List[SystemMetrics] = []
-        self.monitor_thread: Optional[threading.Thread] = None
+        # Recent history, bounded to the last 1000 samples. Only the sampling
+        # thread appends; readers summarize a copy, so no lock is needed
+        self.metrics_history: Deque[SystemMetrics] = deque(maxlen=1000)
+        # Times sampling fell a whole interval behind schedule
+        self.sample_overruns = 0
+        # Per-core CPU usage of the latest sample; history keeps only the mean
+        self.cpu_usage_per_core: List[float] = []
+        
+        # /proc/net/dev stays open between samples; opened on first use and
+        # only read by the thread that constructs or samples this monitor
+        self._net_dev_fd: Optional[int] = None
+        self._iface_prefix = (interface + ':').encode()
         
         # Initial network counters
         self.initial_net_stats = self._get_network_stats()
@@ -225,42 +439,83 @@ class SystemMonitor:
         if not SystemResourceChecker.check_interface_exists(interface):
             raise SystemMonitorError(f"Network interface '{interface}' does not exist")
     
-    def _get_network_stats(self) -> Dict[str, int]:
-        """Get network interface statistics."""
+    def _get_network_stats(self, net_dev: Optional[bytes] = None) -> Dict[str, int]:
+        """Get network interface statistics.
+
+        net_dev is a /proc/net/dev snapshot shared by several monitors; the
+        file is read afresh when it is not given.
+        """
         try:
-            net_stats = psutil.net_io_counters(pernic=True)
-            if self.interface in net_stats:
-                stats = net_stats[self.interface]
+            fields = self._read_net_dev_fields(net_dev)
+            if fields is not None:
+                # Receive: bytes packets errs ..., transmit starts at field 8
                 return {
-                    'rx_packets': stats.packets_recv,
-                    'tx_packets': stats.packets_sent,
-                    'rx_bytes': stats.bytes_recv,
-                    'tx_bytes': stats.bytes_sent,
-                    'rx_errors': stats.errin,
-                    'tx_errors': stats.errout
+                    'rx_packets': int(fields[1]),
+                    'tx_packets': int(fields[9]),
+                    'rx_bytes': int(fields[0]),
+                    'tx_bytes': int(fields[8]),
+                    'rx_errors': int(fields[2]),
+                    'tx_errors': int(fields[10])
                 }
-        except Exception as e:
-            self.logger.error(f"Error getting network stats: {e}")
+        except (OSError, ValueError, IndexError) as e:
+            # Lazy %-formatting: a vanishing interface errors on every sample
+            self.logger.error("Error getting network stats: %s", e)
         
         return {
             'rx_packets': 0, 'tx_packets': 0, 'rx_bytes': 0, 
             'tx_bytes': 0, 'rx_errors': 0, 'tx_errors': 0
         }
     
-    def _collect_metrics(self) -> SystemMetrics:
-        """Collect current system metrics."""
+    def _read_net_dev_fields(self, net_dev: Optional[bytes] = None) -> Optional[List[bytes]]:
+        """Return the counter fields of this interface's /proc/net/dev line.
+
+        Without a snapshot, one pread() of the already open file; pread keeps
+        no file position, so the file never needs rewinding.
+        """
+        if net_dev is None:
+            if self._net_dev_fd is None:
+                self._net_dev_fd = os.open('/proc/net/dev', os.O_RDONLY)
+            net_dev = os.pread(self._net_dev_fd, 65536, 0)
+        
+        prefix = self._iface_prefix
+        start = net_dev.find(prefix)
+        # Names are right-aligned; skip matches inside a longer name (veth0 vs eth0)
+        while start > 0 and net_dev[start - 1] not in b' \n':
+            start = net_dev.find(prefix, start + 1)
+        if start < 0:
+            return None
+        
+        start += len(prefix)
+        end = net_dev.find(b'\n', start)
+        return net_dev[start:end if end >= 0 else len(net_dev)].split()
+    
+    def cleanup(self) -> None:
+        """Release the /proc/net/dev descriptor; the next sample reopens it."""
+        fd, self._net_dev_fd = self._net_dev_fd, None
+        if fd is not None:
+            os.close(fd)
+    
+    def _collect_metrics(
+        self,
+        net_dev: Optional[bytes] = None,
+        host: Optional[Tuple[List[float], Any]] = None
+    ) -> SystemMetrics:
+        """Collect current system metrics.
+
+        host is a (per-core CPU percentages, virtual memory) pair read once
+        per tick by the supervisor; it is read here when not given.
+        """
         try:
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=None)
-            cpu_per_core = psutil.cpu_percent(percpu=True, interval=None)
+            cpu_per_core, memory = host if host is not None else _read_host_metrics()
+            # CPU metrics: the aggregate is the mean of the per-core figures
+            cpu_percent = round(sum(cpu_per_core) / len(cpu_per_core), 1) if cpu_per_core else 0.0
             
             # Memory metrics
-            memory = psutil.virtual_memory()
             memory_percent = memory.percent
             memory_mb = memory.used / (1024 * 1024)
             
             # Network metrics
-            current_net_stats = self._get_network_stats()
+            current_net_stats = self._get_network_stats(net_dev)
             initial_stats = self.initial_net_stats
             
             metrics = SystemMetrics(
@@ -274,14 +529,31 @@ class SystemMonitor:
                 network_tx_bytes=current_net_stats['tx_bytes'] - initial_stats['tx_bytes'],
                 network_rx_errors=current_net_stats['rx_errors'] - initial_stats['rx_errors'],
                 network_tx_errors=current_net_stats['tx_errors'] - initial_stats['tx_errors'],
-                timestamp=time.time()
+                timestamp=time.monotonic_ns()
             )
             
             return metrics
             
-        except Exception as e:
-            self.logger.error(f"Error collecting metrics: {e}")
-            return SystemMetrics(timestamp=time.time())
+        except (psutil.Error, OSError) as e:
+            self.logger.error("Error collecting metrics: %s", e)
+            return SystemMetrics(timestamp=time.monotonic_ns())
+    
+    def sample_once(
+        self,
+        net_dev: Optional[bytes] = None,
+        host: Optional[Tuple[List[float], Any]] = None
+    ) -> SystemMetrics:
+        """Take one sample into the history and return it.
+
+        The per-core CPU figures replace cpu_usage_per_core instead of being
+        stored with every sample.
+        """
+        metrics = self._collect_metrics(net_dev, host)
+        # Shared with other monitors of the tick, never modified
+        self.cpu_usage_per_core = metrics.cpu_usage_per_core or []
+        metrics.cpu_usage_per_core = None
+        self.metrics_history.append(metrics)
+        return metrics
     
     def start(self) -> None:
         """Start monitoring."""
@@ -291,32 +563,7 @@ class SystemMonitor:
         
         self.logger.info("Starting system monitoring")
         self.running = True
-        self.stop_event.clear()
-        
-        def monitor_loop() -> None:
-            while not self.stop_event.wait(self.sample_rate):
-                if not self.running:
-                    break
-                
-                try:
-                    metrics = self._collect_metrics()
-                    
-                    with self.metrics_lock:
-                        self.metrics_history.append(metrics)
-                        
-                        # Keep only recent history (last 1000 samples)
-                        if len(self.metrics_history) > 1000:
-                            self.metrics_history = self.metrics_history[-1000:]
-                            
-                except Exception as e:
-                    self.logger.error(f"Error in monitoring loop: {e}")
-        
-        self.monitor_thread = threading.Thread(
-            target=monitor_loop, 
-            daemon=True,
-            name=f"SystemMonitor-{self.interface}"
-        )
-        self.monitor_thread.start()
+        self.supervisor.add(self)
     
     def stop(self) -> None:
         """Stop monitoring."""
@@ -325,50 +572,315 @@ class SystemMonitor:
         
         self.logger.info("Stopping system monitoring")
         self.running = False
-        self.stop_event.set()
+        # Returns once no sample of this monitor is in progress
+        self.supervisor.remove(self)
         
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join(timeout=5.0)
-            if self.monitor_thread.is_alive():
-                self.logger.warning("Monitor thread did not stop within timeout")
+        self.cleanup()
     
     def get_current_metrics(self) -> SystemMetrics:
-        """Get current metrics."""
-        return self._collect_metrics()
+        """Get current metrics.
+
+        Called from request threads, so it reads its own /proc/net/dev
+        snapshot: cleanup() may close the sampling descriptor meanwhile.
+        """
+        try:
+            with open('/proc/net/dev', 'rb') as f:
+                net_dev = f.read()
+        except OSError as e:
+            self.logger.error("Error getting network stats: %s", e)
+            net_dev = b''
+        return self._collect_metrics(net_dev)
     
     def get_metrics_summary(self) -> Dict[str, Any]:
         """Get summary of collected metrics."""
-        with self.metrics_lock:
-            if not self.metrics_history:
-                return {}
-            
-            # Calculate statistics
-            cpu_values = [m.cpu_usage_percent for m in self.metrics_history]
-            memory_values = [m.memory_usage_percent for m in self.metrics_history]
-            
-            latest = self.metrics_history[-1]
-            
-            return {
-                'latest': latest.to_dict(),
-                'cpu_stats': {
-                    'average': statistics.mean(cpu_values) if cpu_values else 0,
-                    'max': max(cpu_values) if cpu_values else 0,
-                    'min': min(cpu_values) if cpu_values else 0,
-                    'stddev': statistics.stdev(cpu_values) if len(cpu_values) > 1 else 0
-                },
-                'memory_stats': {
-                    'average': statistics.mean(memory_values) if memory_values else 0,
-                    'max': max(memory_values) if memory_values else 0,
-                    'min': min(memory_values) if memory_values else 0
-                },
-                'sample_count': len(self.metrics_history),
-                'duration': (latest.timestamp - self.metrics_history[0].timestamp) if len(self.metrics_history) > 1 else 0
-            }
+        # list() of a deque is a single C-level copy, atomic under the GIL
+        history = list(self.metrics_history)
+        if not history:
+            return {}
+        
+        # Calculate statistics
+        _, cpu_mean, cpu_min, cpu_max, cpu_stddev = _reduce(
+            m.cpu_usage_percent for m in history)
+        _, memory_mean, memory_min, memory_max, _ = _reduce(
+            m.memory_usage_percent for m in history)
+        
+        latest = history[-1]
+        latest_dict = latest.to_dict()
+        latest_dict['cpu_usage_per_core'] = list(self.cpu_usage_per_core)
+        
+        return {
+            'latest': latest_dict,
+            'cpu_stats': {
+                'average': cpu_mean,
+                'max': cpu_max,
+                'min': cpu_min,
+                'stddev': cpu_stddev
+            },
+            'memory_stats': {
+                'average': memory_mean,
+                'max': memory_max,
+                'min': memory_min
+            },
+            'sample_count': len(history),
+            'sample_overruns': self.sample_overruns,
+            'duration': (latest.timestamp - history[0].timestamp) / 1e9 if len(history) > 1 else 0
+        }
+
+
+def _read_host_metrics() -> Tuple[List[float], Any]:
+    """Read per-core CPU usage and virtual memory, shared by all interfaces."""
+    return psutil.cpu_percent(percpu=True, interval=None), psutil.virtual_memory()
+
+
+class MonitorSupervisor:
+    """Samples any number of SystemMonitors from one thread.
+
+    Each tick reads /proc/net/dev and the host CPU and memory figures once
+    and hands them to every monitor that is due, so monitoring more
+    interfaces adds no threads and no extra reads. The thread runs while at
+    least one monitor is registered.
+    """
+    
+    # Niceness the sampling thread runs at, below the packet path
+    MONITOR_NICE = 10
+    
+    def __init__(self, housekeeping_cpu: Optional[int] = None) -> None:
+        # CPU the sampling thread is confined to; None picks the last allowed one
+        self.housekeeping_cpu = housekeeping_cpu
+        self.logger = logging.getLogger(f"{__name__}.MonitorSupervisor")
+        
+        # Guards the schedule; held while sampling so remove() waits out a tick
+        self._cond = threading.Condition()
+        # Monitor -> monotonic time of its next sample
+        self._deadlines: Dict[SystemMonitor, float] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._net_dev_fd: Optional[int] = None
+    
+    def add(self, monitor: SystemMonitor) -> None:
+        """Start sampling monitor, first one interval from now."""
+        with self._cond:
+            self._deadlines[monitor] = time.monotonic() + monitor.sample_rate
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    daemon=True,
+                    name="MonitorSupervisor"
+                )
+                self._thread.start()
+            else:
+                self._cond.notify()
+    
+    def remove(self, monitor: SystemMonitor) -> None:
+        """Stop sampling monitor; the thread exits after the last one."""
+        with self._cond:
+            self._deadlines.pop(monitor, None)
+            thread = self._thread if not self._deadlines else None
+            self._cond.notify()
+        
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+            if thread.is_alive():
+                self.logger.warning("Monitor thread did not stop within timeout")
+    
+    def _run(self) -> None:
+        self._isolate_sampling_thread()
+        with self._cond:
+            try:
+                while self._deadlines:
+                    # Sample on a fixed schedule so collection time does not add drift
+                    timeout = min(self._deadlines.values()) - time.monotonic()
+                    if timeout > 0:
+                        self._cond.wait(timeout)
+                        continue
+                    self._tick()
+            finally:
+                # Released under the lock, so a concurrent add() starts afresh
+                if self._net_dev_fd is not None:
+                    os.close(self._net_dev_fd)
+                    self._net_dev_fd = None
+                self._thread = None
+    
+    def _tick(self) -> None:
+        """Sample every due monitor from one shared read."""
+        now = time.monotonic()
+        due = [m for m, deadline in self._deadlines.items() if deadline <= now]
+        try:
+            if self._net_dev_fd is None:
+                self._net_dev_fd = os.open('/proc/net/dev', os.O_RDONLY)
+            net_dev = os.pread(self._net_dev_fd, 65536, 0)
+            host = _read_host_metrics()
+        except (psutil.Error, OSError) as e:
+            self.logger.error("Error in monitoring loop: %s", e)
+            net_dev, host = None, None
+        
+        # Sampling errors are handled in _collect_metrics, which falls back
+        # to an empty sample
+        for monitor in due:
+            monitor.sample_once(net_dev, host)
+        
+        now = time.monotonic()
+        for monitor in due:
+            next_sample = self._deadlines[monitor] + monitor.sample_rate
+            if next_sample < now:
+                # A whole interval behind: realign instead of bursting
+                monitor.sample_overruns += 1
+                next_sample = now + monitor.sample_rate
+            self._deadlines[monitor] = next_sample
+    
+    def _isolate_sampling_thread(self) -> None:
+        """Confine the calling thread to the housekeeping CPU at low priority.
+
+        Keeps sampling off the cores serving XDP RX. On Linux both the
+        affinity and the niceness apply to the calling thread only.
+        """
+        cpu = self.housekeeping_cpu
+        try:
+            if cpu is None:
+                cpu = max(os.sched_getaffinity(0))
+            os.sched_setaffinity(0, {cpu})
+            os.nice(self.MONITOR_NICE)
+        except (AttributeError, OSError) as e:
+            self.logger.warning(f"Could not move monitor thread to CPU {cpu}: {e}")
+
+
+# bpf() syscall numbers by architecture (asm-generic and arch unistd tables)
+_NR_BPF = {
+    'x86_64': 321, 'aarch64': 280, 'riscv64': 280,
+    'ppc64le': 361, 's390x': 351, 'armv7l': 386,
+}.get(platform.machine())
+_libc = ctypes.CDLL(None, use_errno=True) if sys.platform.startswith('linux') else None
+
+# bpf() commands and flags, from linux/bpf.h
+_BPF_MAP_LOOKUP_ELEM = 1
+_BPF_OBJ_GET = 7
+_BPF_MAP_LOOKUP_BATCH = 24
+_BPF_F_RDONLY = 1 << 3
+_ENOTSUPP = 524  # kernel-internal "operation not supported"
+
+
+class _BPFObjGetAttr(ctypes.Structure):
+    _fields_ = [
+        ('pathname', ctypes.c_uint64),
+        ('bpf_fd', ctypes.c_uint32),
+        ('file_flags', ctypes.c_uint32),
+    ]
+
+
+class _BPFMapElemAttr(ctypes.Structure):
+    _fields_ = [
+        ('map_fd', ctypes.c_uint32),
+        ('key', ctypes.c_uint64),
+        ('value', ctypes.c_uint64),
+        ('flags', ctypes.c_uint64),
+    ]
+
+
+class _BPFMapBatchAttr(ctypes.Structure):
+    _fields_ = [
+        ('in_batch', ctypes.c_uint64),
+        ('out_batch', ctypes.c_uint64),
+        ('keys', ctypes.c_uint64),
+        ('values', ctypes.c_uint64),
+        ('count', ctypes.c_uint32),
+        ('map_fd', ctypes.c_uint32),
+        ('elem_flags', ctypes.c_uint64),
+        ('flags', ctypes.c_uint64),
+    ]
+
+
+def _bpf(cmd: int, attr: ctypes.Structure) -> int:
+    """Issue a bpf() syscall, raising OSError on failure."""
+    if _NR_BPF is None or _libc is None:
+        raise OSError(errno.ENOSYS, "bpf() syscall not available on this platform")
+    ret = _libc.syscall(ctypes.c_long(_NR_BPF), ctypes.c_long(cmd),
+                        ctypes.byref(attr), ctypes.c_uint(ctypes.sizeof(attr)))
+    if ret < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    return ret
+
+
+class BPFCounterMap:
+    """Read-only view of a pinned BPF array map of __u64 counters.
+
+    Talks to the bpf() syscall through ctypes, so neither libbpf nor bpftool
+    is needed. read() fetches every counter with one BPF_MAP_LOOKUP_BATCH
+    call into preallocated buffers; kernels without batch lookups (before
+    5.6) fall back to one lookup per key.
+    """
+    
+    def __init__(self, pin_path: str, entries: int) -> None:
+        self.pin_path = pin_path
+        self.entries = entries
+        
+        path = ctypes.create_string_buffer(os.fsencode(pin_path))
+        self.fd = _bpf(_BPF_OBJ_GET, _BPFObjGetAttr(
+            pathname=ctypes.addressof(path), file_flags=_BPF_F_RDONLY))
+        
+        self._keys = (ctypes.c_uint32 * entries)()
+        self._values = (ctypes.c_uint64 * entries)()
+        self._out_batch = ctypes.c_uint32()
+        self._batch_attr = _BPFMapBatchAttr(
+            out_batch=ctypes.addressof(self._out_batch),
+            keys=ctypes.addressof(self._keys),
+            values=ctypes.addressof(self._values),
+            map_fd=self.fd)
+        self._use_batch = True
+    
+    def read(self) -> List[int]:
+        """Return the counters indexed by key."""
+        if self._use_batch:
+            attr = self._batch_attr
+            attr.in_batch = 0
+            attr.count = self.entries
+            try:
+                _bpf(_BPF_MAP_LOOKUP_BATCH, attr)
+            except OSError as e:
+                if e.errno in (errno.EINVAL, errno.EOPNOTSUPP, _ENOTSUPP):
+                    self._use_batch = False
+                elif e.errno != errno.ENOENT:  # ENOENT: end of map reached
+                    raise
+            if self._use_batch:
+                counters = [0] * self.entries
+                for i in range(attr.count):
+                    counters[self._keys[i]] = self._values[i]
+                return counters
+        
+        key = ctypes.c_uint32()
+        value = ctypes.c_uint64()
+        attr = _BPFMapElemAttr(map_fd=self.fd, key=ctypes.addressof(key),
+                               value=ctypes.addressof(value))
+        counters = []
+        for index in range(self.entries):
+            key.value = index
+            _bpf(_BPF_MAP_LOOKUP_ELEM, attr)
+            counters.append(value.value)
+        return counters
+    
+    def close(self) -> None:
+        """Close the map descriptor."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
 
 
 class XDPManager:
     """Enhanced XDP program management."""
     
+    # Where the loader pins xdp_preproc's stats_map, and its slots (must
+    # match src/xdp_preproc.c)
+    STATS_MAP_PIN = '/sys/fs/bpf/xdp_preproc_stats'
+    STAT_PACKETS_TOTAL = 0
+    STAT_PACKETS_UDP = 1
+    STAT_PACKETS_DROPPED = 2
+    STAT_PROCESSING_TIME = 3
+    STAT_ENTRIES = 4
+    
+    # Per-packet processing time histogram kept by the program: bucket b
+    # counts packets that took [2^b, 2^(b+1)) ns
+    LATENCY_HIST_PIN = '/sys/fs/bpf/xdp_preproc_latency'
+    LATENCY_BUCKETS = 32
+    
     def __init__(self, config: Dict[str, Any]) -> None:
         self.config = config
         self.logger = logging.getLogger(f"{__name__}.XDPManager")
@@ -378,14 +890,34 @@ class XDPManager:
         self.xdp_program_path = xdp_config.get('program_path', '../../build/xdp_preproc.o')
         self.xdp_mode = xdp_config.get('mode', 'native')
         self.interface = config['network_config']['dst_machine']['interface']
+        self.loader_path = "../../build/xdp_loader"
+        
+        # The loader command is fixed by the configuration; build it once
+        self._loader_cmd: Tuple[str, ...] = (
+            self.loader_path,
+            self.interface,
+            self.xdp_program_path,
+            "--mode", self.xdp_mode
+        )
         
         # Process management
         self.loader_process: Optional[subprocess.Popen] = None
+        self._loader_log = _ProcessLog('xdp_loader.log')
         self.program_loaded = False
+        # Opened on the first statistics read after the loader pinned them.
+        # Request threads read them concurrently and the maps reuse one set
+        # of buffers, so opening, reading and closing hold the lock
+        self._maps_lock = threading.Lock()
+        self._stats_map: Optional[BPFCounterMap] = None
+        self._latency_hist: Optional[BPFCounterMap] = None
+        self._latency_hist_missing = False
         
-        # Statistics
-        self.stats_lock = threading.Lock()
-        self.stats_history: List[XDPStats] = []
+        # Statistics. The counters are cumulative, so only the latest sample
+        # is kept whole; the one per-sample column summarized (average
+        # latency) is kept flat for the last 1000 samples. deque appends are
+        # atomic and readers summarize a copy, so no lock is needed
+        self.latest_stats: Optional[XDPStats] = None
+        self._latency_history: Deque[float] = deque(maxlen=1000)
         
         # Validate setup
         self._validate_setup()
@@ -399,9 +931,8 @@ class XDPManager:
             validation_errors.append(f"XDP program not found: {self.xdp_program_path}")
         
         # Check loader executable
-        loader_path = "../../build/xdp_loader"
-        if not SystemResourceChecker.check_executable_exists(loader_path):
-            validation_errors.append(f"XDP loader not found: {loader_path}")
+        if not SystemResourceChecker.check_executable_exists(self.loader_path):
+            validation_errors.append(f"XDP loader not found: {self.loader_path}")
         
         # Check interface
         if not SystemResourceChecker.check_interface_exists(self.interface):
@@ -428,32 +959,19 @@ class XDPManager:
         try:
             self.logger.info(f"Loading XDP program on interface {self.interface}")
             
-            # Build loader command
-            loader_cmd = [
-                "../../build/xdp_loader",
-                self.interface,
-                self.xdp_program_path,
-                "--mode", self.xdp_mode
-            ]
+            self.logger.debug(f"Loader command: {' '.join(self._loader_cmd)}")
             
-            self.logger.debug(f"Loader command: {' '.join(loader_cmd)}")
+            # Start loader process; it prints stats every second for as
+            # long as it runs, so its output goes to a log, not a pipe
+            self.loader_process, ready_fd = _spawn_logged(self._loader_cmd, self._loader_log)
             
-            # Start loader process
-            self.loader_process = subprocess.Popen(
-                loader_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=os.path.dirname(os.path.abspath(__file__))
-            )
-            
-            # Give it a moment to initialize
-            time.sleep(2)
+            # Wait until the program is attached and its maps pinned
+            if not _wait_ready(self.loader_process, ready_fd):
+                self.logger.debug("XDP loader did not report ready")
             
             # Check if process is still running
             if self.loader_process.poll() is not None:
-                stdout, stderr = self.loader_process.communicate()
-                error_msg = f"XDP loader failed: {stderr or stdout}"
+                error_msg = f"XDP loader failed: {self._loader_log.read()}"
                 self.logger.error(error_msg)
                 raise XDPError(error_msg)
             
@@ -488,7 +1006,17 @@ class XDPManager:
                     self.loader_process.wait()
                     self.logger.info("XDP loader forcefully terminated")
             
-            self.program_loaded = False
+            with self._maps_lock:
+                # Under the lock, so no reader reopens the maps afterwards
+                self.program_loaded = False
+                if self._stats_map is not None:
+                    self._stats_map.close()
+                    self._stats_map = None
+                if self._latency_hist is not None:
+                    self._latency_hist.close()
+                    self._latency_hist = None
+                self._latency_hist_missing = False
+            
             self.loader_process = None
             self.logger.info("XDP program unloaded successfully")
             return True
@@ -504,30 +1032,31 @@ class XDPManager:
             return None
         
         try:
-            # In a real implementation, this would read from BPF maps
-            # For now, we simulate the statistics
-            # TODO: Implement actual BPF map reading
+            with self._maps_lock:
+                if not self.program_loaded:
+                    return None
+                if self._stats_map is None:
+                    self._stats_map = BPFCounterMap(self.STATS_MAP_PIN, self.STAT_ENTRIES)
+                counters = self._stats_map.read()
+                min_latency_ns, max_latency_ns = self._latency_bounds()
             
-            current_time = time.time()
-            
-            # Simulate realistic statistics based on time
-            base_packets = int(current_time * 1000) % 100000
+            # Every UDP packet is parsed into a feature
+            udp_packets = counters[self.STAT_PACKETS_UDP]
+            processing_ns = counters[self.STAT_PROCESSING_TIME]
             
             stats = XDPStats(
-                packets_seen=base_packets,
-                packets_processed=int(base_packets * 0.95),  # 95% processing rate
-                packets_dropped=int(base_packets * 0.05),    # 5% drop rate
-                features_extracted=int(base_packets * 0.90), # 90% feature extraction
-                avg_latency_ns=1500.0,
-                min_latency_ns=800.0,
-                max_latency_ns=3200.0,
-                timestamp=current_time
+                packets_seen=counters[self.STAT_PACKETS_TOTAL],
+                packets_processed=udp_packets,
+                packets_dropped=counters[self.STAT_PACKETS_DROPPED],
+                features_extracted=udp_packets,
+                avg_latency_ns=processing_ns / udp_packets if udp_packets else 0.0,
+                min_latency_ns=min_latency_ns,
+                max_latency_ns=max_latency_ns,
+                timestamp=time.monotonic_ns()
             )
             
-            with self.stats_lock:
-                self.stats_history.append(stats)
-                if len(self.stats_history) > 1000:
-                    self.stats_history = self.stats_history[-1000:]
+            self._latency_history.append(stats.avg_latency_ns)
+            self.latest_stats = stats
             
             return stats
             
@@ -535,37 +1064,69 @@ class XDPManager:
             self.logger.error(f"Error getting XDP statistics: {e}")
             return None
     
+    def _latency_bounds(self) -> Tuple[float, float]:
+        """Bound the fastest and slowest packet from the latency histogram.
+
+        Returns the lower edge of the lowest and the upper edge of the
+        highest occupied bucket, or zeros before any packet was timed or
+        when the program object has no histogram. Called with the maps
+        lock held.
+        """
+        if self._latency_hist is None:
+            if self._latency_hist_missing:
+                return 0.0, 0.0
+            try:
+                self._latency_hist = BPFCounterMap(self.LATENCY_HIST_PIN, self.LATENCY_BUCKETS)
+            except OSError as e:
+                self._latency_hist_missing = True
+                self.logger.warning(f"XDP latency histogram unavailable: {e}")
+                return 0.0, 0.0
+        
+        buckets = self._latency_hist.read()
+        occupied = [bucket for bucket, count in enumerate(buckets) if count]
+        if not occupied:
+            return 0.0, 0.0
+        low = float(1 << occupied[0]) if occupied[0] else 0.0
+        return low, float(1 << (occupied[-1] + 1))
+    
     def get_stats_summary(self) -> Dict[str, Any]:
         """Get summary of XDP statistics."""
-        with self.stats_lock:
-            if not self.stats_history:
-                return {}
-            
-            latest = self.stats_history[-1]
-            
-            # Calculate aggregated statistics
-            total_seen = sum(s.packets_seen for s in self.stats_history)
-            total_processed = sum(s.packets_processed for s in self.stats_history)
-            total_dropped = sum(s.packets_dropped for s in self.stats_history)
-            
-            avg_latencies = [s.avg_latency_ns for s in self.stats_history if s.avg_latency_ns > 0]
-            
-            return {
-                'latest': latest.to_dict(),
-                'aggregated': {
-                    'total_packets_seen': total_seen,
-                    'total_packets_processed': total_processed,
-                    'total_packets_dropped': total_dropped,
-                    'overall_drop_rate_percent': (total_dropped / total_seen * 100) if total_seen > 0 else 0,
-                    'overall_processing_rate_percent': (total_processed / total_seen * 100) if total_seen > 0 else 0
-                },
-                'latency_stats': {
-                    'average_ns': statistics.mean(avg_latencies) if avg_latencies else 0,
-                    'max_ns': max(avg_latencies) if avg_latencies else 0,
-                    'min_ns': min(avg_latencies) if avg_latencies else 0
-                },
-                'sample_count': len(self.stats_history)
-            }
+        latest = self.latest_stats
+        if latest is None:
+            return {}
+        
+        # The map counters are cumulative, so the latest sample holds the totals
+        total_seen = latest.packets_seen
+        total_processed = latest.packets_processed
+        total_dropped = latest.packets_dropped
+        
+        # Reduce the flat float column with C-level builtins; filter(None)
+        # drops samples taken before any packet was timed
+        sample_count = len(self._latency_history)
+        latencies = list(filter(None, self._latency_history))
+        if latencies:
+            latency_mean = sum(latencies) / len(latencies)
+            latency_min = min(latencies)
+            latency_max = max(latencies)
+        else:
+            latency_mean = latency_min = latency_max = 0
+        
+        return {
+            'latest': latest.to_dict(),
+            'aggregated': {
+                'total_packets_seen': total_seen,
+                'total_packets_processed': total_processed,
+                'total_packets_dropped': total_dropped,
+                'overall_drop_rate_percent': (total_dropped / total_seen * 100) if total_seen > 0 else 0,
+                'overall_processing_rate_percent': (total_processed / total_seen * 100) if total_seen > 0 else 0
+            },
+            'latency_stats': {
+                'average_ns': latency_mean,
+                'max_ns': latency_max,
+                'min_ns': latency_min
+            },
+            'sample_count': sample_count
+        }
     
     def is_running(self) -> bool:
         """Check if XDP program is running."""
@@ -584,12 +1145,19 @@ class BaselineManager:
         
         self.interface = config['network_config']['dst_machine']['interface']
         self.baseline_process: Optional[subprocess.Popen] = None
+        self._baseline_log = _ProcessLog('baseline_app.log')
         self.running = False
         
         # Validate baseline executable
         self.baseline_executable = "../../build/baseline_app"
         if not SystemResourceChecker.check_executable_exists(self.baseline_executable):
             raise BaselineTestError(f"Baseline executable not found: {self.baseline_executable}")
+        
+        self._baseline_cmd: Tuple[str, ...] = (
+            self.baseline_executable,
+            self.interface,
+            "--mode", "packet_capture"
+        )
     
     def start_baseline_test(self) -> bool:
         """Start baseline performance test."""
@@ -600,31 +1168,18 @@ class BaselineManager:
         try:
             self.logger.info("Starting baseline performance test")
             
-            # Build baseline command
-            baseline_cmd = [
-                self.baseline_executable,
-                self.interface,
-                "--mode", "packet_capture"
-            ]
-            
-            self.logger.debug(f"Baseline command: {' '.join(baseline_cmd)}")
+            self.logger.debug(f"Baseline command: {' '.join(self._baseline_cmd)}")
             
-            # Start baseline process
-            self.baseline_process = subprocess.Popen(
-                baseline_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=os.path.dirname(os.path.abspath(__file__))
-            )
+            # Start baseline process, logging its output for the results
+            self.baseline_process, ready_fd = _spawn_logged(self._baseline_cmd, self._baseline_log)
             
-            # Give it a moment to initialize
-            time.sleep(1)
+            # Wait until its capture socket is bound
+            if not _wait_ready(self.baseline_process, ready_fd):
+                self.logger.debug("Baseline app did not report ready")
             
             # Check if process is still running
             if self.baseline_process.poll() is not None:
-                stdout, stderr = self.baseline_process.communicate()
-                error_msg = f"Baseline test failed to start: {stderr or stdout}"
+                error_msg = f"Baseline test failed to start: {self._baseline_log.read()}"
                 self.logger.error(error_msg)
                 raise BaselineTestError(error_msg)
             
@@ -649,18 +1204,20 @@ class BaselineManager:
                 # Send SIGTERM to baseline process
                 self.baseline_process.terminate()
                 
-                # Wait for graceful shutdown and collect output
+                # Wait for graceful shutdown, then read its output
                 try:
-                    stdout, stderr = self.baseline_process.communicate(timeout=10)
-                    self.logger.debug(f"Baseline output: {stdout}")
+                    self.baseline_process.wait(timeout=10)
+                    output = self._baseline_log.read_bytes()
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Baseline output: {output.decode('utf-8', 'replace')}")
                     
                     # Parse results from output
-                    results = self._parse_baseline_output(stdout)
+                    results = self._parse_baseline_output(output)
                     
                 except subprocess.TimeoutExpired:
                     self.logger.warning("Baseline test did not terminate gracefully")
                     self.baseline_process.kill()
-                    stdout, stderr = self.baseline_process.communicate()
+                    self.baseline_process.wait()
                     results = {}
             else:
                 results = {}
@@ -675,12 +1232,9 @@ class BaselineManager:
             self.running = False
             return {}
     
-    def _parse_baseline_output(self, output: str) -> Dict[str, Any]:
+    def _parse_baseline_output(self, output: bytes) -> Dict[str, Any]:
         """Parse baseline test output to extract performance metrics."""
         try:
-            # This would parse the actual output from the baseline application
-            # For now, return simulated results
-            
             results = {
                 'packets_received': 0,
                 'packets_processed': 0,
@@ -690,19 +1244,13 @@ class BaselineManager:
                 'timestamp': time.time()
             }
             
-            # Parse actual output when baseline application provides structured output
-            lines = output.strip().split('\n')
-            for line in lines:
-                if 'packets_received:' in line:
-                    try:
-                        results['packets_received'] = int(line.split(':')[1].strip())
-                    except (ValueError, IndexError):
-                        pass
-                elif 'processing_time:' in line:
-                    try:
-                        results['processing_time_ms'] = float(line.split(':')[1].strip())
-                    except (ValueError, IndexError):
-                        pass
+            # One regex scan over the raw output; later lines win
+            for match in _BASELINE_LINE_RE.finditer(output):
+                field, convert = _BASELINE_FIELDS[match.group(1)]
+                try:
+                    results[field] = convert(match.group(2))
+                except ValueError:
+                    pass
             
             return results
             
@@ -711,10 +1259,33 @@ class BaselineManager:
             return {}
 
 
+@dataclass(frozen=True)
+class DstConfig:
+    """Settings dst_machine itself runs on, read once from the validated config."""
+    interface: str
+    control_port: int
+    housekeeping_cpu: Optional[int] = None
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'DstConfig':
+        """Create DstConfig from dictionary."""
+        try:
+            dst_machine = config['network_config']['dst_machine']
+            return cls(
+                interface=dst_machine['interface'],
+                control_port=dst_machine['control_port'],
+                housekeeping_cpu=(config.get('monitoring_config') or {}).get('housekeeping_cpu')
+            )
+        except KeyError as e:
+            raise ConfigurationError(f"Missing required configuration key: {e}")
+        except (TypeError, AttributeError) as e:
+            raise ConfigurationError(f"Invalid configuration value: {e}")
+
+
 class DstMachineCoordinator(CoordinationHandler):
     """Enhanced coordination handler for dst_machine functionality."""
     
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(self, config: Dict[str, Any], settings: Optional[DstConfig] = None) -> None:
         super().__init__()
         self.logger = logging.getLogger(f"{__name__}.DstMachineCoordinator")
         
@@ -727,14 +1298,22 @@ class DstMachineCoordinator(CoordinationHandler):
         self.test_active = False
         self.current_mode = "idle"  # idle, xdp, baseline
         
+        # The fixed part of the metrics' system_info, built once
+        self._system_info = {
+            'platform': _platform(),
+            'python_version': _python_version()
+        }
+        
         # Update initial status and config
         self.status = "ready"
-        self.config.update(config)
+        self.config = config
         
         try:
+            self.settings = settings or DstConfig.from_config(config)
+            
             # Initialize components
-            interface = config['network_config']['dst_machine']['interface']
-            self.system_monitor = SystemMonitor(interface)
+            self.system_monitor = SystemMonitor(
+                self.settings.interface, housekeeping_cpu=self.settings.housekeeping_cpu)
             self.xdp_manager = XDPManager(config)
             self.baseline_manager = BaselineManager(config)
             
@@ -818,6 +1397,9 @@ class DstMachineCoordinator(CoordinationHandler):
             
             # Stop the appropriate test
             if self.current_mode == 'xdp' and self.xdp_manager:
+                # One last read while the maps are pinned, so the summary
+                # holds the final totals
+                self.xdp_manager.get_statistics()
                 self.xdp_manager.unload_program()
                 results['xdp_stats'] = self.xdp_manager.get_stats_summary()
             elif self.current_mode == 'baseline' and self.baseline_manager:
@@ -836,7 +1418,7 @@ class DstMachineCoordinator(CoordinationHandler):
             self.status = "completed"
             
             # Store results
-            self.results.update(results)
+            self.update_results(results)
             
             return results
             
@@ -846,32 +1428,32 @@ class DstMachineCoordinator(CoordinationHandler):
             return {}
     
     def get_metrics(self) -> Dict[str, Any]:
-        """Get real-time metrics during test execution."""
-        base_metrics = super().get_metrics()
+        """Get real-time metrics during test execution.
+
+        Samples are returned as SystemMetrics/XDPStats records; the JSON
+        encoder converts them with their to_dict().
+        """
+        base_metrics = dict(super().get_metrics())
         
         if self.test_active:
             try:
-                # Add test-specific metrics
-                base_metrics.update({
-                    'test_active': self.test_active,
-                    'current_mode': self.current_mode,
-                    'system_info': {
-                        'platform': platform.platform(),
-                        'python_version': platform.python_version(),
-                        'thread_count': threading.active_count()
-                    }
-                })
+                # Add test-specific metrics; only the thread count varies
+                base_metrics['test_active'] = self.test_active
+                base_metrics['current_mode'] = self.current_mode
+                base_metrics['system_info'] = {
+                    **self._system_info,
+                    'thread_count': threading.active_count()
+                }
                 
                 # Add system metrics
                 if self.system_monitor:
-                    current_metrics = self.system_monitor.get_current_metrics()
-                    base_metrics['system_metrics'] = current_metrics.to_dict()
+                    base_metrics['system_metrics'] = self.system_monitor.get_current_metrics()
                 
                 # Add XDP metrics if running
                 if self.current_mode == 'xdp' and self.xdp_manager:
                     xdp_stats = self.xdp_manager.get_statistics()
                     if xdp_stats:
-                        base_metrics['xdp_stats'] = xdp_stats.to_dict()
+                        base_metrics['xdp_stats'] = xdp_stats
                 
             except Exception as e:
                 self.logger.error(f"Error getting metrics: {e}")
@@ -879,35 +1461,122 @@ class DstMachineCoordinator(CoordinationHandler):
         return base_metrics
 
 
+# Validated configurations by resolved path, with the (st_mtime_ns, st_size)
+# they were parsed at; least recently used first
+_YAML_CACHE: 'OrderedDict[str, Tuple[int, int, Dict[str, Any]]]' = OrderedDict()
+_YAML_CACHE_SIZE = 100
+
+# Validated configurations also persist next to the YAML as JSON, which
+# parses far faster. Entries are keyed on the YAML file and on the
+# validator module, so edited validation rules invalidate them
+_CONFIG_SIDECAR_SUFFIX = '.json.cache'
+_CONFIG_SIDECAR_VERSION = 2
+
+
+@lru_cache(maxsize=None)
+def _validator_stamp() -> Optional[Tuple[int, int]]:
+    """Return (st_mtime_ns, st_size) of the validator module, if any."""
+    if validate_config_data is None:
+        return None
+    try:
+        st = os.stat(sys.modules[validate_config_data.__module__].__file__)
+    except (OSError, KeyError, AttributeError, TypeError):
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_config_sidecar(config_file: Path, st: os.stat_result
+                         ) -> Optional[Tuple[Dict[str, Any], List[str]]]:
+    """Return the configuration and warnings cached next to config_file, if still current."""
+    validator = _validator_stamp()
+    try:
+        with open(str(config_file) + _CONFIG_SIDECAR_SUFFIX, 'rb') as f:
+            sidecar = json.load(f)
+        if (sidecar['version'], sidecar['mtime_ns'], sidecar['size'], sidecar['validator']) == (
+                _CONFIG_SIDECAR_VERSION, st.st_mtime_ns, st.st_size,
+                list(validator) if validator else None):
+            config = sidecar['data']
+            warnings = sidecar['warnings']
+            if isinstance(config, dict) and isinstance(warnings, list):
+                return config, [str(warning) for warning in warnings]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_config_sidecar(config_file: Path, st: os.stat_result, config: Dict[str, Any],
+                          warnings: List[str]) -> None:
+    """Cache a validated configuration and its warnings next to config_file; best effort."""
+    validator = _validator_stamp()
+    try:
+        body = json.dumps({
+            'version': _CONFIG_SIDECAR_VERSION,
+            'mtime_ns': st.st_mtime_ns,
+            'size': st.st_size,
+            'validator': list(validator) if validator else None,
+            'data': config,
+            'warnings': warnings
+        }, separators=(',', ':'))
+    except (TypeError, ValueError):
+        # YAML-only types (dates, sets) have no JSON form
+        return
+    # Non-string keys would come back as strings
+    if json.loads(body)['data'] != config:
+        return
+    
+    sidecar_path = str(config_file) + _CONFIG_SIDECAR_SUFFIX
+    tmp_path = f"{sidecar_path}.{os.getpid()}"
+    try:
+        with open(tmp_path, 'w') as f:
+            f.write(body)
+        os.replace(tmp_path, sidecar_path)
+    except OSError as e:
+        logging.getLogger(__name__).debug(f"Could not write config cache {sidecar_path}: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
 def load_config(config_path: str) -> Dict[str, Any]:
-    """Load configuration from YAML file with comprehensive validation."""
+    """Load configuration from YAML file with comprehensive validation.
+
+    Files are parsed and validated once per modification: while a file's
+    mtime and size are unchanged, callers get a deep copy of the cached
+    result. Across runs the result and its validation warnings are kept in
+    a JSON sidecar next to the file, so a warm start neither parses YAML
+    nor validates again, but still logs the warnings.
+    """
     try:
-        config_file = Path(config_path)
-        if not config_file.exists():
+        config_file = Path(config_path).resolve()
+        try:
+            st = os.stat(config_file)
+        except FileNotFoundError:
             raise ConfigurationError(f"Configuration file not found: {config_path}")
         
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        key = str(config_file)
+        cached = _YAML_CACHE.get(key)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            _YAML_CACHE.move_to_end(key)
+            return copy.deepcopy(cached[2])
         
-        if not isinstance(config, dict):
-            raise ConfigurationError("Configuration file must contain a dictionary")
+        sidecar = _read_config_sidecar(config_file, st)
+        if sidecar is not None:
+            config, warnings = sidecar
+        else:
+            config, warnings = _parse_config(config_file)
+            _write_config_sidecar(config_file, st, config, warnings)
         
-        # Perform comprehensive validation if validator is available
-        if validate_config_file is not None:
-            validation_result = validate_config_file(config_path)
-            
-            if not validation_result.is_valid:
-                error_msg = "Configuration validation failed:\n"
-                for error in validation_result.errors:
-                    error_msg += f"  • {error}\n"
-                raise ConfigurationError(error_msg.strip())
-            
-            # Log warnings if any
-            if validation_result.warnings:
-                logger = logging.getLogger(__name__)
-                logger.warning("Configuration warnings found:")
-                for warning in validation_result.warnings:
-                    logger.warning(f"  • {warning}")
+        # Log warnings if any, as one record
+        if warnings:
+            lines = ["Configuration warnings found:"]
+            lines.extend(f"  • {warning}" for warning in warnings)
+            logging.getLogger(__name__).warning("\n".join(lines))
+        
+        _YAML_CACHE[key] = (st.st_mtime_ns, st.st_size, copy.deepcopy(config))
+        _YAML_CACHE.move_to_end(key)
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            _YAML_CACHE.popitem(last=False)
         
         return config
         
@@ -917,6 +1586,33 @@ def load_config(config_path: str) -> Dict[str, Any]:
         raise ConfigurationError(f"Error reading configuration file: {e}")
 
 
+def _parse_config(config_file: Path) -> Tuple[Dict[str, Any], List[str]]:
+    """Parse and validate a YAML configuration file.
+
+    Returns the configuration and its validation warnings.
+    """
+    # One read of the whole file; the bytes go straight to libyaml
+    # without a Python-level decode
+    config = yaml.load(config_file.read_bytes(), Loader=_SafeLoader)
+    
+    if not isinstance(config, dict):
+        raise ConfigurationError("Configuration file must contain a dictionary")
+    
+    # Perform comprehensive validation if validator is available; it
+    # checks the document parsed above rather than reading the file again
+    if validate_config_data is not None:
+        validation_result = validate_config_data(config)
+        
+        if not validation_result.is_valid:
+            lines = ["Configuration validation failed:"]
+            lines.extend(f"  • {error}" for error in validation_result.errors)
+            raise ConfigurationError("\n".join(lines))
+        
+        return config, validation_result.warnings
+    
+    return config, []
+
+
 def setup_logging(config: Dict[str, Any]) -> None:
     """Setup logging configuration."""
     try:
@@ -932,8 +1628,10 @@ def setup_logging(config: Dict[str, Any]) -> None:
         root_logger = logging.getLogger()
         root_logger.setLevel(getattr(logging, log_level.upper()))
         
-        # Clear existing handlers
-        root_logger.handlers.clear()
+        # Clear existing handlers, flushing and closing them first
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+            handler.close()
         
         # Console handler
         console_handler = logging.StreamHandler()
@@ -943,7 +1641,8 @@ def setup_logging(config: Dict[str, Any]) -> None:
         # File handler (if enabled)
         if log_config.get('file_logging', {}).get('enabled', False):
             log_file = log_config['file_logging'].get('log_file', 'dst_machine.log')
-            file_handler = logging.FileHandler(log_file)
+            # Opened on the first record, so --check-only runs leave no file
+            file_handler = logging.FileHandler(log_file, delay=True, encoding='utf-8')
             file_handler.setFormatter(formatter)
             root_logger.addHandler(file_handler)
         
@@ -962,12 +1661,10 @@ def check_requirements() -> bool:
         logger.error("dst_machine requires Linux operating system")
         requirements_met = False
     
-    # Check for required commands
+    # Check for required commands; a PATH lookup, nothing is run
     required_commands = ['ip', 'ethtool']
     for cmd in required_commands:
-        try:
-            subprocess.run([cmd, '--help'], capture_output=True, timeout=5)
-        except (subprocess.SubprocessError, FileNotFoundError):
+        if shutil.which(cmd) is None:
             logger.error(f"Required command not found: {cmd}")
             requirements_met = False
     
@@ -975,37 +1672,44 @@ def check_requirements() -> bool:
     if not SystemResourceChecker.check_xdp_support():
         logger.warning("XDP support not detected - XDP tests may fail")
     
-    # Check Python packages
-    try:
-        import psutil
-        import yaml
-    except ImportError as e:
-        logger.error(f"Required Python package not found: {e}")
-        requirements_met = False
+    # Check Python packages; both are imported at module load, so this is
+    # normally a sys.modules lookup, and find_spec runs no module code
+    for name in ('psutil', 'yaml'):
+        if name not in sys.modules and importlib.util.find_spec(name) is None:
+            logger.error(f"Required Python package not found: {name}")
+            requirements_met = False
     
     return requirements_met
 
 
-def print_banner() -> None:
-    """Print application banner."""
-    banner = """
+_BANNER = """
 ╔══════════════════════════════════════════════════════════╗
 ║             eBPF-Test Destination Machine                ║
 ║          XDP Performance Testing Coordinator             ║
 ╚══════════════════════════════════════════════════════════╝
-    """
-    print(banner)
+    
+"""
 
 
-def main() -> int:
-    """Main entry point."""
+def print_banner() -> None:
+    """Print application banner."""
+    sys.stdout.write(_BANNER)
+
+
+@lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser, once per process."""
     parser = argparse.ArgumentParser(description='eBPF-Test Destination Machine XDP Testing Coordinator')
     parser.add_argument('--config', required=True, help='Configuration file path')
     parser.add_argument('--mode', choices=['xdp', 'baseline'], default='xdp', help='Testing mode')
     parser.add_argument('--check-only', action='store_true', help='Check requirements and configuration, then exit')
     parser.add_argument('--verbose', action='store_true', help='Enable verbose output')
-    
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> int:
+    """Main entry point."""
+    args = _build_parser().parse_args()
     
     try:
         print_banner()
@@ -1033,22 +1737,33 @@ def main() -> int:
             return 0
         
         # Create coordinator
-        coordinator = DstMachineCoordinator(config)
+        settings = DstConfig.from_config(config)
+        coordinator = DstMachineCoordinator(config, settings)
         
         # Start coordination server
         server = CoordinationServer(
             host='0.0.0.0',
-            port=config['network_config']['dst_machine']['control_port'],
+            port=settings.control_port,
             coordination_handler=coordinator
         )
         
+        # Shut down on SIGINT or SIGTERM; the handlers only set the event,
+        # which the main thread blocks on without waking up periodically
+        stop_event = threading.Event()
+        
+        def _request_stop(signum: int, frame) -> None:
+            stop_event.set()
+        
+        signal.signal(signal.SIGINT, _request_stop)
+        signal.signal(signal.SIGTERM, _request_stop)
+        
         try:
             server.start()
             logger.info("Destination machine ready for coordination")
             
             # Keep running until interrupted
-            while True:
-                time.sleep(1)
+            stop_event.wait()
+            logger.info("Received interrupt signal")
                 
         except KeyboardInterrupt:
             logger.info("Received interrupt signal")
@@ -35,6 +35,12 @@ from pathlib import Path
 import statistics
 import traceback
 
+# libyaml's C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
 # Import coordination module
 try:
     from coordination import (
@@ -54,11 +60,11 @@ except ImportError:
 
 # Import configuration validation
 try:
-    from config_validator import ConfigValidator, validate_config_file
+    from config_validator import ConfigValidator, validate_config_data
 except ImportError:
     print("Warning: config_validator.py not found, using basic validation")
     ConfigValidator = None
-    validate_config_file = None
+    validate_config_data = None
 
 
 # Custom Exception Classes
@@ -601,7 +607,7 @@ class SrcMachineCoordinator(CoordinationHandler):
         
         # Update initial status and config
         self.status = "ready"
-        self.config.update(config)
+        self.config = config
         
         self.logger.info("SrcMachineCoordinator initialized")
     
@@ -616,12 +622,13 @@ class SrcMachineCoordinator(CoordinationHandler):
             self.status = "running"
             
             # Merge test parameters with existing config
-            test_config = self.config.copy()
+            test_config = dict(self.config)
             if test_params:
-                # Deep merge for nested dictionaries
+                # Deep merge for nested dictionaries; merge into copies so
+                # the published config snapshot is left untouched
                 for key, value in test_params.items():
-                    if isinstance(value, dict) and key in test_config:
-                        test_config[key].update(value)
+                    if isinstance(value, dict) and isinstance(test_config.get(key), dict):
+                        test_config[key] = {**test_config[key], **value}
                     else:
                         test_config[key] = value
             
@@ -685,7 +692,7 @@ class SrcMachineCoordinator(CoordinationHandler):
             
             # Get final results
             final_results = self.traffic_generator.get_statistics()
-            self.results.update(final_results)
+            self.update_results(final_results)
             
             self.status = "stopped"
             self.test_active = False
@@ -699,7 +706,7 @@ class SrcMachineCoordinator(CoordinationHandler):
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get real-time metrics during test execution."""
-        base_metrics = super().get_metrics()
+        base_metrics = dict(super().get_metrics())
         
         if self.traffic_generator and self.test_active:
             try:
@@ -726,28 +733,28 @@ def load_config(config_path: str) -> Dict[str, Any]:
         if not config_file.exists():
             raise ConfigurationError(f"Configuration file not found: {config_path}")
         
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        # One read of the whole file; the bytes go straight to libyaml
+        # without a Python-level decode
+        config = yaml.load(config_file.read_bytes(), Loader=_SafeLoader)
         
         if not isinstance(config, dict):
             raise ConfigurationError("Configuration file must contain a dictionary")
         
-        # Perform comprehensive validation if validator is available
-        if validate_config_file is not None:
-            validation_result = validate_config_file(config_path)
+        # Perform comprehensive validation if validator is available; it
+        # checks the document parsed above rather than reading the file again
+        if validate_config_data is not None:
+            validation_result = validate_config_data(config)
             
             if not validation_result.is_valid:
-                error_msg = "Configuration validation failed:\n"
-                for error in validation_result.errors:
-                    error_msg += f"  • {error}\n"
-                raise ConfigurationError(error_msg.strip())
+                lines = ["Configuration validation failed:"]
+                lines.extend(f"  • {error}" for error in validation_result.errors)
+                raise ConfigurationError("\n".join(lines))
             
-            # Log warnings if any
+            # Log warnings if any, as one record
             if validation_result.warnings:
-                logger = logging.getLogger(__name__)
-                logger.warning("Configuration warnings found:")
-                for warning in validation_result.warnings:
-                    logger.warning(f"  • {warning}")
+                lines = ["Configuration warnings found:"]
+                lines.extend(f"  • {warning}" for warning in validation_result.warnings)
+                logging.getLogger(__name__).warning("\n".join(lines))
         
         return config
         
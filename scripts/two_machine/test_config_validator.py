@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Robustness checks for config_validator.
+
+Every string field of the shipped config.yaml is replaced with malformed
+values; validation must report problems as errors, never raise.
+
+Run with: python -m unittest test_config_validator (from this directory)
+"""
+
+import copy
+import os
+import unittest
+
+import yaml
+
+from config_validator import ConfigValidator, validate_config_data
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.yaml')
+
+# Strings that trip C-level parsers: NUL bytes, lone surrogates, oversized
+# or empty input, format specifiers
+GARBAGE_STRINGS = (
+    '', ' ', '\x00', '1.2.3.4\x00', '\ud800', '1.2.3.\ud800',
+    'x' * 5000, '999.1.1.1', '%s %d', '{}',
+)
+
+
+def _string_paths(node, prefix=()):
+    """Yield the key path of every string value in a loaded config."""
+    items = node.items() if isinstance(node, dict) else enumerate(node) if isinstance(node, list) else ()
+    for key, value in items:
+        if isinstance(value, str):
+            yield prefix + (key,)
+        else:
+            yield from _string_paths(value, prefix + (key,))
+
+
+def _with_value(config, path, value):
+    """Return a deep copy of config with the value at path replaced."""
+    mutated = copy.deepcopy(config)
+    node = mutated
+    for key in path[:-1]:
+        node = node[key]
+    node[path[-1]] = value
+    return mutated
+
+
+class GarbageStringFieldsTest(unittest.TestCase):
+    """Malformed strings come back as validation errors, not exceptions."""
+
+    @classmethod
+    def setUpClass(cls):
+        with open(CONFIG_PATH, 'rb') as f:
+            cls.config = yaml.safe_load(f)
+        cls.paths = list(_string_paths(cls.config))
+
+    def test_shipped_config_is_valid(self):
+        self.assertTrue(ConfigValidator().validate_config(self.config).is_valid)
+
+    def test_garbage_strings_never_raise(self):
+        validator = ConfigValidator()
+        for path in self.paths:
+            for value in GARBAGE_STRINGS:
+                with self.subTest(path=path, value=value[:20]):
+                    result = validator.validate_config(_with_value(self.config, path, value))
+                    # Formatting is deferred; force it as well
+                    list(result.iter_errors())
+                    list(result.warnings)
+
+    def test_garbage_ips_are_errors(self):
+        validator = ConfigValidator()
+        for machine in ('src_machine', 'dst_machine'):
+            path = ('network_config', machine, 'ip')
+            for value in GARBAGE_STRINGS:
+                with self.subTest(machine=machine, value=value[:20]):
+                    result = validator.validate_config(_with_value(self.config, path, value))
+                    self.assertFalse(result.is_valid)
+
+    def test_other_errors_survive_a_garbage_ip(self):
+        config = _with_value(self.config, ('network_config', 'dst_machine', 'ip'), '1.2.3.4\x00')
+        config['traffic_config']['packet_rate'] = -1
+        errors = list(validate_config_data(config).iter_errors())
+        self.assertGreater(len(errors), 1)
+        self.assertFalse(any(e.startswith('Validation error') for e in errors))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,6 +16,9 @@
 #define DEFAULT_INTERFACE "enp5s0"
 #define RING_BUFFER_TIMEOUT_MS 0  // Non-blocking polling for maximum throughput
 #define STATS_INTERVAL_SECONDS 1
+// Where stats_map is pinned for scripts/two_machine/dst_machine.py
+#define STATS_PIN_PATH "/sys/fs/bpf/xdp_preproc_stats"
+#define LATENCY_PIN_PATH "/sys/fs/bpf/xdp_preproc_latency"
 
 // Global variables for signal handling and cleanup
 static volatile int running = 1;
@@ -23,6 +26,8 @@ static struct bpf_object *obj = NULL;
 static int prog_fd = -1;
 static int ifindex = -1;
 static struct ring_buffer *rb = NULL;
+static int stats_pinned = 0;
+static int latency_pinned = 0;
 static perf_stats_t stats = {0};
 
 // Statistics indices (must match XDP program)
@@ -31,6 +36,21 @@ static perf_stats_t stats = {0};
 #define STAT_PACKETS_DROPPED   2
 #define STAT_PROCESSING_TIME   3
 
+// Tell the parent we are up: write READY to the pipe named by READY_FD
+// (set by scripts/two_machine/dst_machine.py), then close it
+static void signal_ready(void) {
+    const char *env = getenv("READY_FD");
+    if (!env)
+        return;
+
+    int fd = atoi(env);
+    if (fd <= STDERR_FILENO)
+        return;
+    if (write(fd, "READY\n", 6) < 0)
+        fprintf(stderr, "Warning: failed to signal readiness: %s\n", strerror(errno));
+    close(fd);
+}
+
 // Signal handler for graceful shutdown
 void signal_handler(int sig) {
     printf("\nReceived signal %d, shutting down...\n", sig);
@@ -184,6 +204,22 @@ int setup_ring_buffer(void) {
     return 0;
 }
 
+// Pin a map of the loaded object at path, replacing a stale pin left by an
+// unclean exit. Returns 1 if the map was pinned.
+int pin_map(struct bpf_map *map, const char *path) {
+    if (!map) {
+        return 0;
+    }
+    
+    unlink(path);
+    if (bpf_map__pin(map, path)) {
+        fprintf(stderr, "Warning: failed to pin %s at %s (is bpffs mounted?)\n",
+                bpf_map__name(map), path);
+        return 0;
+    }
+    return 1;
+}
+
 // Cleanup function
 void cleanup(void) {
     printf("Cleaning up...\n");
@@ -194,6 +230,16 @@ void cleanup(void) {
         printf("XDP program detached\n");
     }
     
+    // Remove the map pins
+    if (stats_pinned) {
+        unlink(STATS_PIN_PATH);
+        stats_pinned = 0;
+    }
+    if (latency_pinned) {
+        unlink(LATENCY_PIN_PATH);
+        latency_pinned = 0;
+    }
+    
     // Clean up ring buffer
     if (rb) {
         ring_buffer__free(rb);
@@ -249,7 +295,14 @@ int main(int argc, char *argv[]) {
     struct bpf_map *stats_map = bpf_object__find_map_by_name(obj, "stats_map");
     stats_map_fd = stats_map ? bpf_map__fd(stats_map) : -1;
     
+    // Pin the counters and latency histogram so the test coordinator can
+    // read them while we run
+    stats_pinned = pin_map(stats_map, STATS_PIN_PATH);
+    latency_pinned = pin_map(bpf_object__find_map_by_name(obj, "latency_hist"),
+                             LATENCY_PIN_PATH);
+    
     printf("XDP packet processing started. Press Ctrl+C to stop.\n");
+    signal_ready();
     
     // Main processing loop - NO RING BUFFER, just read XDP map stats like iperf3
     while (running) {
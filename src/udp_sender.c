@@ -0,0 +1,112 @@
+// Native send loop for scripts/legacy/high_rate_traffic.py
+//
+// Built as build/libudp_sender.so and called through ctypes, which releases
+// the GIL for the duration of each call. Pacing and sending happen entirely
+// in C so no Python bytecode runs per packet.
+
+#define _GNU_SOURCE
+#include <errno.h>
+#include <poll.h>
+#include <stdint.h>
+#include <string.h>
+#include <time.h>
+#include <sys/socket.h>
+#include <sys/uio.h>
+#include <netinet/in.h>
+
+#define SENDER_BATCH 64
+#define SPIN_THRESHOLD_NS 200000ULL
+#define SLEEP_MARGIN_NS 100000ULL
+#define BATCH_MAX_DELAY_NS 1000000ULL
+#define BACKPRESSURE_WAIT_MS 1
+
+static inline uint64_t now_ns(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return (uint64_t)ts.tv_sec * 1000000000ULL + ts.tv_nsec;
+}
+
+// Wait until the monotonic clock reaches deadline: nanosleep through long
+// gaps, busy-spin through the last stretch
+static void wait_until(uint64_t deadline) {
+    uint64_t now = now_ns();
+    if (now >= deadline)
+        return;
+
+    if (deadline - now > SPIN_THRESHOLD_NS) {
+        uint64_t sleep_ns = deadline - now - SLEEP_MARGIN_NS;
+        struct timespec ts = {
+            .tv_sec = sleep_ns / 1000000000ULL,
+            .tv_nsec = sleep_ns % 1000000000ULL,
+        };
+        nanosleep(&ts, NULL);
+    }
+
+    while (now_ns() < deadline)
+        ;
+}
+
+// Send up to count copies of buf round-robin over flows, paced delay_ns apart.
+//
+// *flow_index and *next_ns carry the round-robin position and the next
+// departure time across calls (*next_ns == 0 means "start now"). Sending
+// stops early once *running drops to zero. Packets that could not be sent
+// are added to *errors; on a full send buffer of a non-blocking socket the
+// loop also waits up to BACKPRESSURE_WAIT_MS for room. Returns the number
+// of packets sent.
+uint64_t udp_sender_run(int fd, const char *buf, size_t len,
+                        const struct sockaddr_in *flows, uint32_t n_flows,
+                        uint32_t *flow_index, uint64_t delay_ns,
+                        uint64_t *next_ns, uint64_t count,
+                        const volatile uint8_t *running, uint64_t *errors) {
+    struct mmsghdr msgs[SENDER_BATCH];
+    struct iovec iov = { .iov_base = (void *)buf, .iov_len = len };
+    uint32_t idx = *flow_index;
+    uint64_t next = *next_ns ? *next_ns : now_ns();
+    uint64_t sent = 0;
+    uint64_t attempted = 0;
+    // Slow rates send one packet per deadline to keep rate precision
+    uint32_t batch = delay_ns < BATCH_MAX_DELAY_NS ? SENDER_BATCH : 1;
+
+    memset(msgs, 0, sizeof(msgs));
+    for (uint32_t i = 0; i < SENDER_BATCH; i++) {
+        msgs[i].msg_hdr.msg_iov = &iov;
+        msgs[i].msg_hdr.msg_iovlen = 1;
+        msgs[i].msg_hdr.msg_namelen = sizeof(struct sockaddr_in);
+    }
+
+    while (attempted < count && *running) {
+        uint32_t n = count - attempted < batch ? (uint32_t)(count - attempted) : batch;
+        uint32_t done = 0;
+
+        wait_until(next);
+
+        for (uint32_t i = 0; i < n; i++) {
+            msgs[i].msg_hdr.msg_name = (void *)&flows[idx];
+            if (++idx == n_flows)
+                idx = 0;
+        }
+
+        // Resubmit the unsent tail after a partial return
+        while (done < n) {
+            int rc = sendmmsg(fd, msgs + done, n - done, 0);
+            if (rc < 0) {
+                *errors += n - done;
+                if (errno == EAGAIN || errno == EWOULDBLOCK) {
+                    struct pollfd pfd = { .fd = fd, .events = POLLOUT };
+                    poll(&pfd, 1, BACKPRESSURE_WAIT_MS);
+                }
+                break;
+            }
+            done += rc;
+        }
+
+        sent += done;
+        attempted += n;
+        next += delay_ns * n;
+    }
+
+    *flow_index = idx;
+    *next_ns = next;
+    return sent;
+}
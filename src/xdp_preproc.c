@@ -30,6 +30,18 @@ struct {
     __type(value, __u64);
 } stats_map SEC(".maps");
 
+// Log2 histogram of per-packet processing time: bucket b counts packets
+// that took [2^b, 2^(b+1)) ns (bucket 0 also holds 0 ns); the last bucket
+// collects everything above
+#define LATENCY_BUCKETS 32
+
+struct {
+    __uint(type, BPF_MAP_TYPE_ARRAY);
+    __uint(max_entries, LATENCY_BUCKETS);
+    __type(key, __u32);
+    __type(value, __u64);
+} latency_hist SEC(".maps");
+
 // Statistics indices
 #define STAT_PACKETS_TOTAL     0
 #define STAT_PACKETS_UDP       1
@@ -44,6 +56,26 @@ static __always_inline void update_stat(__u32 index, __u64 value) {
     }
 }
 
+// Count one packet in the latency histogram
+static __always_inline void record_latency(__u64 ns) {
+    __u32 bucket = 0;
+    
+    // floor(log2(ns)) without loops, for the verifier
+    if (ns >> 32) { ns >>= 32; bucket += 32; }
+    if (ns >> 16) { ns >>= 16; bucket += 16; }
+    if (ns >> 8)  { ns >>= 8;  bucket += 8; }
+    if (ns >> 4)  { ns >>= 4;  bucket += 4; }
+    if (ns >> 2)  { ns >>= 2;  bucket += 2; }
+    if (ns >> 1)  { bucket += 1; }
+    if (bucket >= LATENCY_BUCKETS)
+        bucket = LATENCY_BUCKETS - 1;
+    
+    __u64 *count = bpf_map_lookup_elem(&latency_hist, &bucket);
+    if (count) {
+        __sync_fetch_and_add(count, 1);
+    }
+}
+
 // Parse Ethernet header
 static __always_inline int parse_ethernet(void *data, void *data_end, void **next_header) {
     struct ethhdr *eth = data;
@@ -155,6 +187,7 @@ int xdp_packet_processor(struct xdp_md *ctx) {
     update_stat(STAT_PACKETS_UDP, 1);
     __u64 processing_time = bpf_ktime_get_ns() - start_time;
     update_stat(STAT_PROCESSING_TIME, processing_time);
+    record_latency(processing_time);
     
     return XDP_PASS; // Let packet continue through network stack
 }